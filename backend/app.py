@@ -1,13 +1,19 @@
 """TripMate AI - FastAPI Application Entry Point."""
 
+import asyncio
+import contextlib
 import logging
 from contextlib import asynccontextmanager
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from src.config import settings
+from src.tools.llm_client import LLMUnavailableError
+from src.tools.llm_usage import get_usage_tracker
+from src.utils.metrics import metrics
 
 # Configure logging
 logging.basicConfig(
@@ -24,9 +30,14 @@ async def lifespan(app: FastAPI):
     logger.info("Starting TripMate AI Backend...")
     logger.info(f"Environment: {settings.environment}")
     logger.info(f"Server: {settings.backend_host}:{settings.backend_port}")
+    usage_flusher = asyncio.create_task(get_usage_tracker().run_flusher())
     yield
     # Shutdown
     logger.info("Shutting down TripMate AI Backend...")
+    usage_flusher.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await usage_flusher
+    get_usage_tracker().flush()
 
 
 # Create FastAPI app
@@ -47,6 +58,19 @@ async def lifespan(app: FastAPI):
 )
 
 
+# ===========================
+# Error Handlers
+# ===========================
+@app.exception_handler(LLMUnavailableError)
+async def llm_unavailable_handler(request: Request, exc: LLMUnavailableError):
+    """LLM 사용 불가 (부하 차단/공급자 장애) 시 503 응답."""
+    return JSONResponse(
+        status_code=503,
+        content={"error": "LLM_UNAVAILABLE", "details": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
+
 # ===========================
 # Health Check
 # ===========================
@@ -60,12 +84,34 @@ async def health_check():
     }
 
 
+@app.get("/api/metrics")
+async def get_metrics():
+    """In-process metrics snapshot."""
+    return metrics.snapshot()
+
+
+@app.get("/api/usage")
+async def get_usage(session_id: str | None = None):
+    """LLM 토큰/비용 사용량 (session_id 지정 시 해당 세션)."""
+    tracker = get_usage_tracker()
+    if session_id:
+        scope = f"session:{session_id}"
+        return {
+            "session_id": session_id,
+            **tracker.totals(scope),
+            "window_cost_usd": tracker.window_cost(scope),
+            "limit_usd": settings.llm_session_cost_limit_usd,
+        }
+    return {**tracker.snapshot(), "limit_usd": settings.llm_global_cost_limit_usd}
+
+
 # ===========================
 # API Routes
 # ===========================
-from src.api import chat_router, plan_router, sessions_router
+from src.api import chat_router, destinations_router, plan_router, sessions_router
 
 app.include_router(chat_router, prefix="/api")
+app.include_router(destinations_router, prefix="/api")
 app.include_router(plan_router, prefix="/api")
 app.include_router(sessions_router, prefix="/api")
 
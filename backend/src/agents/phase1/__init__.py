@@ -4,9 +4,12 @@
 from src.agents.phase1.hotel_searcher import search_hotels, search_hotels_node
 from src.agents.phase1.info_collector import info_collector_node
 from src.agents.phase1.itinerary_planner import generate_itinerary, plan_itinerary_node
+from src.agents.phase1.prefetch import collect_info_with_prefetch, schedule_prefetch
 
 __all__ = [
     "info_collector_node",
+    "collect_info_with_prefetch",
+    "schedule_prefetch",
     "search_flights_node",
     "search_flights",
     "search_hotels_node",
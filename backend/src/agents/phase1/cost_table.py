@@ -0,0 +1,170 @@
+"""Precomputed trip cost table for Phase 1.
+
+목적지 × 기간 × 인원 × 등급별 예상 총비용을 체크인 날짜별로 미리 계산해 두고,
+"이 예산으로 어디를 갈 수 있나?" 질의에 즉시 응답합니다.
+숙박비는 숙박 검색과 같은 날짜별 요금 배수(src/utils/price_calendar.py)를 사용합니다.
+"""
+
+import logging
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+from src.agents.phase1.flight_searcher import get_flight_data
+from src.agents.phase1.hotel_searcher import (
+    EXTRA_PERSON_FEE,
+    get_check_in_date,
+    get_hotel_candidates,
+)
+from src.agents.phase1.poi_catalog import catalog_destinations
+from src.utils.price_calendar import rate_multipliers
+
+logger = logging.getLogger(__name__)
+
+# 현지 비용 추정 (원)
+FOOD_PER_DAY = 50000  # 1인 1일 식비
+TRANSPORT_PER_PERSON = 30000  # 1인 현지 교통비
+ACTIVITY_PER_DAY = 20000  # 1인 1일 관광비
+
+# 숙박 가격 변동 (-5% ~ +15%) 의 기대값
+HOTEL_PRICE_FACTOR = 1.05
+
+# 테이블 차원
+TIERS = ["budget", "standard", "premium"]
+MAX_DURATION = 14
+MAX_PEOPLE = 10
+
+
+def estimate_local_costs(duration: int, num_people: int) -> dict[str, int]:
+    """식비/교통비/관광비 예상 금액."""
+    days = duration + 1
+    return {
+        "food": FOOD_PER_DAY * days * num_people,
+        "transport": TRANSPORT_PER_PERSON * num_people,
+        "attractions": ACTIVITY_PER_DAY * days * num_people,
+    }
+
+
+class CostTable:
+    """목적지 × 기간(1~14박) × 인원(1~10명) × 등급 비용 테이블.
+
+    costs[d, n - 1, p - 1, t] 는 목적지 d 에 n박, p명, 등급 t 로 갔을 때의
+    예상 총비용 (원) 입니다 (체크인 날짜는 테이블마다 고정).
+    """
+
+    def __init__(self, destinations: list[str], costs: np.ndarray):
+        self.destinations = destinations
+        self.costs = costs
+
+    @classmethod
+    def build(cls, check_in: str) -> "CostTable":
+        """항공/숙박 데이터로부터 테이블 생성 (카탈로그의 모든 목적지를 읽음).
+
+        숙박비는 check_in 부터의 날짜별 요금 배수(주말/계절/공휴일)를 적용합니다.
+        """
+        flights = [(d, get_flight_data(d)) for d in catalog_destinations()]
+        known = [(d, flight) for d, flight in flights if flight is not None]
+        destinations = [d for d, _ in known]
+
+        # 등급별 왕복 항공권 (1인)
+        flight = np.array(
+            [[flight["prices"][tier] for tier in TIERS] for _, flight in known],
+            dtype=np.int64,
+        )
+
+        # 등급별 평균 기준 1박 요금 (객실 기준, 가격 변동 기대값 포함)
+        hotel = np.array(
+            [
+                [
+                    np.mean([h["base_price"] for h in get_hotel_candidates(d, tier)])
+                    * HOTEL_PRICE_FACTOR
+                    for tier in TIERS
+                ]
+                for d in destinations
+            ]
+        )
+
+        # 목적지별 1~MAX_DURATION 박의 요금 배수 누적합 (destination, nights)
+        rate_sums = np.cumsum(
+            [rate_multipliers(d, check_in, MAX_DURATION) for d in destinations], axis=1
+        )
+
+        # 브로드캐스트 축: (destination, nights, people, tier)
+        nights = np.arange(1, MAX_DURATION + 1, dtype=np.int64)[None, :, None, None]
+        people = np.arange(1, MAX_PEOPLE + 1, dtype=np.int64)[None, None, :, None]
+        flight = flight[:, None, None, :]
+        hotel = hotel[:, None, None, :]
+        rate_sums = rate_sums[:, :, None, None]
+
+        extra_fee = EXTRA_PERSON_FEE * np.maximum(people - 2, 0)
+        lodging = np.round((hotel + extra_fee) * rate_sums).astype(np.int64)
+        costs = (
+            flight * people
+            + lodging
+            + FOOD_PER_DAY * (nights + 1) * people
+            + TRANSPORT_PER_PERSON * people
+            + ACTIVITY_PER_DAY * (nights + 1) * people
+        )
+
+        logger.info(f"Built cost table for check-in {check_in} with shape {costs.shape}")
+        return cls(destinations, costs)
+
+    def lookup(self, destination: str, duration: int, num_people: int) -> dict[str, int]:
+        """단일 목적지의 등급별 예상 총비용."""
+        d = self.destinations.index(destination)
+        row = self.costs[d, duration - 1, num_people - 1]
+        return {tier: int(cost) for tier, cost in zip(TIERS, row, strict=True)}
+
+    def affordable(
+        self,
+        budget: int,
+        duration: int,
+        num_people: int,
+    ) -> list[dict[str, Any]]:
+        """예산 내에서 갈 수 있는 목적지를 여유 금액 순으로 반환.
+
+        Args:
+            budget: 1인 예산 (원)
+            duration: 기간 (박)
+            num_people: 인원
+
+        Returns:
+            목적지별 최저 비용 등급, 예상 총비용, 여유 금액, 가능한 등급 목록
+        """
+        total_budget = budget * num_people
+        costs = self.costs[:, duration - 1, num_people - 1, :]
+
+        feasible = costs <= total_budget
+        cheapest = costs.min(axis=1)
+        slack = total_budget - cheapest
+
+        indices = np.flatnonzero(feasible.any(axis=1))
+        indices = indices[np.argsort(-slack[indices], kind="stable")]
+
+        results = []
+        for d in indices:
+            results.append(
+                {
+                    "destination": self.destinations[d],
+                    "tier": TIERS[int(costs[d].argmin())],
+                    "estimated_total": int(cheapest[d]),
+                    "slack": int(slack[d]),
+                    "feasible_tiers": {
+                        TIERS[t]: int(costs[d, t])
+                        for t in range(len(TIERS))
+                        if feasible[d, t]
+                    },
+                }
+            )
+        return results
+
+
+@lru_cache(maxsize=32)
+def _build_cost_table(check_in: str) -> CostTable:
+    return CostTable.build(check_in)
+
+
+def get_cost_table(check_in: str | None = None) -> CostTable:
+    """체크인 날짜별로 캐시된 비용 테이블 반환 (날짜가 없으면 30일 후, 숙박 검색과 동일)."""
+    return _build_cost_table(get_check_in_date(check_in))
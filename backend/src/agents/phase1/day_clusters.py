@@ -0,0 +1,123 @@
+"""Geographic day assignment.
+
+여러 날 일정에서 같은 동네를 여러 날 반복 방문하지 않도록,
+목적지의 후보 장소를 좌표 기준으로 묶어(소요 시간 가중 k-means) 날짜별로 배정합니다.
+중간 날(N박이면 N-1일)마다 묶음 하나를 배정하고, 묶음 순서는 가까운 묶음끼리 이어지도록 정합니다.
+결과는 (목적지, 일수, 스타일 집합) 별로 캐시합니다.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from src.agents.phase1.day_scheduler import parse_duration_minutes
+from src.agents.phase1.poi_catalog import (
+    POI,
+    catalog_revision,
+    get_spots_for_style,
+    has_coordinates,
+    register_derived_cache,
+)
+from src.agents.phase1.route_optimizer import haversine_matrix, nearest_neighbor_tour
+
+# k-means 최대 반복 횟수
+KMEANS_MAX_ITER = 50
+
+# 날짜 배정에 사용하는 카테고리
+CLUSTER_CATEGORIES = ("sightseeing", "shopping")
+
+
+def weighted_kmeans(points: np.ndarray, weights: np.ndarray, k: int) -> np.ndarray:
+    """가중 k-means (Lloyd). 각 점의 묶음 번호 배열 반환.
+
+    초기 중심은 가장 무거운 점에서 시작해 가중 거리가 가장 먼 점을 차례로 고릅니다
+    (결정적이므로 같은 입력이면 같은 결과).
+    """
+    n = len(points)
+    k = min(k, len(np.unique(points, axis=0)))
+    if k <= 1:
+        return np.zeros(n, dtype=np.intp)
+
+    seeds = [points[np.argmax(weights)]]
+    for _ in range(1, k):
+        d2 = ((points[:, None, :] - np.array(seeds)[None, :, :]) ** 2).sum(axis=2).min(axis=1)
+        seeds.append(points[np.argmax(d2 * weights)])
+    centers = np.array(seeds)
+
+    labels = np.zeros(n, dtype=np.intp)
+    for _ in range(KMEANS_MAX_ITER):
+        d2 = ((points[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+        labels = np.argmin(d2, axis=1)
+        member = (labels[:, None] == np.arange(k)[None, :]) * weights[:, None]  # n x k
+        mass = member.sum(axis=0)
+        updated = np.where(
+            mass[:, None] > 0,
+            (member.T @ points) / np.maximum(mass, 1e-12)[:, None],
+            centers,
+        )
+        if np.allclose(updated, centers):
+            break
+        centers = updated
+    return labels
+
+
+def get_day_clusters(
+    destination: str,
+    days: int,
+    styles: frozenset[str],
+) -> tuple[tuple[POI, ...], ...]:
+    """중간 날별 배정 장소 묶음 (좌표가 없으면 빈 튜플).
+
+    Args:
+        destination: 목적지
+        days: 묶음(날짜) 수
+        styles: 여행 스타일 집합
+    """
+    return _day_clusters(destination, catalog_revision(destination), days, styles)
+
+
+@lru_cache(maxsize=256)
+def _day_clusters(
+    destination: str,
+    revision: str,
+    days: int,
+    styles: frozenset[str],
+) -> tuple[tuple[POI, ...], ...]:
+    if days <= 0:
+        return ()
+
+    spots = get_spots_for_style(destination, sorted(styles))
+    candidates = [
+        spot
+        for category in CLUSTER_CATEGORIES
+        for spot in spots.get(category, ())
+        if has_coordinates(spot)
+    ]
+    if not candidates:
+        return ()
+
+    coords = np.array([(spot.lat, spot.lon) for spot in candidates])
+    weights = np.array([parse_duration_minutes(spot.duration) for spot in candidates], dtype=np.float64)
+
+    # 위경도를 평면 좌표로 (경도는 위도에 따라 축소)
+    points = coords.copy()
+    points[:, 1] *= np.cos(np.radians(coords[:, 0].mean()))
+    labels = weighted_kmeans(points, weights, days)
+
+    clusters = [np.flatnonzero(labels == label) for label in np.unique(labels)]
+    mass = np.array([weights[members].sum() for members in clusters])
+    centroids = np.array([
+        np.average(coords[members], axis=0, weights=weights[members]) for members in clusters
+    ])
+
+    # 가장 무거운 묶음부터 가까운 묶음 순으로 날짜 배정
+    heaviest = int(np.argmax(mass))
+    order = [heaviest] + [i for i in range(len(clusters)) if i != heaviest]
+    dist = haversine_matrix(centroids[order, 0], centroids[order, 1])
+    tour = [order[i] for i in nearest_neighbor_tour(dist, 0)]
+
+    assigned = [tuple(candidates[i] for i in clusters[c]) for c in tour]
+    return tuple(assigned + [()] * (days - len(assigned)))
+
+
+register_derived_cache(_day_clusters.cache_clear)
@@ -0,0 +1,227 @@
+"""Duration-aware day scheduler.
+
+장소별 소요 시간("2시간", "1시간 30분")을 분 단위로 바꾸고,
+식사/이동처럼 시간이 정해진 일정 사이의 빈 시간대에 장소를 채워 넣어
+겹치지 않는 하루 일정을 만듭니다.
+
+장소는 우선순위 순서대로 들어갈 수 있는 가장 이른 빈 시간대(first-fit)에 놓습니다.
+빈 시간대 수 g 는 고정 일정 수로 제한되므로 후보가 수백 개여도 O(n·g) 이고,
+남은 시간대보다 긴 장소는 바로 건너뜁니다.
+"""
+
+import re
+from collections.abc import Callable, Sequence
+from typing import NamedTuple
+
+from src.agents.phase1.poi_catalog import POI
+
+# 장소 사이 이동/여유 시간 (분)
+TRANSIT_BUFFER_MINUTES = 30
+
+# 이 시간 이상인 장소는 점심을 현장에서 해결하는 것으로 보고 점심 슬롯을 사용할 수 있음
+ALL_DAY_MINUTES = 300
+
+# 소요 시간을 알 수 없을 때 기본값 (분)
+DEFAULT_DURATION_MINUTES = 60
+
+# 장소 -> 그날 영업 시간대 목록 (분, None 이면 항상 영업)
+OpeningHours = Callable[[POI], Sequence[tuple[int, int]] | None]
+
+DURATION_PATTERN = re.compile(r"(?:(\d+(?:\.\d+)?)\s*시간)?\s*(?:(\d+)\s*분)?")
+
+
+def parse_duration_minutes(duration: str | None) -> int:
+    """소요 시간 문자열을 분으로 변환 (예: "1.5시간" -> 90, "1시간 30분" -> 90)."""
+    if not duration:
+        return DEFAULT_DURATION_MINUTES
+    match = DURATION_PATTERN.fullmatch(duration.strip())
+    if not match or not any(match.groups()):
+        return DEFAULT_DURATION_MINUTES
+    hours, minutes = match.groups()
+    return round(float(hours or 0) * 60) + int(minutes or 0)
+
+
+def to_minutes(clock: str) -> int:
+    """"HH:MM" -> 자정 이후 분."""
+    hours, minutes = clock.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def to_clock(minutes: int) -> str:
+    """자정 이후 분 -> "HH:MM"."""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+class Reserved(NamedTuple):
+    """시간이 정해진 일정 (식사, 이동, 체크인 등)."""
+
+    start: int  # 시작 (분)
+    end: int  # 종료 (분)
+    key: str  # 식별자 (예: "lunch")
+    optional: bool = False  # 하루 종일 장소가 대신 차지할 수 있는지 (예: 점심)
+
+
+class Placement(NamedTuple):
+    """배치된 장소."""
+
+    start: int
+    end: int
+    poi: POI
+
+
+class DaySchedule(NamedTuple):
+    """하루 배치 결과."""
+
+    placements: list[Placement]  # 시작 시각순
+    reserved: list[Reserved]  # 유지된 고정 일정 (차지된 optional 슬롯 제외)
+    absorbed: list[str]  # 하루 종일 장소가 대신 차지한 optional 슬롯
+
+
+def free_gaps(window: tuple[int, int], reserved: Sequence[Reserved]) -> list[tuple[int, int]]:
+    """배치 가능 시간대에서 고정 일정을 뺀 빈 시간대 목록 (시작순)."""
+    start, end = window
+    gaps = []
+    cursor = start
+    for item in sorted(reserved):
+        if item.end <= start or item.start >= end:
+            continue
+        if item.start > cursor:
+            gaps.append((cursor, item.start))
+        cursor = max(cursor, item.end)
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+class _GapIndex:
+    """빈 시간대 목록 (시작순)과 가장 긴 시간대 길이."""
+
+    def __init__(self, gaps: list[tuple[int, int]]):
+        self._gaps = [list(gap) for gap in gaps]
+        self.longest = max((end - start for start, end in gaps), default=0)
+
+    def take(
+        self,
+        minutes: int,
+        buffer: int,
+        allowed: Sequence[tuple[int, int]] | None = None,
+    ) -> int | None:
+        """minutes 가 들어가는 가장 이른 시간대를 사용. 시작 시각 반환.
+
+        allowed(영업 시간대)가 있으면 그 안에서 시작/종료하는 가장 이른 위치를 찾습니다.
+        """
+        if minutes > self.longest:
+            return None
+        for index, gap in enumerate(self._gaps):
+            start, end = gap
+            if end - start < minutes:
+                continue
+            begin = self._fit(start, end, minutes, allowed)
+            if begin is None:
+                continue
+            rest = begin + minutes + buffer
+            parts = ([[start, begin]] if begin > start else []) + ([[rest, end]] if rest < end else [])
+            self._gaps[index : index + 1] = parts
+            self.longest = max((e - s for s, e in self._gaps), default=0)
+            return begin
+        return None
+
+    @staticmethod
+    def _fit(
+        start: int,
+        end: int,
+        minutes: int,
+        allowed: Sequence[tuple[int, int]] | None,
+    ) -> int | None:
+        if allowed is None:
+            return start
+        for open_at, close_at in allowed:
+            begin = max(start, open_at)
+            if begin + minutes <= min(end, close_at):
+                return begin
+        return None
+
+
+def pack_day(
+    candidates: Sequence[POI],
+    window: tuple[int, int],
+    reserved: Sequence[Reserved] = (),
+    max_items: int | None = None,
+    buffer: int = TRANSIT_BUFFER_MINUTES,
+    hours: OpeningHours | None = None,
+) -> DaySchedule:
+    """후보 장소를 우선순위 순서대로 빈 시간대에 배치.
+
+    Args:
+        candidates: 우선순위 순 후보 장소
+        window: 장소를 배치할 수 있는 시간대 (분)
+        reserved: 고정 일정 (겹치지 않게 배치)
+        max_items: 배치할 최대 장소 수
+        buffer: 장소 뒤에 두는 이동 시간 (분)
+        hours: 장소별 그날 영업 시간대 (영업 시간 안에만 배치)
+    """
+    reserved = list(reserved)
+    absorbed: list[str] = []
+    gaps = _GapIndex(free_gaps(window, reserved))
+    placements: list[Placement] = []
+
+    for poi in candidates:
+        if max_items is not None and len(placements) >= max_items:
+            break
+        minutes = parse_duration_minutes(poi.duration)
+        allowed = hours(poi) if hours else None
+        start = gaps.take(minutes, buffer, allowed)
+
+        if (
+            start is None
+            and not placements
+            and minutes >= ALL_DAY_MINUTES
+            and any(item.optional for item in reserved)
+        ):
+            # 하루 종일 장소: optional 슬롯(점심)을 비우고 다시 시도
+            kept = [item for item in reserved if not item.optional]
+            start = _GapIndex(free_gaps(window, kept)).take(minutes, buffer, allowed)
+            if start is not None:
+                end = start + minutes
+                absorbed = [
+                    item.key for item in reserved
+                    if item.optional and item.start < end and item.end > start
+                ]
+                reserved = [item for item in reserved if item.key not in absorbed]
+                gaps = _GapIndex(_split_gaps(free_gaps(window, reserved), start, end + buffer))
+
+        if start is None:
+            if not gaps.longest:
+                break
+            continue
+        placements.append(Placement(start, start + minutes, poi))
+
+    placements.sort()
+    return DaySchedule(placements, reserved, absorbed)
+
+
+def _split_gaps(gaps: list[tuple[int, int]], start: int, end: int) -> list[tuple[int, int]]:
+    """빈 시간대 목록에서 [start, end) 구간 제거."""
+    result = []
+    for gap_start, gap_end in gaps:
+        if gap_end <= start or gap_start >= end:
+            result.append((gap_start, gap_end))
+            continue
+        if gap_start < start:
+            result.append((gap_start, start))
+        if gap_end > end:
+            result.append((end, gap_end))
+    return result
+
+
+def find_conflicts(activities: Sequence[dict]) -> list[tuple[int, int]]:
+    """시간이 겹치는 활동 쌍 (인덱스) 목록. 시작 시각순 활동 목록을 가정."""
+    conflicts = []
+    intervals = [
+        (to_minutes(a["time"]), to_minutes(a["time"]) + parse_duration_minutes(a.get("duration")))
+        for a in activities
+    ]
+    for i in range(len(intervals) - 1):
+        if intervals[i + 1][0] < intervals[i][1]:
+            conflicts.append((i, i + 1))
+    return conflicts
@@ -1,36 +1,24 @@
 """Flight Searcher Agent for Phase 1.
 
 항공권 정보를 검색하고 옵션을 제공하는 Agent입니다.
-MVP에서는 하드코딩된 데이터를 사용하고, 추후 크롤링/API로 확장합니다.
+MVP에서는 목적지 카탈로그(src/data/catalog/)의 공항/가격 데이터를 사용하고, 추후 크롤링/API로 확장합니다.
 """
 
 import logging
+from collections.abc import Mapping
 from datetime import datetime, timedelta
-from typing import Any
+from functools import lru_cache
+from typing import Any, NamedTuple
 
+import numpy as np
+
+from src.agents.phase1.poi_catalog import catalog_destinations, get_destination_catalog
+from src.agents.phase1.search_cache import cached_search, flight_search_key
 from src.models.state import FlightOption, TravelState
+from src.utils.geo import get_geo_index, haversine_km
 
 logger = logging.getLogger(__name__)
 
-# 공항 코드 매핑
-AIRPORT_CODES = {
-    "오사카": "KIX",
-    "도쿄": "NRT",
-    "교토": "KIX",  # 오사카 간사이 공항 이용
-    "방콕": "BKK",
-    "파리": "CDG",
-    "런던": "LHR",
-    "뉴욕": "JFK",
-    "하와이": "HNL",
-    "괌": "GUM",
-    "싱가포르": "SIN",
-    "홍콩": "HKG",
-    "제주": "CJU",
-    "다낭": "DAD",
-    "발리": "DPS",
-    "세부": "CEB",
-}
-
 # 항공사 데이터
 AIRLINES = {
     "budget": ["티웨이항공", "진에어", "제주항공", "에어서울", "이스타항공"],
@@ -38,48 +26,115 @@
     "premium": ["대한항공", "아시아나항공", "싱가포르항공", "ANA", "JAL"],
 }
 
-# 목적지별 기본 비행 시간 (분)
-FLIGHT_TIMES = {
-    "오사카": 120,
-    "도쿄": 150,
-    "교토": 120,
-    "방콕": 330,
-    "파리": 720,
-    "런던": 690,
-    "뉴욕": 840,
-    "하와이": 540,
-    "괌": 240,
-    "싱가포르": 390,
-    "홍콩": 210,
-    "제주": 65,
-    "다낭": 270,
-    "발리": 420,
-    "세부": 270,
-}
+# 출발 공항 (인천)
+ORIGIN_AIRPORT = "ICN"
 
-# 목적지별 기본 가격 (원, 왕복)
-BASE_PRICES = {
-    "오사카": {"budget": 250000, "standard": 350000, "premium": 550000},
-    "도쿄": {"budget": 280000, "standard": 400000, "premium": 600000},
-    "교토": {"budget": 250000, "standard": 350000, "premium": 550000},
-    "방콕": {"budget": 300000, "standard": 450000, "premium": 700000},
-    "파리": {"budget": 800000, "standard": 1200000, "premium": 2500000},
-    "런던": {"budget": 750000, "standard": 1100000, "premium": 2300000},
-    "뉴욕": {"budget": 900000, "standard": 1400000, "premium": 3000000},
-    "하와이": {"budget": 700000, "standard": 1000000, "premium": 2000000},
-    "괌": {"budget": 400000, "standard": 550000, "premium": 850000},
-    "싱가포르": {"budget": 350000, "standard": 500000, "premium": 900000},
-    "홍콩": {"budget": 250000, "standard": 380000, "premium": 600000},
-    "제주": {"budget": 80000, "standard": 120000, "premium": 200000},
-    "다낭": {"budget": 280000, "standard": 400000, "premium": 650000},
-    "발리": {"budget": 450000, "standard": 650000, "premium": 1100000},
-    "세부": {"budget": 300000, "standard": 420000, "premium": 700000},
-}
+# 항공기 평균 순항 속도 (km/h) 및 이착륙 여유 시간 (분)
+CRUISE_SPEED_KMH = 800
+TAXI_MINUTES = 30
+
+# 가격 데이터를 빌려 쓸 수 있는 주변 도시의 최대 거리 (km, 같은 생활권)
+PRICE_CITY_MAX_KM = 150
+
+
+def get_flight_data(city: str) -> Mapping[str, Any] | None:
+    """카탈로그의 항공 데이터 (공항 코드, 비행 시간, 등급별 가격). 없으면 None."""
+    catalog = get_destination_catalog(city)
+    return catalog.flight if catalog is not None and catalog.flight else None
+
+
+def get_airport_code(city: str) -> str | None:
+    """도시명으로 공항 코드 반환 (알 수 없는 도시는 None).
+
+    카탈로그에 없는 도시는 지리 색인에서 가장 가까운 상업 공항을 찾습니다.
+    """
+    flight = get_flight_data(city)
+    if flight is not None:
+        return str(flight["airport"])
+
+    nearest = get_geo_index().nearest_airports_for_city(city, k=1)
+    if nearest:
+        return nearest[0][1]["iata"]
+
+    logger.warning(f"Unknown destination for airport lookup: {city}")
+    return None
 
 
-def get_airport_code(city: str) -> str:
-    """도시명으로 공항 코드 반환."""
-    return AIRPORT_CODES.get(city, "ICN")
+def get_price_city(destination: str) -> str | None:
+    """가격 데이터를 가진 도시 (목적지 자신 또는 PRICE_CITY_MAX_KM 안의 도시, 없으면 None)."""
+    if get_flight_data(destination) is not None:
+        return destination
+
+    nearby = get_geo_index().nearby_cities(
+        destination, k=1, max_km=PRICE_CITY_MAX_KM, served=catalog_destinations()
+    )
+    if nearby:
+        return nearby[0][1]["name"]
+    return None
+
+
+class FareModel(NamedTuple):
+    """비행 시간 기반 왕복 가격 모델."""
+
+    base: float  # budget 기본 요금 (원)
+    per_minute: float  # budget 비행 1분당 요금 (원)
+    tier_ratios: dict[str, float]  # 등급 -> budget 대비 가격 배수
+
+
+@lru_cache
+def get_fare_model() -> FareModel:
+    """카탈로그 전체 도시의 가격/비행 시간으로 만든 가격 모델.
+
+    budget 가격은 비행 시간에 대한 1차 회귀, 다른 등급은 도시별 가격 배수의 중앙값입니다.
+    """
+    flights = [get_flight_data(city) for city in catalog_destinations()]
+    known = [flight for flight in flights if flight is not None]
+    minutes = np.array([flight["minutes"] for flight in known], dtype=np.float64)
+    prices = {
+        tier: np.array([flight["prices"][tier] for flight in known], dtype=np.float64)
+        for tier in AIRLINES
+    }
+    per_minute, base = np.polyfit(minutes, prices["budget"], 1)
+    ratios = {tier: float(np.median(prices[tier] / prices["budget"])) for tier in AIRLINES}
+    return FareModel(float(base), float(per_minute), ratios)
+
+
+def estimate_base_prices(destination: str) -> dict[str, int] | None:
+    """등급별 기본 왕복 가격 (원, 1인).
+
+    가격 데이터가 있는 도시(또는 같은 생활권 도시)는 그 가격을,
+    그 밖의 도시는 비행 시간으로 추정하며, 알 수 없는 목적지는 None.
+    """
+    price_city = get_price_city(destination)
+    flight = get_flight_data(price_city) if price_city is not None else None
+    if flight is not None:
+        return dict(flight["prices"])
+
+    minutes = estimate_flight_minutes(destination)
+    if minutes is None:
+        return None
+    model = get_fare_model()
+    budget = model.base + model.per_minute * minutes
+    return {tier: int(round(budget * ratio, -3)) for tier, ratio in model.tier_ratios.items()}
+
+
+def estimate_flight_minutes(destination: str) -> int | None:
+    """목적지까지의 비행 시간 (분, 알 수 없는 목적지는 None)."""
+    flight = get_flight_data(destination)
+    if flight is not None:
+        return int(flight["minutes"])
+
+    index = get_geo_index()
+    origin = next(a for a in index.airports if a["iata"] == ORIGIN_AIRPORT)
+    nearest = index.nearest_airports_for_city(destination, k=1)
+    if not nearest:
+        return None
+
+    airport = nearest[0][1]
+    distance = haversine_km(origin["lat"], origin["lon"], airport["lat"], airport["lon"])
+    minutes = TAXI_MINUTES + distance / CRUISE_SPEED_KMH * 60
+    # 5분 단위 반올림
+    return int(round(minutes / 5) * 5)
 
 
 def format_flight_time(minutes: int) -> str:
@@ -107,8 +162,12 @@ def generate_flight_option(
     """항공권 옵션 생성."""
     import random
 
-    # 기본 가격
-    prices = BASE_PRICES.get(destination, BASE_PRICES["오사카"])
+    # 기본 가격 (데이터가 없으면 같은 생활권 도시 또는 비행 시간 기준)
+    prices = estimate_base_prices(destination)
+    flight_time_mins = estimate_flight_minutes(destination)
+    airport_code = get_airport_code(destination)
+    if prices is None or flight_time_mins is None or airport_code is None:
+        raise ValueError(f"Unknown destination: {destination}")
     base_price = prices[flight_type]
 
     # 가격 변동 (-10% ~ +10%)
@@ -119,9 +178,6 @@ def generate_flight_option(
     airlines = AIRLINES[flight_type]
     airline = random.choice(airlines)
 
-    # 비행 시간
-    flight_time_mins = FLIGHT_TIMES.get(destination, 120)
-
     # 출발 시간 생성 (타입별로 다름)
     if flight_type == "budget":
         # 저가항공은 이른 아침/늦은 밤
@@ -141,12 +197,16 @@ def generate_flight_option(
         price=final_price,
         airline=airline,
         outbound={
+            "departure_airport": ORIGIN_AIRPORT,
+            "arrival_airport": airport_code,
             "departure_time": outbound_departure,
             "arrival_time": add_time(outbound_departure, flight_time_mins),
             "flight_time": format_flight_time(flight_time_mins),
             "date": departure_date,
         },
         inbound={
+            "departure_airport": airport_code,
+            "arrival_airport": ORIGIN_AIRPORT,
             "departure_time": inbound_departure,
             "arrival_time": add_time(inbound_departure, flight_time_mins),
             "flight_time": format_flight_time(flight_time_mins),
@@ -168,8 +228,11 @@ def search_flights(
         departure_date: 출발일 (없으면 30일 후)
 
     Returns:
-        3개의 항공권 옵션 (budget, standard, premium)
+        3개의 항공권 옵션 (budget, standard, premium), 알 수 없는 목적지면 빈 목록
     """
+    if get_airport_code(destination) is None:
+        return []
+
     # 날짜 계산
     if departure_date:
         dep_date = datetime.strptime(departure_date, "%Y-%m-%d")
@@ -220,13 +283,25 @@ def search_flights_node(state: TravelState) -> dict:
     try:
         logger.info(f"Searching flights to {destination} for {duration} nights")
 
-        flight_options = search_flights(
-            destination=destination,
-            duration=duration,
+        flight_options = cached_search(
+            flight_search_key(destination, duration),
+            lambda: search_flights(destination=destination, duration=duration),
         )
 
         logger.info(f"Found {len(flight_options)} flight options")
 
+        if not flight_options:
+            return {
+                "flight_options": [],
+                "current_step": "searching_hotels",
+                "messages": [
+                    {
+                        "role": "assistant",
+                        "content": f"{destination}행 항공편 정보를 찾을 수 없습니다. 숙박 검색으로 넘어갑니다...",
+                    }
+                ],
+            }
+
         return {
             "flight_options": flight_options,
             "current_step": "searching_hotels",
@@ -0,0 +1,163 @@
+"""Conversation history compaction.
+
+대화가 길어지면 오래된 메시지를 요약(history_summary)으로 접고
+원문은 로컬 저장소(cold storage)로 옮겨 세션 상태와 LLM 프롬프트 크기를 일정하게 유지합니다.
+요약은 LLM 을 사용할 수 있으면 LLM 으로, 아니면 수집된 정보로 규칙 기반 생성합니다.
+"""
+
+import logging
+
+from src.config import settings
+from src.models.state import Message, TravelState, sync_message_cursor
+from src.tools.llm_client import (
+    LLMUnavailableError,
+    has_llm_budget,
+    invoke_llm,
+    is_llm_enabled,
+)
+from src.tools.llm_usage import usage_session
+from src.utils.metrics import metrics
+from src.utils.prompts import HISTORY_SUMMARY_SYSTEM_PROMPT, HISTORY_SUMMARY_USER_PROMPT
+from src.utils.store import get_local_store
+
+logger = logging.getLogger(__name__)
+
+# cold storage 네임스페이스 (settings.local_store_unbounded_namespaces 에 포함되어 LRU 제거 대상 아님)
+HISTORY_NAMESPACE = "history"
+
+# 요약/프롬프트에 넣는 메시지 1개의 최대 길이 (문자)
+MESSAGE_SNIPPET_CHARS = 200
+
+# 규칙 기반 요약에 남기는 최근 사용자 요청 수
+DIGEST_USER_REQUESTS = 3
+
+
+def _snippet(content: str, limit: int = MESSAGE_SNIPPET_CHARS) -> str:
+    content = " ".join(content.split())
+    return content if len(content) <= limit else content[: limit - 1] + "…"
+
+
+def format_messages(messages: list[Message]) -> str:
+    """메시지 목록을 "역할: 내용" 줄로 변환 (내용은 잘라서 사용)."""
+    labels = {"user": "사용자", "assistant": "상담사", "system": "시스템"}
+    return "\n".join(
+        f"{labels.get(m.get('role', ''), m.get('role', ''))}: {_snippet(m.get('content', ''))}"
+        for m in messages
+    )
+
+
+def build_digest(state: TravelState, folded: list[Message]) -> str:
+    """수집된 정보와 최근 사용자 요청으로 규칙 기반 요약 생성."""
+    parts = []
+    if state.get("destination"):
+        parts.append(f"목적지: {state['destination']}")
+    if state.get("duration"):
+        parts.append(f"기간: {state['duration']}박 {state['duration'] + 1}일")
+    if state.get("budget"):
+        parts.append(f"예산: 1인 {state['budget']:,}원")
+    if state.get("num_people"):
+        parts.append(f"인원: {state['num_people']}명")
+    if state.get("travel_style"):
+        parts.append(f"스타일: {', '.join(state['travel_style'])}")
+
+    total = state.get("archived_messages", 0) + len(folded)
+    digest = f"[이전 대화 {total}개 메시지] " + (" · ".join(parts) or "수집된 정보 없음")
+
+    requests = [m["content"] for m in folded if m.get("role") == "user"][-DIGEST_USER_REQUESTS:]
+    if requests:
+        digest += "\n최근 요청: " + " / ".join(_snippet(r, 60) for r in requests)
+    return digest
+
+
+async def summarize_with_llm(state: TravelState, folded: list[Message]) -> str:
+    """이전 요약과 접을 메시지를 LLM 으로 요약."""
+    prompt = HISTORY_SUMMARY_USER_PROMPT.format(
+        previous_summary=state.get("history_summary") or "없음",
+        conversation=format_messages(folded),
+    )
+    with usage_session(state.get("session_id")):
+        summary = await invoke_llm("info_collector", HISTORY_SUMMARY_SYSTEM_PROMPT, prompt)
+    return summary.strip()
+
+
+def archive_messages(session_id: str, start: int, messages: list[Message]) -> None:
+    """메시지 원문을 cold storage 에 저장 (키: 세션 ID + 시작 위치).
+
+    만료 없이 보관하고 세션을 삭제할 때 함께 삭제합니다.
+    """
+    get_local_store().set(HISTORY_NAMESPACE, f"{session_id}:{start:08d}", messages)
+
+
+def load_archived_messages(session_id: str) -> list[Message]:
+    """cold storage 의 메시지 원문을 순서대로 반환."""
+    chunks = sorted(get_local_store().scan(HISTORY_NAMESPACE, f"{session_id}:"))
+    return [message for _, messages in chunks for message in messages]
+
+
+def delete_archived_messages(session_id: str) -> int:
+    """세션의 cold storage 메시지 삭제. 삭제한 묶음 수 반환."""
+    store = get_local_store()
+    keys = [key for key, _ in store.scan(HISTORY_NAMESPACE, f"{session_id}:")]
+    for key in keys:
+        store.delete(HISTORY_NAMESPACE, key)
+    return len(keys)
+
+
+def build_conversation_context(state: TravelState) -> str:
+    """LLM 프롬프트용 대화 맥락 (요약 + 현재 사용자 메시지 이전의 최근 메시지).
+
+    메시지 수와 길이를 제한하므로 대화가 길어져도 크기가 일정합니다.
+    """
+    messages = state.get("messages", [])
+    end = len(messages)
+    if messages and messages[-1].get("role") == "user":
+        end -= 1
+    recent = messages[max(end - settings.history_prompt_messages, 0) : end]
+
+    parts = []
+    if state.get("history_summary"):
+        parts.append(state["history_summary"])
+    if recent:
+        parts.append(format_messages(recent))
+    return "\n".join(parts) or "없음"
+
+
+async def compact_history(state: TravelState) -> bool:
+    """메시지가 한도를 넘으면 오래된 메시지를 요약으로 접음 (state 를 직접 수정).
+
+    Returns:
+        압축 여부
+    """
+    messages = state.get("messages", [])
+    if not settings.history_compaction_enabled or len(messages) <= settings.history_max_messages:
+        return False
+
+    keep = max(settings.history_keep_messages, 1)
+    folded, recent = messages[:-keep], messages[-keep:]
+    session_id = state.get("session_id", "")
+    archived = state.get("archived_messages", 0)
+
+    summary = None
+    if settings.history_llm_summary_enabled and is_llm_enabled() and has_llm_budget(session_id):
+        try:
+            summary = await summarize_with_llm(state, folded)
+            metrics.incr("history.llm_summaries")
+        except LLMUnavailableError as e:
+            logger.warning(f"LLM unavailable for history summary: {e}")
+        except Exception as e:
+            logger.error(f"LLM history summary failed: {e}")
+    if not summary:
+        summary = build_digest(state, folded)
+
+    archive_messages(session_id, archived, folded)
+
+    state["history_summary"] = summary
+    state["archived_messages"] = archived + len(folded)
+    state["messages"] = list(recent)
+    state["message_cursor"] = {}
+    sync_message_cursor(state)
+
+    metrics.incr("history.compactions")
+    metrics.incr("history.archived_messages", len(folded))
+    logger.info(f"Compacted history for {session_id}: {len(folded)} messages archived")
+    return True
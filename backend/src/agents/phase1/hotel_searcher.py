@@ -1,101 +1,26 @@
 """Hotel Searcher Agent for Phase 1.
 
 숙박 정보를 검색하고 옵션을 제공하는 Agent입니다.
-MVP에서는 하드코딩된 데이터를 사용하고, 추후 크롤링/API로 확장합니다.
+MVP에서는 목적지 카탈로그(src/data/catalog/)의 숙소 데이터를 사용하고, 추후 크롤링/API로 확장합니다.
 """
 
 import logging
 import random
+from collections.abc import Mapping, Sequence
+from datetime import datetime, timedelta
 from typing import Any
 
+import numpy as np
+
+from src.agents.phase1.poi_catalog import get_default_catalog, get_destination_catalog
+from src.agents.phase1.search_cache import cached_search, hotel_search_key
 from src.models.state import HotelOption, TravelState
+from src.utils.price_calendar import price_nights, window_totals
 
 logger = logging.getLogger(__name__)
 
-# 목적지별 숙박 데이터
-HOTELS_DATA = {
-    "오사카": {
-        "budget": [
-            {"name": "게스트하우스 난바", "location": "난바", "rating": 4.2, "base_price": 35000},
-            {"name": "더 게스트 하우스 우메다", "location": "우메다", "rating": 4.0, "base_price": 38000},
-            {"name": "J-호프 오사카 호스텔", "location": "신사이바시", "rating": 4.1, "base_price": 32000},
-        ],
-        "standard": [
-            {"name": "호텔 난바 오리엔탈", "location": "난바", "rating": 4.4, "base_price": 75000},
-            {"name": "크로스 호텔 오사카", "location": "신사이바시", "rating": 4.5, "base_price": 85000},
-            {"name": "호텔 그레이스리 오사카 난바", "location": "난바", "rating": 4.3, "base_price": 70000},
-        ],
-        "premium": [
-            {"name": "힐튼 오사카", "location": "우메다", "rating": 4.7, "base_price": 180000},
-            {"name": "세인트 레지스 오사카", "location": "신사이바시", "rating": 4.8, "base_price": 350000},
-            {"name": "리츠칼튼 오사카", "location": "우메다", "rating": 4.9, "base_price": 400000},
-        ],
-    },
-    "도쿄": {
-        "budget": [
-            {"name": "사쿠라 호텔 이케부쿠로", "location": "이케부쿠로", "rating": 4.1, "base_price": 45000},
-            {"name": "카오산 월드 아사쿠사", "location": "아사쿠사", "rating": 4.0, "base_price": 40000},
-            {"name": "앤호스텔 시부야", "location": "시부야", "rating": 4.2, "base_price": 50000},
-        ],
-        "standard": [
-            {"name": "호텔 선루트 신주쿠", "location": "신주쿠", "rating": 4.3, "base_price": 90000},
-            {"name": "시타딘 신주쿠 도쿄", "location": "신주쿠", "rating": 4.4, "base_price": 100000},
-            {"name": "레미아 프리미어 긴자", "location": "긴자", "rating": 4.5, "base_price": 110000},
-        ],
-        "premium": [
-            {"name": "파크 하얏트 도쿄", "location": "신주쿠", "rating": 4.9, "base_price": 450000},
-            {"name": "만다린 오리엔탈 도쿄", "location": "니혼바시", "rating": 4.8, "base_price": 400000},
-            {"name": "아만 도쿄", "location": "오테마치", "rating": 4.9, "base_price": 600000},
-        ],
-    },
-    "방콕": {
-        "budget": [
-            {"name": "럽디 방콕 실롬", "location": "실롬", "rating": 4.3, "base_price": 25000},
-            {"name": "NapPark 호스텔 @ Khao San", "location": "카오산", "rating": 4.1, "base_price": 20000},
-            {"name": "호텔 도어즈 방콕", "location": "사톤", "rating": 4.0, "base_price": 28000},
-        ],
-        "standard": [
-            {"name": "아마리 워터게이트", "location": "프랏남", "rating": 4.4, "base_price": 60000},
-            {"name": "노보텔 방콕 스쿰빗", "location": "수쿰빗", "rating": 4.3, "base_price": 65000},
-            {"name": "웨스틴 그란데 수쿰빗", "location": "수쿰빗", "rating": 4.5, "base_price": 75000},
-        ],
-        "premium": [
-            {"name": "만다린 오리엔탈 방콕", "location": "차오프라야", "rating": 4.9, "base_price": 350000},
-            {"name": "페닌슐라 방콕", "location": "차오프라야", "rating": 4.8, "base_price": 300000},
-            {"name": "시암 켐핀스키 호텔", "location": "시암", "rating": 4.8, "base_price": 280000},
-        ],
-    },
-    "제주": {
-        "budget": [
-            {"name": "제주 에코 호스텔", "location": "제주시", "rating": 4.0, "base_price": 35000},
-            {"name": "공항 게스트하우스", "location": "제주시", "rating": 3.9, "base_price": 30000},
-            {"name": "월정리 해변 게스트하우스", "location": "월정리", "rating": 4.2, "base_price": 40000},
-        ],
-        "standard": [
-            {"name": "그라벨 호텔 제주", "location": "제주시", "rating": 4.4, "base_price": 80000},
-            {"name": "메종 글래드 제주", "location": "중문", "rating": 4.5, "base_price": 90000},
-            {"name": "호텔 아름드리 제주", "location": "서귀포", "rating": 4.3, "base_price": 75000},
-        ],
-        "premium": [
-            {"name": "롯데호텔 제주", "location": "중문", "rating": 4.7, "base_price": 200000},
-            {"name": "신라스테이 제주", "location": "제주시", "rating": 4.6, "base_price": 180000},
-            {"name": "하얏트 리젠시 제주", "location": "중문", "rating": 4.8, "base_price": 250000},
-        ],
-    },
-}
-
-# 기본 호텔 데이터 (목적지가 없을 경우 사용)
-DEFAULT_HOTELS = {
-    "budget": [
-        {"name": "시티 게스트하우스", "location": "시내", "rating": 4.0, "base_price": 40000},
-    ],
-    "standard": [
-        {"name": "시티 호텔", "location": "시내", "rating": 4.4, "base_price": 80000},
-    ],
-    "premium": [
-        {"name": "그랜드 호텔", "location": "시내", "rating": 4.7, "base_price": 200000},
-    ],
-}
+# 2인 초과 시 1인당 1박 추가 요금 (원)
+EXTRA_PERSON_FEE = 20000
 
 # 편의시설 목록
 AMENITIES = {
@@ -115,51 +40,97 @@ def get_distance_from_center(hotel_type: str) -> str:
     return distances.get(hotel_type, "0.5km")
 
 
-def generate_hotel_option(
+def get_check_in_date(departure_date: str | None = None) -> str:
+    """체크인 날짜 (없으면 30일 후, 항공권 검색과 동일)."""
+    if departure_date:
+        return departure_date
+    return (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
+
+
+def price_hotel_options(
     destination: str,
-    hotel_type: str,
+    candidates: list[tuple[str, Mapping[str, Any]]],
     duration: int,
     num_people: int,
-) -> HotelOption:
-    """숙박 옵션 생성."""
-    # 목적지별 호텔 데이터 가져오기
-    hotels = HOTELS_DATA.get(destination, DEFAULT_HOTELS)
-    hotel_list = hotels.get(hotel_type, DEFAULT_HOTELS[hotel_type])
+    check_in_date: str | None = None,
+) -> list[HotelOption]:
+    """후보 숙소 전체의 숙박 요금을 날짜별로 한 번에 계산하여 옵션 생성.
 
-    # 랜덤 호텔 선택
-    hotel = random.choice(hotel_list)
+    Args:
+        destination: 목적지 도시명
+        candidates: (호텔 타입, 호텔 데이터) 목록
+        duration: 숙박 기간 (박)
+        num_people: 인원
+        check_in_date: 체크인 날짜 (없으면 30일 후)
 
-    # 가격 변동 (-5% ~ +15%)
-    price_variation = random.uniform(0.95, 1.15)
-    price_per_night = int(hotel["base_price"] * price_variation)
+    Returns:
+        후보 순서대로의 숙박 옵션
+    """
+    check_in = get_check_in_date(check_in_date)
 
     # 인원 추가 요금 (2인 초과시)
-    if num_people > 2:
-        extra_person_fee = 20000 * (num_people - 2)
-        price_per_night += extra_person_fee
-
-    # 총 가격 계산
-    total_price = price_per_night * duration
-
-    # 편의시설
-    amenities = AMENITIES.get(hotel_type, AMENITIES["standard"])
-
-    return HotelOption(
-        type=hotel_type,
-        name=hotel["name"],
-        price_per_night=price_per_night,
-        total_price=total_price,
-        location=hotel["location"],
-        rating=hotel["rating"],
-        amenities=amenities,
-        distance_from_center=get_distance_from_center(hotel_type),
+    extra_person_fee = EXTRA_PERSON_FEE * max(0, num_people - 2)
+
+    # 가격 변동 (-5% ~ +15%) 이 적용된 기준 1박 요금
+    base_prices = np.array(
+        [
+            int(hotel["base_price"] * random.uniform(0.95, 1.15)) + extra_person_fee
+            for _, hotel in candidates
+        ]
     )
 
+    # 후보 × 숙박일 요금 행렬 → 후보별 총액
+    nightly = price_nights(base_prices, destination, check_in, duration).round()
+    totals = nightly.sum(axis=1)
+
+    options = []
+    for (hotel_type, hotel), rates, total in zip(candidates, nightly, totals, strict=True):
+        options.append(
+            HotelOption(
+                type=hotel_type,
+                name=hotel["name"],
+                price_per_night=int(round(total / duration)),
+                total_price=int(total),
+                location=hotel["location"],
+                rating=hotel["rating"],
+                amenities=AMENITIES.get(hotel_type, AMENITIES["standard"]),
+                distance_from_center=get_distance_from_center(hotel_type),
+                check_in=check_in,
+                nightly_prices=[int(rate) for rate in rates],
+            )
+        )
+    return options
+
+
+def get_hotel_candidates(destination: str, hotel_type: str) -> Sequence[Mapping[str, Any]]:
+    """목적지/타입별 호텔 후보 목록 (숙소 데이터가 없으면 기본 호텔)."""
+    default = get_default_catalog().hotels
+    catalog = get_destination_catalog(destination)
+    hotels = catalog.hotels if catalog is not None and catalog.hotels else default
+    candidates: Sequence[Mapping[str, Any]] = hotels.get(hotel_type, default[hotel_type])
+    return candidates
+
+
+def generate_hotel_option(
+    destination: str,
+    hotel_type: str,
+    duration: int,
+    num_people: int,
+    check_in_date: str | None = None,
+) -> HotelOption:
+    """숙박 옵션 생성."""
+    # 랜덤 호텔 선택
+    hotel = random.choice(get_hotel_candidates(destination, hotel_type))
+    return price_hotel_options(
+        destination, [(hotel_type, hotel)], duration, num_people, check_in_date
+    )[0]
+
 
 def search_hotels(
     destination: str,
     duration: int,
     num_people: int = 2,
+    check_in_date: str | None = None,
 ) -> list[HotelOption]:
     """숙박 검색 (MVP: 하드코딩 데이터).
 
@@ -167,21 +138,59 @@ def search_hotels(
         destination: 목적지 도시명
         duration: 숙박 기간 (박)
         num_people: 인원
+        check_in_date: 체크인 날짜 (없으면 30일 후)
 
     Returns:
         3개의 숙박 옵션 (budget, standard, premium)
     """
-    options = []
-    for hotel_type in ["budget", "standard", "premium"]:
-        option = generate_hotel_option(
-            destination=destination,
-            hotel_type=hotel_type,
-            duration=duration,
-            num_people=num_people,
-        )
-        options.append(option)
+    candidates = [
+        (hotel_type, random.choice(get_hotel_candidates(destination, hotel_type)))
+        for hotel_type in ["budget", "standard", "premium"]
+    ]
+    return price_hotel_options(destination, candidates, duration, num_people, check_in_date)
 
-    return options
+
+def cheapest_check_in_dates(
+    destination: str,
+    duration: int,
+    num_people: int = 2,
+    window_start: str | None = None,
+    window_days: int = 30,
+    top_k: int = 5,
+) -> dict[str, list[dict]]:
+    """기간 내 타입별로 가장 저렴한 체크인 날짜 조회.
+
+    변동 없는 기준 요금으로 모든 후보 호텔 × 체크인 날짜의 총액을 계산합니다.
+
+    Returns:
+        타입별 [{check_in, check_out, name, total_price, price_per_night}, ...]
+    """
+    check_in = get_check_in_date(window_start)
+    start = np.datetime64(check_in, "D")
+    extra_person_fee = EXTRA_PERSON_FEE * max(0, num_people - 2)
+
+    result = {}
+    for hotel_type in ["budget", "standard", "premium"]:
+        hotels = get_hotel_candidates(destination, hotel_type)
+        base_prices = np.array([h["base_price"] + extra_person_fee for h in hotels])
+
+        # 후보 × 체크인 날짜 총액 → 날짜별 최저가 호텔
+        totals = window_totals(base_prices, destination, check_in, window_days, duration)
+        best_hotel = totals.argmin(axis=0)
+        best_total = totals.min(axis=0)
+
+        order = np.argsort(best_total, kind="stable")[:top_k]
+        result[hotel_type] = [
+            {
+                "check_in": str(start + int(day)),
+                "check_out": str(start + int(day) + duration),
+                "name": hotels[best_hotel[day]]["name"],
+                "total_price": int(round(best_total[day])),
+                "price_per_night": int(round(best_total[day] / duration)),
+            }
+            for day in order
+        ]
+    return result
 
 
 def search_hotels_node(state: TravelState) -> dict:
@@ -212,10 +221,13 @@ def search_hotels_node(state: TravelState) -> dict:
             f"Searching hotels in {destination} for {duration} nights, {num_people} people"
         )
 
-        hotel_options = search_hotels(
-            destination=destination,
-            duration=duration,
-            num_people=num_people,
+        hotel_options = cached_search(
+            hotel_search_key(destination, duration, num_people),
+            lambda: search_hotels(
+                destination=destination,
+                duration=duration,
+                num_people=num_people,
+            ),
         )
 
         logger.info(f"Found {len(hotel_options)} hotel options")
@@ -3,16 +3,23 @@
 사용자와 대화하며 여행 정보를 수집하는 Agent입니다.
 """
 
+import asyncio
 import json
 import logging
 import re
+import time
 from typing import Any
 
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
-
+from src.agents.phase1.history_compactor import build_conversation_context
 from src.config import settings
-from src.models.state import TravelState
+from src.models.state import TravelState, last_message
+from src.tools.llm_batcher import batched_invoke_llm
+from src.tools.llm_client import LLMUnavailableError, is_llm_enabled, should_fallback
+from src.tools.llm_usage import usage_session
+from src.utils.fuzzy_match import FuzzyMatch, TrigramIndex, normalize_name
+from src.utils.geo import get_geo_index
+from src.utils.keyword_automaton import KeywordAutomaton, KeywordMatch
+from src.utils.metrics import metrics
 from src.utils.prompts import INFO_COLLECTOR_SYSTEM_PROMPT, INFO_COLLECTOR_USER_PROMPT
 
 logger = logging.getLogger(__name__)
@@ -54,16 +61,280 @@
 # 여행 스타일 키워드
 TRAVEL_STYLES = ["관광", "맛집", "쇼핑", "휴양", "액티비티", "문화", "자연", "역사"]
 
+# 여행 스타일 동의어 (동의어 -> 스타일)
+STYLE_SYNONYMS = {
+    "먹방": "맛집",
+    "음식": "맛집",
+    "맛있는": "맛집",
+    "구경": "관광",
+    "명소": "관광",
+    "쉬": "휴양",
+    "휴식": "휴양",
+}
+
+# 인원 표현 (표현 -> 인원)
+PEOPLE_WORDS = {
+    "혼자": 1,
+    "나혼자": 1,
+    "둘": 2,
+    "커플": 2,
+    "셋": 3,
+    "넷": 4,
+    "가족": 4,
+}
+
+# 텍스트로 된 예산 (표현 -> 원)
+BUDGET_WORDS = {
+    "백만": 1000000,
+    "이백만": 2000000,
+    "삼백만": 3000000,
+    "오십만": 500000,
+}
+
+
+# 부분 문자열로 찾을 지리 데이터 별칭의 최소 길이 (라틴 문자 / 한글 음절)
+# 이보다 짧은 별칭 (예: "로마", "rome") 은 단어 전체가 일치할 때만 매칭
+GEO_ALIAS_MIN_LETTERS = 5
+GEO_ALIAS_MIN_SYLLABLES = 3
+
+
+def _is_short_alias(alias: str) -> bool:
+    """부분 문자열로 찾기엔 짧은 별칭인지 여부."""
+    syllables = len(re.findall(r"[가-힣]", alias))
+    letters = len(re.findall(r"[a-zA-Z]", alias))
+    return syllables < GEO_ALIAS_MIN_SYLLABLES and letters < GEO_ALIAS_MIN_LETTERS
+
 
-def extract_destination(text: str) -> str | None:
-    """텍스트에서 목적지 추출."""
-    text_lower = text.lower()
+def build_entity_automaton() -> KeywordAutomaton:
+    """도시/스타일/인원/예산 어휘로 키워드 오토마톤 생성."""
+    automaton = KeywordAutomaton()
+
+    # CITY_MAPPING 이 지리 데이터보다 우선
+    for keyword, city in CITY_MAPPING.items():
+        automaton.add(keyword, "city", city)
+    for keyword, city in get_geo_index().city_names.items():
+        if not _is_short_alias(keyword):
+            automaton.add(keyword.lower(), "city", city)
+
+    for style in TRAVEL_STYLES:
+        automaton.add(style, "style", style)
+    for synonym, style in STYLE_SYNONYMS.items():
+        automaton.add(synonym, "style", style)
+
+    for word, count in PEOPLE_WORDS.items():
+        automaton.add(word, "people", count)
+    for word, amount in BUDGET_WORDS.items():
+        automaton.add(word, "budget", amount)
+
+    return automaton.build()
+
+
+def build_destination_index() -> TrigramIndex:
+    """목적지 이름/별칭 (한글/영문) 유사 검색 색인 생성."""
+    index = TrigramIndex()
     for keyword, city in CITY_MAPPING.items():
-        if keyword in text_lower:
-            return city
+        index.add(keyword, city)
+    for keyword, city in get_geo_index().city_names.items():
+        index.add(keyword, city)
+    return index
+
+
+def build_word_aliases() -> dict[str, str]:
+    """단어 전체로만 매칭하는 짧은 지리 데이터 별칭 (별칭 -> 도시)."""
+    return {
+        keyword.lower(): city
+        for keyword, city in get_geo_index().city_names.items()
+        if _is_short_alias(keyword) and keyword.lower() not in CITY_MAPPING
+    }
+
+
+# 시작 시 한 번 컴파일되는 엔티티 오토마톤 / 목적지 유사 검색 색인 / 짧은 별칭
+ENTITY_AUTOMATON = build_entity_automaton()
+DESTINATION_INDEX = build_destination_index()
+WORD_ALIASES = build_word_aliases()
+
+# 유사 매칭 최소 점수 / 다른 도시 후보보다 앞서야 하는 점수 차
+FUZZY_MIN_SCORE = 0.7
+FUZZY_MIN_MARGIN = 0.15
+
+# 유사 매칭 후보의 최소 길이 (한글 음절 / 라틴 문자)
+# 이보다 짧은 후보는 정규화 후 완전 일치 (예: "도꾜", "방꼭") 만 허용
+FUZZY_MIN_SYLLABLES = 3
+FUZZY_MIN_LETTERS = 4
+
+# 목적지 근처에 나오는 표현 (유사 매칭은 이 표현 앞뒤 두 단어 안의 구절만)
+DESTINATION_CUES = ("여행", "가고", "가려", "갈래", "갈까", "가요", "가는", "떠나", "항공", "비행기")
+DESTINATION_CUE_WORDS = {"to", "go", "trip", "travel", "visit", "fly"}
+DESTINATION_CUE_WINDOW = 2
+
+# 단어를 이루는 문자 (도시 이름 앞뒤 경계 검사용)
+WORD_CHAR = re.compile(r"[A-Za-z0-9가-힣]")
+LATIN_CHAR = re.compile(r"[A-Za-z0-9]")
+
+# 목적지 뒤에 붙는 조사/어미 (예: "오사까로", "도꾜에서")
+PARTICLE_SUFFIXES = ("에서", "으로", "이랑", "로", "에", "랑", "는", "은", "가", "이", "도", "요")
+
+
+def extract_entities(text: str) -> list[KeywordMatch]:
+    """메시지를 한 번 훑어 모든 키워드 엔티티와 위치 추출.
+
+    겹치는 후보 중에서는 가장 왼쪽, 같은 위치면 가장 긴 키워드가 선택됩니다.
+    """
+    return ENTITY_AUTOMATON.find_all(text.lower())
+
+
+def _first_entity(entities: list[KeywordMatch], kind: str) -> Any:
+    """해당 종류의 첫 엔티티 값."""
+    return next((m.value for m in entities if m.kind == kind), None)
+
+
+def _is_cue(word: str) -> bool:
+    """목적지 근처에 나오는 표현인지 여부 (예: "여행", "가고", "3박", "to")."""
+    lowered = word.lower()
+    return (
+        lowered in DESTINATION_CUE_WORDS
+        or any(cue in word for cue in DESTINATION_CUES)
+        or re.fullmatch(r"\d+박.*", word) is not None
+    )
+
+
+def _is_word(text: str, match: KeywordMatch) -> bool:
+    """도시 이름이 단어로 쓰였는지 (예: "로마에서" O, "로마자" / "아로마" / "balinese" X).
+
+    앞은 단어 시작이어야 하고, 라틴 이름은 뒤도 라틴 단어 끝이어야 합니다.
+    한글 이름 뒤에는 조사/목적지 표현만 붙을 수 있습니다.
+    """
+    if match.start > 0 and WORD_CHAR.match(text[match.start - 1]):
+        return False
+    if LATIN_CHAR.match(match.keyword[-1]):
+        return match.end >= len(text) or not LATIN_CHAR.match(text[match.end])
+    rest = re.match(r"\S*", text[match.end:])
+    tail = rest.group() if rest else ""
+    if not re.match(r"[가-힣]", tail):
+        return True
+    return tail.startswith(PARTICLE_SUFFIXES) or _is_cue(tail)
+
+
+def _strip_particle(word: str) -> str:
+    """단어 끝의 조사/어미 제거 (예: "오사까로" -> "오사까", 두 글자 미만이 되면 그대로)."""
+    for suffix in PARTICLE_SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 2:
+            return word[: -len(suffix)]
+    return word
+
+
+def _word_alias_match(text: str) -> tuple[int, str] | None:
+    """단어 전체 (조사 제거형 포함) 가 짧은 별칭과 일치하는 첫 도시 (위치, 도시)."""
+    for word in re.finditer(r"[\w-]+", text.lower()):
+        for form in (word.group(), _strip_particle(word.group())):
+            if form in WORD_ALIASES:
+                return word.start(), WORD_ALIASES[form]
     return None
 
 
+def _destination_candidates(text: str) -> list[str]:
+    """유사 매칭에 사용할 후보 구절 (단어, 조사 제거형, 인접 두 단어).
+
+    메시지 전체가 한두 단어 (목적지 질문에 대한 답) 가 아니면
+    목적지 표현 근처의 구절만 후보로 사용합니다.
+    """
+    words = re.findall(r"[\w-]+", text)
+    cue_positions = [i for i, word in enumerate(words) if _is_cue(word)]
+    whole_message = len(words) <= 2
+
+    def near_cue(first: int, last: int) -> bool:
+        return whole_message or any(
+            first - DESTINATION_CUE_WINDOW <= i <= last + DESTINATION_CUE_WINDOW
+            and not first <= i <= last
+            for i in cue_positions
+        )
+
+    candidates = []
+    for i, word in enumerate(words):
+        if near_cue(i, i):
+            candidates.append(word)
+            stem = _strip_particle(word)
+            if stem != word:
+                candidates.append(stem)
+        if i + 1 < len(words) and near_cue(i, i + 1):
+            candidates.append(f"{word} {words[i + 1]}")
+    return candidates
+
+
+def _long_enough(candidate: str) -> bool:
+    """부분 일치를 허용할 만큼 긴 후보인지 (한글 음절 / 라틴 문자 수)."""
+    syllables = len(re.findall(r"[가-힣]", candidate))
+    letters = len(re.findall(r"[a-zA-Z]", candidate))
+    return syllables >= FUZZY_MIN_SYLLABLES or letters >= FUZZY_MIN_LETTERS
+
+
+def fuzzy_match_destination(
+    text: str,
+    min_score: float = FUZZY_MIN_SCORE,
+    min_margin: float = FUZZY_MIN_MARGIN,
+) -> FuzzyMatch | None:
+    """오타/다른 표기를 허용한 목적지 매칭 (가장 높은 점수).
+
+    짧은 후보는 정규화 후 완전 일치만, 긴 후보는 min_score 이상이면서
+    다른 도시의 차순위 후보보다 min_margin 이상 높을 때만 매칭합니다.
+    """
+    best = None
+    for candidate in _destination_candidates(text):
+        if len(normalize_name(candidate)) < 2:
+            continue
+        matches = DESTINATION_INDEX.search(candidate, limit=5)
+        if not matches:
+            continue
+        top = matches[0]
+        if top.score < 1.0:
+            if not _long_enough(candidate) or top.score < min_score:
+                continue
+            runner_up = next((m.score for m in matches if m.value != top.value), 0.0)
+            if top.score - runner_up < min_margin:
+                continue
+        if best is None or top.score > best.score:
+            best = top
+    return best
+
+
+def extract_destination(
+    text: str,
+    entities: list[KeywordMatch] | None = None,
+) -> str | None:
+    """텍스트에서 목적지 추출 (가장 먼저 등장하는 도시).
+
+    짧은 지리 데이터 별칭은 단어 전체가 일치할 때만 찾고,
+    정확히 일치하는 도시가 없으면 유사 매칭으로 찾습니다.
+    """
+    if entities is None:
+        entities = extract_entities(text)
+    hits = [
+        (m.start, m.value) for m in entities if m.kind == "city" and _is_word(text, m)
+    ][:1]
+    word_hit = _word_alias_match(text)
+    if word_hit is not None:
+        hits.append(word_hit)
+    if hits:
+        destination: str = min(hits)[1]
+        return destination
+
+    match = fuzzy_match_destination(text)
+    if match:
+        logger.info(f"Fuzzy destination match: {match.name} ({match.score:.2f})")
+        city: str = match.value
+        return city
+    return None
+
+
+def suggest_nearby_cities(destination: str, k: int = 2) -> list[str]:
+    """지원 도시가 아닌 목적지에 대해 가까운 지원 도시 추천."""
+    served = set(CITY_MAPPING.values())
+    if destination in served:
+        return []
+    nearby = get_geo_index().nearby_cities(destination, k=k, max_km=500, served=served)
+    return [city["name"] for _, city in nearby]
+
+
 def extract_duration(text: str) -> int | None:
     """텍스트에서 기간(박) 추출."""
     # "3박", "3박4일", "3박 4일" 패턴
@@ -83,7 +354,10 @@ def extract_duration(text: str) -> int | None:
     return None
 
 
-def extract_budget(text: str) -> int | None:
+def extract_budget(
+    text: str,
+    entities: list[KeywordMatch] | None = None,
+) -> int | None:
     """텍스트에서 예산 추출."""
     # "100만원", "100만", "1000000원", "백만원" 등
     patterns = [
@@ -97,20 +371,16 @@ def extract_budget(text: str) -> int | None:
             return int(match.group(1)) * multiplier
 
     # 텍스트로 된 숫자
-    text_nums = {
-        "백만": 1000000,
-        "이백만": 2000000,
-        "삼백만": 3000000,
-        "오십만": 500000,
-    }
-    for word, value in text_nums.items():
-        if word in text:
-            return value
-
-    return None
+    if entities is None:
+        entities = extract_entities(text)
+    budget: int | None = _first_entity(entities, "budget")
+    return budget
 
 
-def extract_num_people(text: str) -> int | None:
+def extract_num_people(
+    text: str,
+    entities: list[KeywordMatch] | None = None,
+) -> int | None:
     """텍스트에서 인원 추출."""
     # "2명", "둘이서", "혼자", "가족" 등
     patterns = [
@@ -124,35 +394,24 @@ def extract_num_people(text: str) -> int | None:
             return converter(match.group(1))
 
     # 텍스트 매칭
-    if "혼자" in text or "나혼자" in text:
-        return 1
-    if "둘" in text or "커플" in text:
-        return 2
-    if "셋" in text:
-        return 3
-    if "넷" in text or "가족" in text:
-        return 4
+    if entities is None:
+        entities = extract_entities(text)
+    people: int | None = _first_entity(entities, "people")
+    return people
 
-    return None
 
+def extract_travel_style(
+    text: str,
+    entities: list[KeywordMatch] | None = None,
+) -> list[str] | None:
+    """텍스트에서 여행 스타일 추출 (동의어 포함, 등장 순서)."""
+    if entities is None:
+        entities = extract_entities(text)
 
-def extract_travel_style(text: str) -> list[str] | None:
-    """텍스트에서 여행 스타일 추출."""
     found_styles = []
-    for style in TRAVEL_STYLES:
-        if style in text:
-            found_styles.append(style)
-
-    # 동의어 처리
-    if "먹방" in text or "음식" in text or "맛있는" in text:
-        if "맛집" not in found_styles:
-            found_styles.append("맛집")
-    if "구경" in text or "명소" in text:
-        if "관광" not in found_styles:
-            found_styles.append("관광")
-    if "쉬" in text or "휴식" in text:
-        if "휴양" not in found_styles:
-            found_styles.append("휴양")
+    for match in entities:
+        if match.kind == "style" and match.value not in found_styles:
+            found_styles.append(match.value)
 
     return found_styles if found_styles else None
 
@@ -227,9 +486,9 @@ def info_collector_node(state: TravelState) -> dict:
             ]
         }
 
-    # 마지막 사용자 메시지 가져오기
-    user_messages = [m for m in messages if m.get("role") == "user"]
-    if not user_messages:
+    # 마지막 사용자 메시지 가져오기 (커서로 바로 조회)
+    user_message = last_message(state, "user")
+    if user_message is None:
         return {
             "messages": [
                 {
@@ -239,14 +498,15 @@ def info_collector_node(state: TravelState) -> dict:
             ]
         }
 
-    last_user_message = user_messages[-1]["content"]
+    last_user_message = user_message["content"]
 
-    # 정보 추출
+    # 정보 추출 (키워드 엔티티는 한 번에 추출)
     updates: dict[str, Any] = {}
+    entities = extract_entities(last_user_message)
 
     # 목적지 추출
     if not state.get("destination"):
-        destination = extract_destination(last_user_message)
+        destination = extract_destination(last_user_message, entities)
         if destination:
             updates["destination"] = destination
 
@@ -260,7 +520,7 @@ def info_collector_node(state: TravelState) -> dict:
 
     # 예산 추출
     if not state.get("budget") or state.get("budget", 0) == 0:
-        budget = extract_budget(last_user_message)
+        budget = extract_budget(last_user_message, entities)
         if budget:
             is_valid, error = validate_field("budget", budget)
             if is_valid:
@@ -268,7 +528,7 @@ def info_collector_node(state: TravelState) -> dict:
 
     # 인원 추출
     if not state.get("num_people") or state.get("num_people", 0) == 0:
-        num_people = extract_num_people(last_user_message)
+        num_people = extract_num_people(last_user_message, entities)
         if num_people:
             is_valid, error = validate_field("num_people", num_people)
             if is_valid:
@@ -276,7 +536,7 @@ def info_collector_node(state: TravelState) -> dict:
 
     # 여행 스타일 추출
     if not state.get("travel_style"):
-        travel_style = extract_travel_style(last_user_message)
+        travel_style = extract_travel_style(last_user_message, entities)
         if travel_style:
             updates["travel_style"] = travel_style
 
@@ -306,7 +566,13 @@ def info_collector_node(state: TravelState) -> dict:
         # 이전에 추출한 정보가 있으면 확인 메시지 추가
         confirmation_parts = []
         if "destination" in updates:
-            confirmation_parts.append(f"{updates['destination']}")
+            nearby = suggest_nearby_cities(updates["destination"])
+            if nearby:
+                confirmation_parts.append(
+                    f"{updates['destination']}(가까운 추천 도시: {', '.join(nearby)})"
+                )
+            else:
+                confirmation_parts.append(f"{updates['destination']}")
         if "duration" in updates:
             confirmation_parts.append(f"{updates['duration']}박")
         if "budget" in updates:
@@ -328,81 +594,157 @@ def info_collector_node(state: TravelState) -> dict:
     return updates
 
 
+async def request_llm_extraction(state: TravelState) -> dict:
+    """LLM 정보 추출 요청 후 파싱된 응답 반환.
+
+    Raises:
+        LLMUnavailableError: LLM 을 사용할 수 없을 때
+        json.JSONDecodeError: 응답이 JSON 이 아닐 때
+    """
+    # 현재 상태 정보 포맷팅
+    current_info = {
+        "destination": state.get("destination") or "미정",
+        "duration": f"{state.get('duration')}박" if state.get("duration") else "미정",
+        "budget": f"{state.get('budget'):,}원" if state.get("budget") else "미정",
+        "num_people": f"{state.get('num_people')}명" if state.get("num_people") else "미정",
+        "travel_style": ", ".join(state.get("travel_style", [])) or "미정",
+    }
+
+    user_message = last_message(state, "user")
+
+    prompt = INFO_COLLECTOR_USER_PROMPT.format(
+        user_message=user_message["content"] if user_message else "",
+        conversation_context=build_conversation_context(state),
+        **current_info,
+    )
+
+    # 동시 세션의 추출 요청은 마이크로 배치로 묶어 호출
+    with usage_session(state.get("session_id")):
+        content = await batched_invoke_llm("info_collector", INFO_COLLECTOR_SYSTEM_PROMPT, prompt)
+    extracted: dict = json.loads(content)
+    return extracted
+
+
+def apply_llm_result(result: dict, llm_result: dict) -> dict:
+    """LLM 추출 결과를 규칙 기반 결과에 병합.
+
+    규칙 기반으로 이미 추출한 필드는 유지하고, 검증을 통과한 나머지 필드만 채웁니다.
+    """
+    extracted = llm_result.get("extracted_info") or {}
+
+    for field in ("duration", "budget", "num_people"):
+        if field in result or not extracted.get(field):
+            continue
+        try:
+            value = int(extracted[field])
+        except (TypeError, ValueError):
+            continue
+        if validate_field(field, value)[0]:
+            result[field] = value
+
+    if "destination" not in result and isinstance(extracted.get("destination"), str):
+        result["destination"] = extracted["destination"]
+    if "travel_style" not in result and isinstance(extracted.get("travel_style"), list):
+        result["travel_style"] = extracted["travel_style"]
+
+    if llm_result.get("response"):
+        result["messages"] = [{"role": "assistant", "content": llm_result["response"]}]
+
+    if llm_result.get("info_complete"):
+        result["info_collected"] = True
+        result["current_step"] = "searching_flights"
+
+    return result
+
+
 async def info_collector_node_with_llm(state: TravelState) -> dict:
     """LLM을 사용한 정보 수집 Node (선택적).
 
-    규칙 기반 추출이 실패할 경우 LLM을 사용합니다.
+    헤지 모드(기본)에서는 규칙 기반 추출과 LLM 호출을 동시에 시작합니다.
+    헤지 모드가 꺼져 있으면 규칙 기반 추출이 실패할 경우에만 LLM을 사용합니다.
     """
+    if settings.llm_hedge_enabled and is_llm_enabled():
+        return await info_collector_node_hedged(state)
+
     # 먼저 규칙 기반으로 시도
     result = info_collector_node(state)
 
-    # 정보가 추출되지 않고, OpenAI API 키가 있으면 LLM 사용
+    # 정보가 추출되지 않고, LLM 을 사용할 수 있으면 LLM 사용
     if (
         not result.get("destination")
         and not result.get("duration")
         and not result.get("budget")
         and not result.get("num_people")
         and not result.get("travel_style")
-        and settings.openai_api_key
+        and is_llm_enabled()
     ):
         try:
-            llm = ChatOpenAI(
-                api_key=settings.openai_api_key,
-                model="gpt-4-turbo-preview",
-                temperature=0.7,
-            )
-
-            # 현재 상태 정보 포맷팅
-            current_info = {
-                "destination": state.get("destination") or "미정",
-                "duration": f"{state.get('duration')}박" if state.get("duration") else "미정",
-                "budget": f"{state.get('budget'):,}원" if state.get("budget") else "미정",
-                "num_people": f"{state.get('num_people')}명" if state.get("num_people") else "미정",
-                "travel_style": ", ".join(state.get("travel_style", [])) or "미정",
-            }
+            llm_result = await request_llm_extraction(state)
+            apply_llm_result(result, llm_result)
+
+        except json.JSONDecodeError:
+            logger.warning("Failed to parse LLM response as JSON")
 
-            messages = state.get("messages", [])
-            user_message = messages[-1]["content"] if messages else ""
-
-            prompt = INFO_COLLECTOR_USER_PROMPT.format(
-                user_message=user_message,
-                **current_info,
-            )
-
-            response = await llm.ainvoke([
-                SystemMessage(content=INFO_COLLECTOR_SYSTEM_PROMPT),
-                HumanMessage(content=prompt),
-            ])
-
-            # LLM 응답 파싱
-            try:
-                llm_result = json.loads(response.content)
-                extracted = llm_result.get("extracted_info", {})
-
-                if extracted.get("destination"):
-                    result["destination"] = extracted["destination"]
-                if extracted.get("duration"):
-                    result["duration"] = int(extracted["duration"])
-                if extracted.get("budget"):
-                    result["budget"] = int(extracted["budget"])
-                if extracted.get("num_people"):
-                    result["num_people"] = int(extracted["num_people"])
-                if extracted.get("travel_style"):
-                    result["travel_style"] = extracted["travel_style"]
-
-                if llm_result.get("response"):
-                    result["messages"] = [
-                        {"role": "assistant", "content": llm_result["response"]}
-                    ]
-
-                if llm_result.get("info_complete"):
-                    result["info_collected"] = True
-                    result["current_step"] = "searching_flights"
-
-            except json.JSONDecodeError:
-                logger.warning("Failed to parse LLM response as JSON")
+        except LLMUnavailableError as e:
+            # 규칙 기반 추출 결과를 그대로 사용
+            if not should_fallback(e):
+                raise
+            logger.warning(f"LLM unavailable: {e}, using rule-based result")
+            metrics.incr("llm.fallbacks")
 
         except Exception as e:
             logger.error(f"LLM info extraction failed: {e}")
 
     return result
+
+
+async def info_collector_node_hedged(state: TravelState) -> dict:
+    """규칙 기반 추출과 LLM 추출을 동시에 시작하는 정보 수집 Node.
+
+    - LLM 요청은 메시지 도착 즉시 시작합니다.
+    - 규칙 기반 추출이 누락된 필드를 모두 찾으면 LLM 호출을 취소합니다
+      (배치 대기 중인 요청은 공급자에 보내지 않음).
+    - 그렇지 않으면 마감 시간 안에 규칙이 놓친 필드를 채운 LLM 응답을 사용하고,
+      시간 초과/실패 시 규칙 기반 결과를 반환합니다.
+    """
+    if state.get("info_collected") or last_message(state, "user") is None:
+        return info_collector_node(state)
+
+    started = time.monotonic()
+    # 누락된 필드는 모두 규칙 기반 추출 대상
+    targets = get_missing_fields(state)
+
+    llm_task = asyncio.create_task(request_llm_extraction(state))
+    await asyncio.sleep(0)  # LLM 요청이 먼저 출발하도록 양보
+
+    result = info_collector_node(state)
+    if all(field in result for field in targets):
+        llm_task.cancel()
+        metrics.incr("hedge.rule_wins")
+        return result
+
+    remaining = settings.llm_hedge_deadline_seconds - (time.monotonic() - started)
+    try:
+        llm_result = await asyncio.wait_for(llm_task, timeout=max(remaining, 0))
+    except TimeoutError:
+        logger.warning("LLM extraction missed the deadline, using rule-based result")
+        metrics.incr("hedge.timeouts")
+        return result
+    except LLMUnavailableError as e:
+        if not should_fallback(e):
+            raise
+        logger.warning(f"LLM unavailable: {e}, using rule-based result")
+        metrics.incr("llm.fallbacks")
+        return result
+    except Exception as e:
+        logger.error(f"LLM info extraction failed: {e}")
+        return result
+
+    merged = apply_llm_result(dict(result), llm_result)
+    if not any(field in merged and field not in result for field in targets):
+        metrics.incr("hedge.inadequate")
+        return result
+
+    metrics.incr("hedge.llm_wins")
+    metrics.observe("hedge.llm_ms", (time.monotonic() - started) * 1000)
+    return merged
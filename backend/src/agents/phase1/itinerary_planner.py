@@ -4,160 +4,92 @@
 MVP에서는 하드코딩된 데이터를 사용하고, 추후 LLM/API로 확장합니다.
 """
 
+import asyncio
+import copy
 import json
 import logging
+import math
+import random
+import re
+from collections.abc import AsyncGenerator, Sequence
+from contextlib import aclosing
 from datetime import datetime, timedelta
 from typing import Any
 
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
-
+from src.agents.phase1.day_clusters import get_day_clusters
+from src.agents.phase1.day_scheduler import (
+    DaySchedule,
+    OpeningHours,
+    Placement,
+    Reserved,
+    pack_day,
+    parse_duration_minutes,
+    to_clock,
+    to_minutes,
+)
+from src.agents.phase1.itinerary_search import sample_and_score, score_itineraries
+from src.agents.phase1.itinerary_templates import get_template
+from src.agents.phase1.opening_hours import hours_on, repair_day
+from src.agents.phase1.poi_catalog import (
+    POI,
+    get_spot_catalog,
+    get_spots_for_style,
+    permutation,
+    pick,
+)
+from src.agents.phase1.route_optimizer import optimize_route, route_minutes
 from src.config import settings
-from src.models.state import Activity, DayPlan, TravelState
+from src.models.state import Activity, DayPlan, FlightOption, HotelOption, TravelState
+from src.tools.llm_client import (
+    LLMUnavailableError,
+    has_llm_budget,
+    invoke_llm,
+    is_llm_enabled,
+    should_fallback,
+    stream_llm,
+)
+from src.tools.llm_usage import usage_session
+from src.utils.json_stream import IncrementalJSONParser
+from src.utils.metrics import metrics
 from src.utils.prompts import (
+    ITINERARY_DAY_USER_PROMPT,
     ITINERARY_PLANNER_SYSTEM_PROMPT,
     ITINERARY_PLANNER_USER_PROMPT,
+    ITINERARY_SKELETON_USER_PROMPT,
 )
+from src.utils.validation import matches_typed_dict
 
 logger = logging.getLogger(__name__)
 
-# 목적지별 추천 장소 데이터
-DESTINATION_SPOTS = {
-    "오사카": {
-        "sightseeing": [
-            {"name": "오사카성", "duration": "2시간", "description": "일본 3대 명성 중 하나, 역사적인 성곽"},
-            {"name": "도톤보리", "duration": "2시간", "description": "오사카의 상징적인 번화가, 글리코 사인"},
-            {"name": "신사이바시", "duration": "2시간", "description": "쇼핑과 먹거리의 천국"},
-            {"name": "유니버셜 스튜디오 재팬", "duration": "8시간", "description": "해리포터, 슈퍼 닌텐도 월드"},
-            {"name": "텐노지 동물원", "duration": "3시간", "description": "일본에서 가장 오래된 동물원 중 하나"},
-            {"name": "아베노 하루카스", "duration": "1시간", "description": "일본에서 가장 높은 빌딩, 전망대"},
-            {"name": "구로몬 시장", "duration": "2시간", "description": "오사카의 부엌, 신선한 해산물"},
-        ],
-        "food": [
-            {"name": "타코야키 맛집", "duration": "1시간", "description": "문어가 들어간 오사카 명물"},
-            {"name": "오코노미야키 맛집", "duration": "1시간", "description": "철판에 구운 일본식 전"},
-            {"name": "쿠시카츠 맛집", "duration": "1시간", "description": "꼬치 튀김, 난바 소스에 찍어 먹는"},
-            {"name": "라멘 이치란", "duration": "1시간", "description": "개인 칸막이에서 즐기는 돈코츠 라멘"},
-            {"name": "카이센동 (해산물 덮밥)", "duration": "1시간", "description": "신선한 회 덮밥"},
-        ],
-        "shopping": [
-            {"name": "신사이바시 쇼핑", "duration": "3시간", "description": "패션, 잡화, 드럭스토어"},
-            {"name": "돈키호테", "duration": "2시간", "description": "디스카운트 스토어, 다양한 상품"},
-            {"name": "난바 파크스", "duration": "2시간", "description": "대형 쇼핑몰, 루프탑 가든"},
-        ],
-    },
-    "도쿄": {
-        "sightseeing": [
-            {"name": "센소지", "duration": "2시간", "description": "도쿄에서 가장 오래된 절, 아사쿠사"},
-            {"name": "도쿄 스카이트리", "duration": "2시간", "description": "634m 높이의 전망대"},
-            {"name": "시부야 스크램블 교차로", "duration": "1시간", "description": "세계에서 가장 바쁜 교차로"},
-            {"name": "메이지 신궁", "duration": "2시간", "description": "도심 속 힐링 공간, 하라주쿠"},
-            {"name": "도쿄타워", "duration": "1.5시간", "description": "도쿄의 상징, 야경 명소"},
-            {"name": "우에노 공원", "duration": "3시간", "description": "박물관, 동물원, 벚꽃 명소"},
-            {"name": "츠키지 시장", "duration": "2시간", "description": "신선한 해산물과 먹거리"},
-        ],
-        "food": [
-            {"name": "스시 오마카세", "duration": "1.5시간", "description": "셰프에게 맡기는 초밥 코스"},
-            {"name": "라멘 요코초", "duration": "1시간", "description": "다양한 라멘을 한 곳에서"},
-            {"name": "규카츠", "duration": "1시간", "description": "소고기 커틀릿"},
-            {"name": "몬자야키", "duration": "1시간", "description": "도쿄식 철판 요리"},
-            {"name": "야키토리 골목", "duration": "1.5시간", "description": "꼬치구이와 사케"},
-        ],
-        "shopping": [
-            {"name": "하라주쿠 타케시타 거리", "duration": "2시간", "description": "트렌디한 패션의 중심"},
-            {"name": "긴자 쇼핑", "duration": "3시간", "description": "고급 브랜드 쇼핑가"},
-            {"name": "아키하바라", "duration": "3시간", "description": "전자제품, 애니메이션, 게임"},
-        ],
-    },
-    "방콕": {
-        "sightseeing": [
-            {"name": "왓 프라깨우 (에메랄드 사원)", "duration": "2시간", "description": "태국에서 가장 신성한 사원"},
-            {"name": "왕궁", "duration": "2시간", "description": "화려한 태국 건축의 정수"},
-            {"name": "왓 아룬", "duration": "1.5시간", "description": "새벽 사원, 아름다운 일몰"},
-            {"name": "짜뚜짝 시장", "duration": "4시간", "description": "세계 최대 규모의 주말 시장"},
-            {"name": "카오산 로드", "duration": "3시간", "description": "배낭여행자의 성지"},
-            {"name": "짐 톰슨 하우스", "duration": "1.5시간", "description": "태국 실크 왕의 저택"},
-        ],
-        "food": [
-            {"name": "팟타이", "duration": "1시간", "description": "태국식 볶음 쌀국수"},
-            {"name": "똠얌꿍", "duration": "1시간", "description": "새우 들어간 매콤한 수프"},
-            {"name": "망고 스티키 라이스", "duration": "0.5시간", "description": "달콤한 태국 디저트"},
-            {"name": "길거리 음식 투어", "duration": "2시간", "description": "다양한 로컬 음식 체험"},
-            {"name": "루프탑 바", "duration": "2시간", "description": "방콕 야경과 칵테일"},
-        ],
-        "shopping": [
-            {"name": "터미널 21", "duration": "3시간", "description": "공항 테마 쇼핑몰"},
-            {"name": "씨암 파라곤", "duration": "3시간", "description": "럭셔리 쇼핑몰"},
-            {"name": "아시아티크", "duration": "3시간", "description": "강변 야시장"},
-        ],
-    },
-    "제주": {
-        "sightseeing": [
-            {"name": "성산일출봉", "duration": "2시간", "description": "유네스코 세계자연유산"},
-            {"name": "한라산", "duration": "6시간", "description": "대한민국 최고봉 등반"},
-            {"name": "만장굴", "duration": "1시간", "description": "세계 최장의 용암동굴"},
-            {"name": "우도", "duration": "4시간", "description": "아름다운 섬 안의 섬"},
-            {"name": "주상절리대", "duration": "1시간", "description": "기둥 모양의 절벽"},
-            {"name": "협재해변", "duration": "2시간", "description": "에메랄드빛 해변"},
-        ],
-        "food": [
-            {"name": "흑돼지 구이", "duration": "1.5시간", "description": "제주 대표 먹거리"},
-            {"name": "해물뚝배기", "duration": "1시간", "description": "신선한 해산물 요리"},
-            {"name": "고기국수", "duration": "1시간", "description": "제주 소울푸드"},
-            {"name": "빙떡", "duration": "0.5시간", "description": "메밀전에 무채 싸먹는"},
-            {"name": "카페 투어", "duration": "2시간", "description": "제주 감성 카페"},
-        ],
-        "shopping": [
-            {"name": "동문시장", "duration": "2시간", "description": "제주 전통시장, 야시장"},
-            {"name": "애월 카페거리", "duration": "2시간", "description": "카페와 소품샵"},
-        ],
-    },
-}
-
-# 기본 장소 데이터 (목적지가 없을 경우)
-DEFAULT_SPOTS = {
-    "sightseeing": [
-        {"name": "시내 관광", "duration": "2시간", "description": "주요 명소 둘러보기"},
-        {"name": "전망대", "duration": "1시간", "description": "도시 전경 감상"},
-    ],
-    "food": [
-        {"name": "현지 맛집", "duration": "1시간", "description": "현지 대표 음식"},
-        {"name": "카페", "duration": "1시간", "description": "휴식과 커피"},
-    ],
-    "shopping": [
-        {"name": "쇼핑몰", "duration": "2시간", "description": "쇼핑과 기념품"},
-    ],
-}
-
-
-def get_spots_for_style(destination: str, travel_style: list[str]) -> dict:
-    """여행 스타일에 맞는 장소 가져오기."""
-    spots = DESTINATION_SPOTS.get(destination, DEFAULT_SPOTS)
-
-    # 여행 스타일에 따른 장소 비중 조정
-    style_mapping = {
-        "관광": "sightseeing",
-        "맛집": "food",
-        "쇼핑": "shopping",
-        "휴양": "sightseeing",  # 휴양은 관광지 중 편한 곳으로
-        "액티비티": "sightseeing",
-        "문화": "sightseeing",
-    }
+# 활동 시간 형식 (HH:MM)
+TIME_PATTERN = re.compile(r"\d{2}:\d{2}")
+
+# LLM 응답의 날짜 키 (day1, day2, ...)
+DAY_KEY_PATTERN = re.compile(r"day(\d+)")
 
-    relevant_spots = {}
-    for style in travel_style:
-        category = style_mapping.get(style, "sightseeing")
-        if category in spots:
-            relevant_spots[category] = spots[category]
+# 하루 일정 시간대 (HH:MM)
+DAY_START = "09:00"
+DAY_END = "21:00"
+CHECKOUT_TIME = "10:00"
+LUNCH_TIME = "12:30"
+DINNER_TIME = "18:30"
+FIRST_DAY_DINNER = "18:00"
+NIGHT_WALK_TIME = "20:00"
 
-    # 최소한 관광과 음식은 포함
-    if "sightseeing" not in relevant_spots:
-        relevant_spots["sightseeing"] = spots.get("sightseeing", DEFAULT_SPOTS["sightseeing"])
-    if "food" not in relevant_spots:
-        relevant_spots["food"] = spots.get("food", DEFAULT_SPOTS["food"])
+# 하루에 배치하는 최대 장소 수 (식사 제외)
+DAY_MAX_SPOTS = 3
+FIRST_DAY_MAX_SPOTS = 1
+LAST_DAY_MAX_SPOTS = 2
 
-    return relevant_spots
+# 항공편을 고르지 않았을 때의 출국/귀국편 시각
+DEFAULT_OUTBOUND = {"departure_time": "09:00", "arrival_time": "12:00"}
+DEFAULT_INBOUND = {"departure_time": "15:00", "arrival_time": "17:00"}
 
+# 도착 후 입국 수속 + 숙소 이동 / 체크인 / 숙소 출발부터 귀국편 출발까지 (분)
+ARRIVAL_TRANSFER_MINUTES = 120
+CHECK_IN_MINUTES = 60
+CHECKOUT_MINUTES = 30
+DEPARTURE_BUFFER_MINUTES = 180
 
 def create_activity(
     time: str,
@@ -178,220 +110,333 @@ def create_activity(
     )
 
 
+def spot_activity(
+    start: int,
+    spot: POI,
+    activity_type: str,
+    label: str = "",
+    duration: str | None = None,
+) -> Activity:
+    """장소로 Activity 생성 (start 는 자정 이후 분)."""
+    return create_activity(
+        time=to_clock(start),
+        name=f"{label} - {spot.name}" if label else spot.name,
+        activity_type=activity_type,
+        location=spot.name,
+        duration=duration or spot.duration,
+        description=spot.description,
+    )
+
+
+def placement_activity(placement: Placement) -> Activity:
+    """배치된 관광/쇼핑 장소로 Activity 생성."""
+    activity_type = "shopping" if placement.poi.category == "shopping" else "sightseeing"
+    return spot_activity(placement.start, placement.poi, activity_type)
+
+
+def meal_slot(start: str, spot: POI, key: str, optional: bool = False) -> Reserved:
+    """식당 소요 시간만큼의 식사 고정 일정."""
+    begin = to_minutes(start)
+    return Reserved(begin, begin + parse_duration_minutes(spot.duration), key, optional)
+
+
+def pick_open(
+    spots: Sequence[POI],
+    rng: random.Random,
+    hours: OpeningHours | None,
+    start: int,
+    minutes: int | None = None,
+) -> POI:
+    """start 부터 영업하는 장소 중 하나를 무작위로 선택 (없으면 아무 장소).
+
+    minutes 가 없으면 장소의 소요 시간 동안 영업해야 합니다.
+    """
+    if hours is not None:
+        open_spots = [
+            spot for spot in spots
+            if (intervals := hours(spot)) is None
+            or any(
+                begin <= start and start + (minutes or parse_duration_minutes(spot.duration)) <= end
+                for begin, end in intervals
+            )
+        ]
+        if open_spots:
+            return pick(open_spots, rng)
+    return pick(spots, rng)
+
+
+def route_day(
+    destination: str,
+    schedule: DaySchedule,
+    window: tuple[int, int],
+    reserved: list[Reserved],
+    hotel_area: str | None = None,
+    hours: OpeningHours | None = None,
+) -> DaySchedule:
+    """배치된 장소를 이동 경로 순서(숙소 출발/복귀)로 다시 배치.
+
+    경로 순서대로 모두 다시 들어가면 채택하고, 아니면 원래 배치를 유지합니다.
+    """
+    stops = [placement.poi for placement in schedule.placements]
+    ordered = optimize_route(destination, stops, hotel_area)
+    if ordered != stops:
+        rerouted = pack_day(ordered, window, reserved, max_items=len(ordered), hours=hours)
+        if [placement.poi for placement in rerouted.placements] == ordered:
+            schedule = rerouted
+            stops = ordered
+
+    minutes = route_minutes(destination, stops, hotel_area)
+    if stops and not math.isnan(minutes):
+        metrics.observe("itinerary.route_minutes", minutes)
+    return schedule
+
+
 def generate_day_plan(
     day_num: int,
     date: str,
     destination: str,
-    spots: dict,
+    spots: dict[str, tuple[POI, ...]],
     is_first_day: bool = False,
     is_last_day: bool = False,
     travel_style: list[str] = None,
+    rng: random.Random | None = None,
+    hotel_area: str | None = None,
+    cluster: tuple[POI, ...] = (),
+    flight: FlightOption | None = None,
 ) -> DayPlan:
-    """하루 일정 생성."""
-    import random
-
-    activities = []
+    """하루 일정 생성.
+
+    이동/체크인/식사를 고정 일정으로 두고, 그 사이 빈 시간대에
+    장소 소요 시간에 맞춰 관광/쇼핑 장소를 배치합니다 (day_scheduler).
+    중간 날은 그날 배정된 지역 묶음(cluster)의 장소를 먼저 채웁니다 (day_clusters).
+    배치된 장소는 숙소(hotel_area) 기준 이동 경로 순서로 정렬합니다 (route_optimizer).
+    관광/쇼핑 장소와 식당은 그날 영업 시간 안에만 배치합니다 (opening_hours).
+    첫날/마지막 날의 시간대는 항공편(flight) 도착/출발 시각과 이동 시간으로 정합니다.
+    카탈로그 목록은 수정하지 않고 rng 로 인덱스를 골라 사용합니다.
+    """
+    rng = rng or random.Random()
     travel_style = travel_style or []
+    hours = hours_on(destination, date)
+    timeline: list[tuple[int, Activity]] = []
+    placements = []
+
+    food_spots = spots.get("food", ())
+    sightseeing_spots = spots.get("sightseeing", ())
+    shopping_spots = spots.get("shopping", ())
+    sightseeing_order = [sightseeing_spots[i] for i in permutation(sightseeing_spots, rng)]
 
     if is_first_day:
-        # 첫날: 오후부터 시작
-        activities.append(create_activity(
-            time="09:00",
+        # 첫날: 출국편 도착 → 숙소 이동 → 체크인 후부터 시작
+        outbound = flight["outbound"] if flight else DEFAULT_OUTBOUND
+        departure = to_minutes(outbound["departure_time"])
+        arrival = to_minutes(outbound["arrival_time"])
+        if arrival < departure:
+            arrival += 24 * 60  # 자정을 넘겨 도착
+        check_in = arrival + ARRIVAL_TRANSFER_MINUTES
+        opens = check_in + CHECK_IN_MINUTES
+
+        timeline.append((departure, create_activity(
+            time=outbound["departure_time"],
             name="인천공항 출발",
             activity_type="transport",
             description="출국 수속 및 탑승",
-        ))
-        activities.append(create_activity(
-            time="12:00",
+        )))
+        timeline.append((arrival, create_activity(
+            time=outbound["arrival_time"],
             name=f"{destination} 도착",
             activity_type="transport",
             description="입국 수속 및 숙소 이동",
-        ))
-        activities.append(create_activity(
-            time="14:00",
+        )))
+        timeline.append((check_in, create_activity(
+            time=to_clock(check_in % (24 * 60)),
             name="숙소 체크인",
             activity_type="rest",
             duration="1시간",
             description="짐 정리 및 휴식",
-        ))
-
-        # 오후 활동
-        sightseeing_spots = spots.get("sightseeing", [])
-        if sightseeing_spots:
-            spot = random.choice(sightseeing_spots)
-            activities.append(create_activity(
-                time="15:00",
-                name=spot["name"],
-                activity_type="sightseeing",
-                location=spot["name"],
-                duration=spot["duration"],
-                description=spot["description"],
-            ))
-
-        food_spots = spots.get("food", [])
-        if food_spots:
-            spot = random.choice(food_spots)
-            activities.append(create_activity(
-                time="18:00",
-                name=f"저녁 - {spot['name']}",
-                activity_type="food",
-                location=spot["name"],
-                duration=spot["duration"],
-                description=spot["description"],
-            ))
+        )))
+
+        reserved = []
+        dinner_start = max(to_minutes(FIRST_DAY_DINNER), opens)
+        dinner = pick_open(food_spots, rng, hours, dinner_start) if food_spots else None
+        if dinner:
+            slot = meal_slot(to_clock(dinner_start), dinner, "dinner")
+            if slot.end <= to_minutes(DAY_END):
+                reserved.append(slot)
+
+        # 체크인 이후 활동
+        if opens < to_minutes(DAY_END):
+            schedule = pack_day(
+                sightseeing_order,
+                (opens, to_minutes(DAY_END)),
+                reserved,
+                max_items=FIRST_DAY_MAX_SPOTS,
+                hours=hours,
+            )
+            placements = schedule.placements
+        if reserved and dinner is not None:
+            timeline.append((reserved[0].start, spot_activity(reserved[0].start, dinner, "food", "저녁")))
 
         theme = f"도착 & {destination} 첫 탐방"
 
     elif is_last_day:
-        # 마지막 날: 오전까지
-        food_spots = spots.get("food", [])
-        if food_spots:
-            spot = random.choice(food_spots)
-            activities.append(create_activity(
-                time="08:00",
-                name=f"아침 식사 - {spot['name']}",
-                activity_type="food",
-                location=spot["name"],
-                duration="1시간",
-                description=spot["description"],
-            ))
-
-        activities.append(create_activity(
-            time="10:00",
+        # 마지막 날: 귀국편 출발 시각에 맞춰 숙소 출발
+        inbound = flight["inbound"] if flight else DEFAULT_INBOUND
+        departure = to_minutes(inbound["departure_time"])
+        leave = max(departure - DEPARTURE_BUFFER_MINUTES, 0)
+        checkout = max(min(to_minutes(CHECKOUT_TIME), leave - CHECKOUT_MINUTES), 0)
+        arrival = to_minutes(inbound["arrival_time"])
+        if arrival < departure:
+            arrival += 24 * 60
+
+        if food_spots and to_minutes("08:00") + 60 <= checkout:
+            spot = pick_open(food_spots, rng, hours, to_minutes("08:00"), 60)
+            timeline.append((to_minutes("08:00"), spot_activity(
+                to_minutes("08:00"), spot, "food", "아침 식사", duration="1시간"
+            )))
+
+        timeline.append((checkout, create_activity(
+            time=to_clock(checkout),
             name="숙소 체크아웃",
             activity_type="rest",
             duration="30분",
             description="짐 챙기기",
-        ))
-
-        shopping_spots = spots.get("shopping", [])
-        if shopping_spots:
-            spot = random.choice(shopping_spots)
-            activities.append(create_activity(
-                time="10:30",
-                name=f"마지막 쇼핑 - {spot['name']}",
-                activity_type="shopping",
-                location=spot["name"],
-                duration="1시간",
-                description=spot["description"],
-            ))
+        )))
+
+        # 체크아웃 후 숙소 출발 전까지 남는 시간
+        free = checkout + CHECKOUT_MINUTES
+        if shopping_spots and free + 60 <= leave:
+            spot = pick_open(shopping_spots, rng, hours, free, 60)
+            timeline.append((free, spot_activity(free, spot, "shopping", "마지막 쇼핑", duration="1시간")))
+            free += 60
 
-        activities.append(create_activity(
-            time="12:00",
+        reserved = []
+        meals = {}
+        if food_spots:
+            for clock, key, label in ((LUNCH_TIME, "lunch", "점심"), (DINNER_TIME, "dinner", "저녁")):
+                spot = pick_open(food_spots, rng, hours, to_minutes(clock))
+                slot = meal_slot(clock, spot, key)
+                if free <= slot.start and slot.end <= leave:
+                    reserved.append(slot)
+                    meals[key] = (spot, label)
+
+        if free < leave:
+            schedule = pack_day(
+                sightseeing_order,
+                (free, leave),
+                reserved,
+                max_items=LAST_DAY_MAX_SPOTS,
+                hours=hours,
+            )
+            placements = schedule.placements
+            reserved = schedule.reserved
+        for item in reserved:
+            spot, label = meals[item.key]
+            timeline.append((item.start, spot_activity(item.start, spot, "food", label)))
+
+        timeline.append((leave, create_activity(
+            time=to_clock(leave),
             name="공항 이동",
             activity_type="transport",
             description="공항 버스 또는 택시",
-        ))
-        activities.append(create_activity(
-            time="15:00",
+        )))
+        timeline.append((arrival, create_activity(
+            time=inbound["arrival_time"],
             name="인천공항 도착",
             activity_type="transport",
             description="귀국 완료",
-        ))
+        )))
 
         theme = "마지막 쇼핑 & 귀국"
 
     else:
         # 중간 날: 하루 종일
-        # 아침
-        food_spots = spots.get("food", [])
+        reserved = []
         if food_spots:
-            spot = random.choice(food_spots)
-            activities.append(create_activity(
+            timeline.append((to_minutes("08:00"), create_activity(
                 time="08:00",
                 name=f"아침 식사",
                 activity_type="food",
                 duration="1시간",
                 description="호텔 조식 또는 현지 식당",
-            ))
-
-        # 오전 관광
-        sightseeing_spots = spots.get("sightseeing", [])
-        random.shuffle(sightseeing_spots)
-        for i, spot in enumerate(sightseeing_spots[:2]):
-            time = f"{9 + i * 2:02d}:00"
-            activities.append(create_activity(
-                time=time,
-                name=spot["name"],
-                activity_type="sightseeing",
-                location=spot["name"],
-                duration=spot["duration"],
-                description=spot["description"],
-            ))
-
-        # 점심
-        if food_spots:
-            spot = random.choice(food_spots)
-            activities.append(create_activity(
-                time="12:30",
-                name=f"점심 - {spot['name']}",
-                activity_type="food",
-                location=spot["name"],
-                duration=spot["duration"],
-                description=spot["description"],
-            ))
-
-        # 오후 활동 (스타일에 따라)
-        if "쇼핑" in travel_style:
-            shopping_spots = spots.get("shopping", [])
-            if shopping_spots:
-                spot = random.choice(shopping_spots)
-                activities.append(create_activity(
-                    time="14:00",
-                    name=spot["name"],
-                    activity_type="shopping",
-                    location=spot["name"],
-                    duration=spot["duration"],
-                    description=spot["description"],
-                ))
+            )))
+            lunch = pick_open(food_spots, rng, hours, to_minutes(LUNCH_TIME))
+            dinner = pick_open(food_spots, rng, hours, to_minutes(DINNER_TIME))
+            # 점심은 하루 종일 장소(테마파크, 등산 등)가 대신 차지할 수 있음
+            reserved.append(meal_slot(LUNCH_TIME, lunch, "lunch", optional=True))
+            reserved.append(meal_slot(DINNER_TIME, dinner, "dinner"))
+            meals = {"lunch": (lunch, "점심"), "dinner": (dinner, "저녁")}
         else:
-            if len(sightseeing_spots) > 2:
-                spot = sightseeing_spots[2]
-                activities.append(create_activity(
-                    time="14:00",
-                    name=spot["name"],
-                    activity_type="sightseeing",
-                    location=spot["name"],
-                    duration=spot["duration"],
-                    description=spot["description"],
-                ))
-
-        # 저녁
-        if food_spots:
-            spot = random.choice(food_spots)
-            activities.append(create_activity(
-                time="18:30",
-                name=f"저녁 - {spot['name']}",
-                activity_type="food",
-                location=spot["name"],
-                duration=spot["duration"],
-                description=spot["description"],
-            ))
+            meals = {}
 
-        # 야간 활동
+        # 야간 활동 (저녁 식사 이후)
         if "맛집" in travel_style or "쇼핑" in travel_style:
-            activities.append(create_activity(
-                time="20:00",
+            night = max([to_minutes(NIGHT_WALK_TIME)] + [r.end for r in reserved if r.key == "dinner"])
+            reserved.append(Reserved(night, night + 60, "night"))
+            timeline.append((night, create_activity(
+                time=to_clock(night),
                 name="야경 감상 & 산책",
                 activity_type="sightseeing",
                 duration="1시간",
                 description="도심 야경 즐기기",
-            ))
+            )))
+
+        # 관광: 배정된 지역 묶음 우선 (쇼핑 스타일이면 쇼핑 장소 1곳 포함)
+        members = [cluster[i] for i in permutation(cluster, rng)]
+        candidates = members + [spot for spot in sightseeing_order if spot not in members]
+        has_shopping = any(spot.category == "shopping" for spot in members)
+        if "쇼핑" in travel_style and shopping_spots and not has_shopping:
+            candidates.insert(min(2, len(candidates)), pick(shopping_spots, rng))
+
+        window = (to_minutes(DAY_START), to_minutes(DAY_END))
+        schedule = pack_day(candidates, window, reserved, max_items=DAY_MAX_SPOTS, hours=hours)
+        schedule = route_day(destination, schedule, window, reserved, hotel_area, hours)
+        placements = schedule.placements
+        for item in schedule.reserved:
+            if item.key in meals:
+                spot, label = meals[item.key]
+                timeline.append((item.start, spot_activity(item.start, spot, "food", label)))
 
         theme = f"Day {day_num} - {destination} 탐방"
 
+    for placement in placements:
+        timeline.append((placement.start, placement_activity(placement)))
+
+    timeline.sort(key=lambda item: item[0])
     return DayPlan(
         date=date,
         theme=theme,
-        activities=activities,
+        activities=[activity for _, activity in timeline],
     )
 
 
+def repair_itinerary(itinerary: dict[str, DayPlan], destination: str) -> dict[str, DayPlan]:
+    """날짜순으로 영업시간/휴무일 위반 장소를 교체 (opening_hours)."""
+    used: set[str] = set()
+    repaired = {}
+    for key, day in itinerary.items():
+        day = repair_day(day, destination, used)
+        used.update(location for a in day["activities"] if (location := a.get("location")))
+        repaired[key] = day
+    return repaired
+
+
+def get_trip_dates(duration: int, departure_date: str | None = None) -> list[str]:
+    """여행 날짜 목록 (N박 N+1일, 출발일이 없으면 30일 후 출발)."""
+    if departure_date:
+        start_date = datetime.strptime(departure_date, "%Y-%m-%d")
+    else:
+        start_date = datetime.now() + timedelta(days=30)
+    return [(start_date + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(duration + 1)]
+
+
 def generate_itinerary(
     destination: str,
     duration: int,
     travel_style: list[str],
     departure_date: str | None = None,
+    seed: int | None = None,
+    hotel: HotelOption | None = None,
+    flight: FlightOption | None = None,
 ) -> dict[str, DayPlan]:
     """여행 일정 생성 (MVP: 하드코딩 데이터).
 
@@ -400,25 +445,26 @@ def generate_itinerary(
         duration: 여행 기간 (박)
         travel_style: 여행 스타일 리스트
         departure_date: 출발일 (없으면 30일 후)
+        seed: 장소 선택 난수 시드 (같은 시드면 같은 일정)
+        hotel: 숙소 (있으면 숙소 지역에서 출발/복귀하는 경로로 장소 순서 결정)
+        flight: 항공편 (있으면 도착/출발 시각으로 첫날/마지막 날 시간대 결정)
 
     Returns:
         day1, day2, ... 형식의 일정
     """
-    # 날짜 계산
-    if departure_date:
-        start_date = datetime.strptime(departure_date, "%Y-%m-%d")
-    else:
-        start_date = datetime.now() + timedelta(days=30)
-
-    total_days = duration + 1  # N박 N+1일
+    dates = get_trip_dates(duration, departure_date)
+    total_days = len(dates)  # N박 N+1일
 
     # 스타일에 맞는 장소 가져오기
     spots = get_spots_for_style(destination, travel_style)
+    rng = random.Random(seed)
+
+    # 중간 날(N-1일)별 지역 묶음
+    clusters = get_day_clusters(destination, duration - 1, frozenset(travel_style))
 
     # 일정 생성
     itinerary = {}
-    for day_num in range(1, total_days + 1):
-        date = (start_date + timedelta(days=day_num - 1)).strftime("%Y-%m-%d")
+    for day_num, date in enumerate(dates, start=1):
         is_first = day_num == 1
         is_last = day_num == total_days
 
@@ -430,10 +476,257 @@ def generate_itinerary(
             is_first_day=is_first,
             is_last_day=is_last,
             travel_style=travel_style,
+            rng=rng,
+            hotel_area=hotel["location"] if hotel else None,
+            cluster=clusters[day_num - 2] if 0 <= day_num - 2 < len(clusters) else (),
+            flight=flight,
         )
         itinerary[f"day{day_num}"] = day_plan
 
-    return itinerary
+    return repair_itinerary(itinerary, destination)
+
+
+def search_itinerary(
+    destination: str,
+    duration: int,
+    travel_style: list[str],
+    departure_date: str | None = None,
+    hotel: HotelOption | None = None,
+    seed: int | None = None,
+    flight: FlightOption | None = None,
+) -> dict[str, DayPlan]:
+    """후보 일정을 여러 개 생성해 품질 점수가 가장 높은 일정 선택 (itinerary_search).
+
+    후보 수와 CPU 시간 한도는 settings.itinerary_search_* 로 설정합니다.
+    """
+    hotel_area = hotel["location"] if hotel else None
+    result = sample_and_score(
+        lambda candidate_seed: generate_itinerary(
+            destination, duration, travel_style, departure_date,
+            seed=candidate_seed, hotel=hotel, flight=flight,
+        ),
+        lambda itineraries: score_itineraries(
+            itineraries, destination, travel_style, (DAY_START, DAY_END), hotel_area
+        ),
+        settings.itinerary_search_candidates,
+        settings.itinerary_search_budget_ms,
+        seed=seed,
+    )
+    metrics.incr("itinerary_search.candidates", result.candidates)
+    metrics.observe("itinerary_search.score", result.score)
+    metrics.observe("itinerary_search.cpu_ms", result.elapsed_ms)
+    logger.info(
+        f"Itinerary search: {result.candidates} candidates, "
+        f"score {result.score:.2f}, {result.elapsed_ms:.0f}ms"
+    )
+    return result.itinerary
+
+
+def anchor_day(day: DayPlan, destination: str, hotel_area: str) -> DayPlan:
+    """하루 일정의 관광/쇼핑 장소를 숙소 기준 경로 순서로 재배치 (다른 활동은 유지)."""
+    catalog = get_spot_catalog(destination)
+    pois = {
+        spot.name: spot
+        for category in ("sightseeing", "shopping")
+        for spot in catalog.get(category, ())
+    }
+
+    timeline: list[tuple[int, Activity]] = []
+    placements: list[Placement] = []
+    for activity in day["activities"]:
+        start = to_minutes(activity["time"])
+        poi = pois.get(activity.get("location") or "")
+        if poi is not None and activity["activity"] == poi.name:
+            placements.append(Placement(start, start + parse_duration_minutes(poi.duration), poi))
+        else:
+            timeline.append((start, activity))
+
+    reserved = [
+        Reserved(start, start + parse_duration_minutes(activity.get("duration")), f"fixed{i}")
+        for i, (start, activity) in enumerate(timeline)
+    ]
+    window = (to_minutes(DAY_START), to_minutes(DAY_END))
+    schedule = route_day(
+        destination,
+        DaySchedule(placements, reserved, []),
+        window,
+        reserved,
+        hotel_area,
+        hours_on(destination, day["date"]),
+    )
+
+    timeline.extend((placement.start, placement_activity(placement)) for placement in schedule.placements)
+    timeline.sort(key=lambda item: item[0])
+    return DayPlan(date=day["date"], theme=day["theme"], activities=[a for _, a in timeline])
+
+
+def plan_from_template(
+    destination: str,
+    duration: int,
+    travel_style: list[str],
+    departure_date: str | None = None,
+    hotel: HotelOption | None = None,
+    flight: FlightOption | None = None,
+) -> dict[str, DayPlan]:
+    """캐시된 일정 템플릿에 날짜와 숙소 기준 경로를 적용 (itinerary_templates).
+
+    템플릿이 없으면 숙소/항공편 없이 후보 탐색으로 만들어 보관합니다.
+    항공편이 있으면 첫날/마지막 날은 항공편 시각에 맞춰 다시 생성합니다.
+    """
+    template = get_template(
+        destination,
+        travel_style,
+        duration,
+        lambda: search_itinerary(destination, duration, travel_style),
+    )
+    dates = get_trip_dates(duration, departure_date)
+
+    itinerary = {}
+    for day_num, (date, (theme, activities)) in enumerate(zip(dates, template.days, strict=True), start=1):
+        day = DayPlan(date=date, theme=theme, activities=copy.deepcopy(list(activities)))
+        if hotel and 1 < day_num < len(dates):
+            day = anchor_day(day, destination, hotel["location"])
+        itinerary[f"day{day_num}"] = day
+
+    if flight:
+        for day_num in (1, len(dates)):
+            itinerary[f"day{day_num}"] = regenerate_day_plan(
+                itinerary, day_num, destination, travel_style,
+                theme=itinerary[f"day{day_num}"]["theme"],
+                hotel=hotel, seed=day_num, flight=flight,
+            )
+
+    # 날짜(요일)와 방문 시각이 바뀌었으므로 영업시간 다시 확인
+    return repair_itinerary(itinerary, destination)
+
+
+def regenerate_day_plan(
+    itinerary: dict[str, DayPlan],
+    day_num: int,
+    destination: str,
+    travel_style: list[str],
+    exclude: Sequence[str] = (),
+    theme: str | None = None,
+    hotel: HotelOption | None = None,
+    seed: int | None = None,
+    flight: FlightOption | None = None,
+) -> DayPlan:
+    """하루 일정만 다시 생성 (다른 날짜는 그대로).
+
+    exclude 장소는 항상 제외하고, 다른 날짜에 이미 있는 장소는
+    해당 카테고리에 남는 장소가 있을 때만 제외합니다.
+    """
+    key = f"day{day_num}"
+    used = {
+        activity.get("location")
+        for other, day in itinerary.items()
+        if other != key
+        for activity in day["activities"]
+    }
+    excluded = set(exclude)
+
+    spots = {}
+    for category, candidates in get_spots_for_style(destination, travel_style).items():
+        allowed = tuple(spot for spot in candidates if spot.name not in excluded)
+        spots[category] = tuple(spot for spot in allowed if spot.name not in used) or allowed
+
+    duration = len(itinerary) - 1
+    clusters = get_day_clusters(destination, duration - 1, frozenset(travel_style))
+    cluster = clusters[day_num - 2] if 0 <= day_num - 2 < len(clusters) else ()
+    cluster = tuple(spot for spot in cluster if spot.name not in excluded | used)
+
+    day = generate_day_plan(
+        day_num=day_num,
+        date=itinerary[key]["date"],
+        destination=destination,
+        spots=spots,
+        is_first_day=day_num == 1,
+        is_last_day=day_num == len(itinerary),
+        travel_style=travel_style,
+        rng=random.Random(seed),
+        hotel_area=hotel["location"] if hotel else None,
+        cluster=cluster,
+        flight=flight,
+    )
+    if theme:
+        day["theme"] = theme
+    return day
+
+
+async def regenerate_day(
+    state: TravelState,
+    day_num: int,
+    exclude: Sequence[str] = (),
+    theme: str | None = None,
+    travel_style: list[str] | None = None,
+) -> tuple[DayPlan, str]:
+    """세션 일정의 하루만 다시 생성. (일정, 생성 방식 "llm" | "rules") 반환.
+
+    LLM 을 사용할 수 있으면 해당 날짜 하나만 LLM 으로 생성하고 (하루 분량 토큰),
+    실패하거나 제외 장소가 포함되면 규칙 기반으로 생성합니다.
+    LLM 일정에 다른 날짜의 장소가 있으면 사용하지 않은 장소로 교체합니다.
+    """
+    itinerary = state.get("itinerary", {})
+    destination = state.get("destination", "")
+    travel_style = travel_style or state.get("travel_style", ["관광"])
+    current = itinerary[f"day{day_num}"]
+    avoid = sorted(
+        set(exclude)
+        | {
+            location
+            for other, day in itinerary.items()
+            if other != f"day{day_num}"
+            for activity in day["activities"]
+            if (location := activity.get("location"))
+        }
+    )
+
+    if is_llm_enabled() and has_llm_budget(state.get("session_id")):
+        try:
+            with usage_session(state.get("session_id")):
+                day = await generate_day_with_llm(
+                    day_num, current["date"], theme or current["theme"],
+                    destination, len(itinerary) - 1, travel_style,
+                    asyncio.Semaphore(1), avoid=avoid,
+                )
+            excluded = set(exclude)
+            if day is not None and not any(
+                activity.get("location") in excluded or activity["activity"] in excluded
+                for activity in day["activities"]
+            ):
+                metrics.incr("itinerary.day_regenerations.llm")
+                return repair_day(day, destination, set(avoid), exclude, dedupe=True), "llm"
+        except LLMUnavailableError as e:
+            if not should_fallback(e):
+                raise
+            logger.warning(f"LLM unavailable for day regeneration: {e}")
+            metrics.incr("llm.fallbacks")
+
+    day = regenerate_day_plan(
+        itinerary, day_num, destination, travel_style,
+        exclude=exclude,
+        theme=theme,
+        hotel=select_hotel(state.get("hotel_options", [])),
+        flight=select_flight(state.get("flight_options", [])),
+    )
+    metrics.incr("itinerary.day_regenerations.rules")
+    return repair_day(day, destination, set(avoid), exclude), "rules"
+
+
+def select_flight(flight_options: list[FlightOption]) -> FlightOption | None:
+    """일정 기준 항공편 (standard 우선, 없으면 첫 번째 옵션)."""
+    for flight in flight_options:
+        if flight.get("type") == "standard":
+            return flight
+    return flight_options[0] if flight_options else None
+
+
+def select_hotel(hotel_options: list[HotelOption]) -> HotelOption | None:
+    """일정 기준 숙소 (standard 우선, 없으면 첫 번째 옵션)."""
+    for hotel in hotel_options:
+        if hotel.get("type") == "standard":
+            return hotel
+    return hotel_options[0] if hotel_options else None
 
 
 def plan_itinerary_node(state: TravelState) -> dict:
@@ -464,10 +757,13 @@ def plan_itinerary_node(state: TravelState) -> dict:
             f"Planning itinerary for {destination}, {duration} nights, styles: {travel_style}"
         )
 
-        itinerary = generate_itinerary(
+        plan = plan_from_template if settings.itinerary_template_enabled else search_itinerary
+        itinerary = plan(
             destination=destination,
             duration=duration,
             travel_style=travel_style,
+            hotel=select_hotel(state.get("hotel_options", [])),
+            flight=select_flight(state.get("flight_options", [])),
         )
 
         logger.info(f"Created itinerary with {len(itinerary)} days")
@@ -498,12 +794,243 @@ def plan_itinerary_node(state: TravelState) -> dict:
         }
 
 
+def parse_json_object(content: str) -> dict | None:
+    """LLM 응답을 JSON 객체로 파싱 (실패 시 None)."""
+    try:
+        data = json.loads(content)
+    except (TypeError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def validate_activity(activity: Any) -> bool:
+    """LLM 이 생성한 활동이 Activity 형식인지 검증."""
+    return matches_typed_dict(activity, Activity) and bool(TIME_PATTERN.fullmatch(activity["time"]))
+
+
+def validate_day_plan(day: Any) -> bool:
+    """LLM 이 생성한 하루 일정이 DayPlan 형식인지 검증 (date/theme 는 생략 가능)."""
+    if not isinstance(day, dict):
+        return False
+
+    activities = day.get("activities")
+    if not isinstance(activities, list) or not activities:
+        return False
+    return all(validate_activity(activity) for activity in activities)
+
+
+async def generate_skeleton(
+    destination: str,
+    duration: int,
+    travel_style: list[str],
+) -> dict[str, str]:
+    """날짜별 테마 (일정 뼈대) 생성. 파싱 실패 시 기본 테마 사용."""
+    prompt = ITINERARY_SKELETON_USER_PROMPT.format(
+        destination=destination,
+        duration=duration,
+        days=duration + 1,
+        travel_style=", ".join(travel_style),
+    )
+    content = await invoke_llm(
+        "itinerary_planner",
+        ITINERARY_PLANNER_SYSTEM_PROMPT,
+        prompt,
+        cache_if=lambda c: parse_json_object(c) is not None,
+    )
+
+    data = parse_json_object(content) or {}
+    if not data:
+        logger.warning("Failed to parse itinerary skeleton, using default themes")
+
+    skeleton = {}
+    for day_num in range(1, duration + 2):
+        theme = data.get(f"day{day_num}")
+        skeleton[f"day{day_num}"] = theme if isinstance(theme, str) and theme else f"{destination} {day_num}일차"
+    return skeleton
+
+
+async def generate_day_with_llm(
+    day_num: int,
+    date: str,
+    theme: str,
+    destination: str,
+    duration: int,
+    travel_style: list[str],
+    semaphore: asyncio.Semaphore,
+    avoid: Sequence[str] = (),
+) -> DayPlan | None:
+    """하루 일정 생성. 파싱/검증 실패 시 해당 날짜만 재시도, 모두 실패하면 None.
+
+    avoid 에 있는 장소는 프롬프트로 제외를 요청합니다.
+    """
+    total_days = duration + 1
+    if day_num == 1:
+        day_note = "첫날입니다. 오전 도착을 가정하고 오후부터 일정을 시작하세요."
+    elif day_num == total_days:
+        day_note = "마지막 날입니다. 오후 출발을 가정하고 오전까지만 일정을 잡으세요."
+    else:
+        day_note = ""
+    if avoid:
+        day_note += f"\n다음 장소는 일정에 넣지 마세요: {', '.join(avoid)}"
+
+    prompt = ITINERARY_DAY_USER_PROMPT.format(
+        destination=destination,
+        duration=duration,
+        days=total_days,
+        day_num=day_num,
+        date=date,
+        theme=theme,
+        travel_style=", ".join(travel_style),
+        day_note=day_note,
+    )
+
+    for attempt in range(settings.itinerary_day_max_retries + 1):
+        if attempt:
+            metrics.incr("itinerary.day_retries")
+
+        async with semaphore:
+            try:
+                content = await invoke_llm(
+                    "itinerary_planner",
+                    ITINERARY_PLANNER_SYSTEM_PROMPT,
+                    prompt,
+                    cache_if=lambda c: validate_day_plan(parse_json_object(c)),
+                )
+            except LLMUnavailableError:
+                raise
+            except Exception as e:
+                logger.warning(f"Day {day_num} generation failed: {e}")
+                continue
+
+        day = parse_json_object(content)
+        if day is not None and validate_day_plan(day):
+            return DayPlan(date=date, theme=theme, activities=day["activities"])
+        logger.warning(f"Day {day_num} response invalid (attempt {attempt + 1})")
+
+    return None
+
+
+async def generate_itinerary_per_day(
+    destination: str,
+    duration: int,
+    travel_style: list[str],
+    departure_date: str | None = None,
+) -> dict[str, DayPlan]:
+    """일정 뼈대를 먼저 만든 뒤 날짜별 일정을 동시에 생성.
+
+    전체 지연 시간은 (뼈대 + 하루 일정) 생성 시간 수준이며,
+    끝내 실패한 날짜는 규칙 기반 일정으로 채웁니다.
+    """
+    dates = get_trip_dates(duration, departure_date)
+    skeleton = await generate_skeleton(destination, duration, travel_style)
+
+    semaphore = asyncio.Semaphore(settings.itinerary_day_concurrency)
+    days = await asyncio.gather(*(
+        generate_day_with_llm(
+            day_num, date, skeleton[f"day{day_num}"],
+            destination, duration, travel_style, semaphore,
+        )
+        for day_num, date in enumerate(dates, start=1)
+    ))
+
+    itinerary: dict[str, DayPlan] = {}
+    fallback = None
+    for day_num, day in enumerate(days, start=1):
+        key = f"day{day_num}"
+        if day is None:
+            metrics.incr("itinerary.day_fallbacks")
+            if fallback is None:
+                fallback = generate_itinerary(
+                    destination, duration, travel_style, departure_date=dates[0]
+                )
+            day = fallback[key]
+        itinerary[key] = day
+    return itinerary
+
+
+async def stream_itinerary_with_llm(
+    destination: str,
+    duration: int,
+    travel_style: list[str],
+    departure_date: str | None = None,
+) -> AsyncGenerator[dict, None]:
+    """LLM 일정을 스트리밍으로 생성.
+
+    응답 조각을 증분 JSON 파서에 넣어 활동/하루 일정이 완성되는 즉시 이벤트로 반환합니다.
+    응답이 잘리거나 검증에 실패한 날짜는 마지막에 규칙 기반 일정으로 채웁니다.
+
+    Yields:
+        {"event": "activity", "day", "index", "data"}: 완성된 활동
+        {"event": "day", "day", "data", "fallback"}: 완성된 하루 일정
+        {"event": "done", "itinerary", "llm_days"}: 전체 일정 (영업시간/휴무일 검증 후)
+    """
+    dates = get_trip_dates(duration, departure_date)
+    prompt = ITINERARY_PLANNER_USER_PROMPT.format(
+        destination=destination,
+        duration=duration,
+        days=len(dates),
+        travel_style=", ".join(travel_style),
+    )
+
+    parser = IncrementalJSONParser()
+    itinerary: dict[str, DayPlan] = {}
+
+    stream = stream_llm(
+        "itinerary_planner",
+        ITINERARY_PLANNER_SYSTEM_PROMPT,
+        prompt,
+        cache_if=lambda c: parse_json_object(c) is not None,
+    )
+    # 소비자가 중간에 닫으면 LLM 스트림도 바로 닫아 동시 실행 슬롯 반납
+    async with aclosing(stream):
+        async for chunk in stream:
+            for path, value in parser.feed(chunk):
+                match = DAY_KEY_PATTERN.fullmatch(path[0]) if path and isinstance(path[0], str) else None
+                if not match or not 1 <= int(match.group(1)) <= len(dates):
+                    continue
+                day_key = match.group(0)
+
+                if len(path) == 3 and path[1] == "activities":
+                    if validate_activity(value):
+                        yield {"event": "activity", "day": day_key, "index": path[2], "data": value}
+                    else:
+                        metrics.incr("itinerary.stream_invalid")
+
+                elif len(path) == 1:
+                    if not validate_day_plan(value):
+                        metrics.incr("itinerary.stream_invalid")
+                        continue
+                    day_num = int(match.group(1))
+                    theme = value.get("theme") if isinstance(value.get("theme"), str) else ""
+                    itinerary[day_key] = DayPlan(
+                        date=dates[day_num - 1],
+                        theme=theme or f"{destination} {day_num}일차",
+                        activities=value["activities"],
+                    )
+                    yield {"event": "day", "day": day_key, "data": itinerary[day_key], "fallback": False}
+
+    llm_days = len(itinerary)
+    if llm_days < len(dates):
+        logger.warning(f"Streamed itinerary incomplete ({llm_days}/{len(dates)} days)")
+        fallback = generate_itinerary(destination, duration, travel_style, departure_date=dates[0])
+        for day_num in range(1, len(dates) + 1):
+            day_key = f"day{day_num}"
+            if day_key not in itinerary:
+                metrics.incr("itinerary.day_fallbacks")
+                itinerary[day_key] = fallback[day_key]
+                yield {"event": "day", "day": day_key, "data": itinerary[day_key], "fallback": True}
+
+    ordered = {f"day{n}": itinerary[f"day{n}"] for n in range(1, len(dates) + 1)}
+    yield {"event": "done", "itinerary": repair_itinerary(ordered, destination), "llm_days": llm_days}
+
+
 async def plan_itinerary_with_llm(state: TravelState) -> dict:
     """LLM을 사용한 일정 생성 (선택적).
 
     더 자연스럽고 맞춤화된 일정을 원할 경우 LLM을 사용합니다.
+    ITINERARY_LLM_MODE=per_day 이면 날짜별로 나누어 동시에 생성합니다.
     """
-    if not settings.openai_api_key:
+    if not is_llm_enabled():
         return plan_itinerary_node(state)
 
     destination = state.get("destination", "")
@@ -511,26 +1038,18 @@ async def plan_itinerary_with_llm(state: TravelState) -> dict:
     travel_style = state.get("travel_style", ["관광"])
 
     try:
-        llm = ChatOpenAI(
-            api_key=settings.openai_api_key,
-            model="gpt-4-turbo-preview",
-            temperature=0.8,
-        )
-
-        prompt = ITINERARY_PLANNER_USER_PROMPT.format(
-            destination=destination,
-            duration=duration,
-            days=duration + 1,
-            travel_style=", ".join(travel_style),
-        )
-
-        response = await llm.ainvoke([
-            SystemMessage(content=ITINERARY_PLANNER_SYSTEM_PROMPT),
-            HumanMessage(content=prompt),
-        ])
-
-        # LLM 응답 파싱
-        itinerary = json.loads(response.content)
+        with usage_session(state.get("session_id")):
+            if settings.itinerary_llm_mode == "per_day":
+                itinerary = await generate_itinerary_per_day(destination, duration, travel_style)
+                itinerary = repair_itinerary(itinerary, destination)
+            else:
+                # 스트리밍 응답을 증분 파싱 (잘린 응답도 완성된 날짜는 사용)
+                itinerary = {}
+                async for event in stream_itinerary_with_llm(destination, duration, travel_style):
+                    if event["event"] == "done":
+                        if not event["llm_days"]:
+                            raise ValueError("LLM 응답에서 유효한 일정을 찾지 못했습니다")
+                        itinerary = event["itinerary"]
 
         return {
             "itinerary": itinerary,
@@ -543,6 +1062,13 @@ async def plan_itinerary_with_llm(state: TravelState) -> dict:
             ],
         }
 
+    except LLMUnavailableError as e:
+        if not should_fallback(e):
+            raise
+        logger.warning(f"LLM unavailable: {e}, falling back to rule-based")
+        metrics.incr("llm.fallbacks")
+        return plan_itinerary_node(state)
+
     except Exception as e:
         logger.warning(f"LLM itinerary planning failed: {e}, falling back to rule-based")
         return plan_itinerary_node(state)
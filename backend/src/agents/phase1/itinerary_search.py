@@ -0,0 +1,139 @@
+"""Sample-and-score itinerary search.
+
+규칙 기반 일정은 난수에 따라 품질이 들쭉날쭉하므로, 시드를 바꿔 후보 일정을 여러 개 만들고
+하나의 벡터화된 품질 함수로 한 번에 점수를 매겨 가장 좋은 일정을 고릅니다.
+후보 생성은 정해진 CPU 시간(budget) 안에서만 수행합니다.
+
+품질 = 스타일 충족률 + 카테고리 다양성 - 중복 장소 - 이동 시간 - 빈 시간
+"""
+
+import math
+import random
+import time
+from collections.abc import Callable, Sequence
+from typing import NamedTuple
+
+import numpy as np
+
+from src.agents.phase1.day_scheduler import parse_duration_minutes, to_minutes
+from src.agents.phase1.poi_catalog import STYLE_CATEGORIES, get_spot_catalog
+from src.agents.phase1.route_optimizer import route_minutes
+from src.models.state import DayPlan
+
+CATEGORIES = ("sightseeing", "food", "shopping")
+
+# 품질 점수 가중치 (특성 -> 가중치)
+SCORE_WEIGHTS = {
+    "coverage": 3.0,  # 여행 스타일 카테고리 충족률 (0~1)
+    "diversity": 1.0,  # 방문한 카테고리 비율 (0~1)
+    "duplicates": -1.5,  # 두 번 이상 방문한 장소 수
+    "travel_hours": -0.5,  # 장소 간 이동 시간 합계 (시간)
+    "idle_hours": -0.3,  # 중간 날 빈 시간 합계 (시간)
+}
+
+Itinerary = dict[str, DayPlan]
+
+
+class SearchResult(NamedTuple):
+    """후보 탐색 결과."""
+
+    itinerary: Itinerary
+    score: float
+    candidates: int  # 생성한 후보 수
+    elapsed_ms: float  # 후보 생성 + 점수 계산 CPU 시간
+
+
+def score_itineraries(
+    itineraries: Sequence[Itinerary],
+    destination: str,
+    travel_style: Sequence[str],
+    window: tuple[str, str],
+    hotel_area: str | None = None,
+) -> np.ndarray:
+    """후보 일정 점수 (후보마다 하나, 높을수록 좋음).
+
+    후보별 원시 값(카테고리별 방문 수, 중복 수, 이동/빈 시간)만 모은 뒤
+    특성 계산과 가중합은 모든 후보에 대해 한 번에 수행합니다.
+    """
+    catalog = get_spot_catalog(destination)
+    pois = {spot.name: spot for spots in catalog.values() for spot in spots}
+    day_start, day_end = to_minutes(window[0]), to_minutes(window[1])
+
+    n = len(itineraries)
+    visits = np.zeros((n, len(CATEGORIES)))
+    duplicates = np.zeros(n)
+    travel = np.zeros(n)
+    busy = np.zeros(n)
+    middle_days = np.zeros(n)
+
+    for row, itinerary in enumerate(itineraries):
+        seen: set[str] = set()
+        days = list(itinerary.values())
+        for index, day in enumerate(days):
+            route = []
+            day_busy = 0
+            for activity in day["activities"]:
+                poi = pois.get(activity.get("location") or "")
+                if poi is not None:
+                    visits[row, CATEGORIES.index(poi.category)] += 1
+                    duplicates[row] += poi.name in seen
+                    seen.add(poi.name)
+                    if poi.category != "food":
+                        route.append(poi)
+                if day_start <= to_minutes(activity["time"]) < day_end:
+                    day_busy += parse_duration_minutes(activity.get("duration"))
+
+            minutes = route_minutes(destination, route, hotel_area)
+            travel[row] += 0.0 if math.isnan(minutes) else minutes
+            if 0 < index < len(days) - 1:
+                busy[row] += day_busy
+                middle_days[row] += 1
+
+    required = np.array([
+        category in {STYLE_CATEGORIES.get(style, "sightseeing") for style in travel_style}
+        for category in CATEGORIES
+    ])
+    visited = visits > 0
+    features = {
+        "coverage": (visited & required).sum(axis=1) / max(required.sum(), 1),
+        "diversity": visited.sum(axis=1) / len(CATEGORIES),
+        "duplicates": duplicates,
+        "travel_hours": travel / 60,
+        "idle_hours": np.maximum(middle_days * (day_end - day_start) - busy, 0) / 60,
+    }
+    matrix = np.column_stack([features[name] for name in SCORE_WEIGHTS])
+    scores: np.ndarray = matrix @ np.array(list(SCORE_WEIGHTS.values()))
+    return scores
+
+
+def sample_and_score(
+    generate: Callable[[int], Itinerary],
+    score: Callable[[Sequence[Itinerary]], np.ndarray],
+    max_candidates: int,
+    budget_ms: float,
+    seed: int | None = None,
+) -> SearchResult:
+    """후보 일정을 CPU 시간 한도 안에서 생성하고 가장 점수가 높은 일정 반환.
+
+    Args:
+        generate: 시드 -> 일정
+        score: 후보 목록 -> 점수 배열
+        max_candidates: 최대 후보 수 (최소 1개는 생성)
+        budget_ms: 후보 생성 CPU 시간 한도 (ms, 스레드 기준)
+        seed: 후보 시드를 만드는 난수 시드
+    """
+    rng = random.Random(seed)
+    started = time.thread_time()
+    deadline = started + budget_ms / 1000
+
+    candidates: list[Itinerary] = []
+    while len(candidates) < max(max_candidates, 1):
+        candidates.append(generate(rng.getrandbits(32)))
+        if time.thread_time() >= deadline:
+            break
+
+    scores = score(candidates)
+    best = int(np.argmax(scores))
+    elapsed_ms = (time.thread_time() - started) * 1000
+    return SearchResult(candidates[best], float(scores[best]), len(candidates), elapsed_ms)
+
@@ -0,0 +1,86 @@
+"""Memoized itinerary templates.
+
+같은 (목적지, 스타일 집합, 기간) 요청은 장소 선택/지역 묶음/순서 결정 결과가 같아도 되므로
+후보 탐색까지 끝난 일정을 날짜와 숙소 없이 템플릿으로 보관하고,
+요청마다 날짜(departure_date)와 숙소 기준 경로만 다시 적용합니다.
+
+템플릿은 만들 때 사용한 카탈로그 내용 해시(revision)를 함께 보관하며,
+목적지 카탈로그 내용이 바뀌면 다음 조회 시 다시 만듭니다
+(같은 내용을 캐시에서 밀려났다가 다시 로드한 경우는 그대로 사용).
+"""
+
+import logging
+from collections.abc import Callable
+from typing import NamedTuple
+
+from src.agents.phase1.poi_catalog import catalog_revision, register_derived_cache
+from src.config import settings
+from src.models.state import Activity, DayPlan
+from src.utils.cache import TTLCache
+from src.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class ItineraryTemplate(NamedTuple):
+    """날짜/숙소가 적용되기 전의 일정."""
+
+    revision: str  # 템플릿을 만들 때 사용한 카탈로그 내용 해시
+    days: tuple[tuple[str, tuple[Activity, ...]], ...]  # 날짜순 (테마, 활동 목록)
+
+
+template_cache = TTLCache(
+    maxsize=settings.itinerary_template_max_entries,
+    ttl=settings.itinerary_template_ttl_seconds,
+)
+
+
+def template_key(destination: str, travel_style: list[str], duration: int) -> tuple:
+    """템플릿 캐시 키 (스타일 순서와 중복은 무시)."""
+    return (destination, frozenset(travel_style), duration)
+
+
+def get_template(
+    destination: str,
+    travel_style: list[str],
+    duration: int,
+    build: Callable[[], dict[str, DayPlan]],
+) -> ItineraryTemplate:
+    """캐시된 템플릿을 반환하고, 없거나 카탈로그가 바뀌었으면 build 로 새로 만듦.
+
+    Args:
+        destination: 목적지
+        travel_style: 여행 스타일 리스트
+        duration: 여행 기간 (박)
+        build: 날짜/숙소 없이 일정을 생성하는 함수
+    """
+    key = template_key(destination, travel_style, duration)
+    revision = catalog_revision(destination)
+
+    template: ItineraryTemplate | None = template_cache.get(key)
+    if template is not None and template.revision == revision:
+        metrics.incr("itinerary_template.hits")
+        return template
+    if template is not None:
+        metrics.incr("itinerary_template.stale")
+        logger.info(f"Itinerary template invalidated (catalog changed): {key}")
+
+    metrics.incr("itinerary_template.misses")
+    itinerary = build()
+    template = ItineraryTemplate(
+        revision=revision,
+        days=tuple((day["theme"], tuple(day["activities"])) for day in itinerary.values()),
+    )
+    template_cache.set(key, template)
+    return template
+
+
+def invalidate_templates() -> int:
+    """모든 템플릿 삭제. 삭제한 개수 반환."""
+    count = len(template_cache)
+    template_cache.clear()
+    metrics.incr("itinerary_template.invalidated", count)
+    return count
+
+
+register_derived_cache(template_cache.clear)
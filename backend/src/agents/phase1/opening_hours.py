@@ -0,0 +1,295 @@
+"""Opening-hours validation.
+
+목적지별 장소 영업시간/정기 휴무를 주 단위 분(월요일 00:00 = 0) 구간으로 펼쳐
+정렬된 배열에 보관하고, 활동 하나가 영업 중인지 이분 탐색(O(log n))으로 검사합니다.
+규칙 기반/LLM 일정 모두 검사하며, 영업하지 않는 장소는 같은 카테고리의
+영업 중인 장소로 바꿔 넣고 대체할 장소가 없으면 일정에서 뺍니다.
+"""
+
+import logging
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+
+from src.agents.phase1.day_scheduler import (
+    OpeningHours,
+    parse_duration_minutes,
+    to_minutes,
+)
+from src.agents.phase1.poi_catalog import (
+    OPENING_HOURS,
+    POI,
+    catalog_revision,
+    get_spot_catalog,
+    register_derived_cache,
+)
+from src.models.state import Activity, DayPlan
+from src.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+WEEKDAYS = "월화수목금토일"
+DAY_MINUTES = 24 * 60
+WEEK_MINUTES = 7 * DAY_MINUTES
+
+
+def parse_hours(text: str) -> tuple[int, int]:
+    """"HH:MM-HH:MM" -> (시작, 종료) 분. 종료가 시작보다 이르면 다음 날로 봄."""
+    start, end = (to_minutes(part.strip()) for part in text.split("-"))
+    if end <= start:
+        end += DAY_MINUTES
+    return start, end
+
+
+def _merge(intervals: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """겹치거나 맞닿은 구간 병합 (시작순)."""
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class OpeningHoursIndex:
+    """장소별 주간 영업 구간 (정렬된 시작/종료 배열).
+
+    Args:
+        hours: 장소명 -> {"hours": ["HH:MM-HH:MM", ...], "closed": "월화"}
+    """
+
+    def __init__(self, hours: Mapping[str, Mapping[str, Any]]):
+        self._spans: dict[str, tuple[list[int], list[int]]] = {}
+        for name, spec in hours.items():
+            closed = {WEEKDAYS.index(day) for day in spec.get("closed", "")}
+            intervals = []
+            for weekday in range(7):
+                if weekday in closed:
+                    continue
+                for text in spec["hours"]:
+                    start, end = parse_hours(text)
+                    start += weekday * DAY_MINUTES
+                    end += weekday * DAY_MINUTES
+                    if end > WEEK_MINUTES:  # 일요일 밤 -> 월요일 새벽
+                        intervals.append((0, end - WEEK_MINUTES))
+                        end = WEEK_MINUTES
+                    intervals.append((start, end))
+            merged = _merge(intervals)
+            self._spans[name] = ([s for s, _ in merged], [e for _, e in merged])
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._spans
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def _covers(self, starts: list[int], ends: list[int], start: int, end: int) -> bool:
+        i = bisect_right(starts, start) - 1
+        return i >= 0 and ends[i] >= end
+
+    def is_open(self, name: str, weekday: int, start: int, end: int) -> bool:
+        """weekday(월=0) 의 [start, end) 분 동안 영업하는지 (정보가 없으면 True)."""
+        spans = self._spans.get(name)
+        if spans is None:
+            return True
+        begin = weekday * DAY_MINUTES + start
+        finish = weekday * DAY_MINUTES + end
+        if finish <= WEEK_MINUTES:
+            return self._covers(*spans, begin, finish)
+        return self._covers(*spans, begin, WEEK_MINUTES) and self._covers(
+            *spans, 0, finish - WEEK_MINUTES
+        )
+
+    def day_intervals(self, name: str, weekday: int) -> list[tuple[int, int]] | None:
+        """weekday 에 시작하는 영업 시간대 (그날 0시 기준 분, 정보가 없으면 None)."""
+        spans = self._spans.get(name)
+        if spans is None:
+            return None
+        starts, ends = spans
+        offset = weekday * DAY_MINUTES
+        lo = max(bisect_right(starts, offset) - 1, 0)
+        hi = bisect_right(starts, offset + DAY_MINUTES)
+        return [
+            (max(starts[i], offset) - offset, ends[i] - offset)
+            for i in range(lo, hi)
+            if ends[i] > offset
+        ]
+
+
+def get_opening_hours_index(destination: str) -> OpeningHoursIndex:
+    """목적지 영업시간 인덱스 (첫 호출 시 생성)."""
+    return _opening_hours_index(destination, catalog_revision(destination))
+
+
+@lru_cache(maxsize=64)
+def _opening_hours_index(destination: str, revision: str) -> OpeningHoursIndex:
+    return OpeningHoursIndex(OPENING_HOURS.get(destination, {}))
+
+
+register_derived_cache(_opening_hours_index.cache_clear)
+
+
+def _weekday(date: str | None) -> int | None:
+    try:
+        return datetime.strptime(date or "", "%Y-%m-%d").weekday()
+    except ValueError:
+        return None
+
+
+def hours_on(destination: str, date: str | None) -> OpeningHours | None:
+    """해당 날짜의 장소별 영업 시간대 조회 함수 (pack_day 용, 날짜를 모르면 None)."""
+    weekday = _weekday(date)
+    index = get_opening_hours_index(destination)
+    if weekday is None or not len(index):
+        return None
+    return lambda poi: index.day_intervals(poi.name, weekday)
+
+
+def _interval(activity: Activity) -> tuple[int, int] | None:
+    try:
+        start = to_minutes(activity["time"])
+    except (KeyError, ValueError):
+        return None
+    return start, start + parse_duration_minutes(activity.get("duration"))
+
+
+def find_violations(day: DayPlan, destination: str) -> list[int]:
+    """영업시간/휴무일에 걸리는 활동 인덱스 목록 (날짜를 모르면 빈 목록)."""
+    weekday = _weekday(day.get("date"))
+    index = get_opening_hours_index(destination)
+    if weekday is None or not len(index):
+        return []
+
+    violations = []
+    for i, activity in enumerate(day["activities"]):
+        name = activity.get("location")
+        if not name or name not in index:
+            continue
+        interval = _interval(activity)
+        if interval is not None and not index.is_open(name, weekday, *interval):
+            violations.append(i)
+    return violations
+
+
+def validate_itinerary(itinerary: Mapping[str, DayPlan], destination: str) -> dict[str, list[int]]:
+    """날짜별 위반 활동 인덱스 (위반이 있는 날짜만)."""
+    result = {}
+    for key, day in itinerary.items():
+        violations = find_violations(day, destination)
+        if violations:
+            result[key] = violations
+    return result
+
+
+def count_violations(itineraries: Iterable[Mapping[str, DayPlan]], destination: str) -> list[int]:
+    """여러 일정의 위반 활동 수 (배치 검사)."""
+    return [
+        sum(len(find_violations(day, destination)) for day in itinerary.values())
+        for itinerary in itineraries
+    ]
+
+
+def _replacement(
+    candidates: Sequence[POI],
+    index: OpeningHoursIndex,
+    weekday: int,
+    start: int,
+    slot: int,
+    fixed_slot: bool,
+    exclude: set[str],
+    used: set[str],
+) -> POI | None:
+    """slot 분 안에 끝나고 그 시간에 영업하는 장소 (사용하지 않은 장소 우선)."""
+    fallback = None
+    for poi in candidates:
+        if poi.name in exclude:
+            continue
+        minutes = slot if fixed_slot else parse_duration_minutes(poi.duration)
+        if minutes > slot or not index.is_open(poi.name, weekday, start, start + minutes):
+            continue
+        if poi.name not in used:
+            return poi
+        fallback = fallback or poi
+    return fallback
+
+
+def repair_day(
+    day: DayPlan,
+    destination: str,
+    used: set[str] | None = None,
+    exclude: Iterable[str] = (),
+    dedupe: bool = False,
+) -> DayPlan:
+    """영업하지 않는 장소를 같은 카테고리의 영업 중인 장소로 교체.
+
+    교체 장소는 원래 시간 안에 끝나야 하므로 다른 활동과 겹치지 않습니다.
+    대체할 장소가 없으면 해당 활동을 뺍니다.
+    dedupe 면 used 에 있는 장소도 사용하지 않은 장소로 교체합니다 (없으면 유지).
+
+    Args:
+        day: 하루 일정
+        destination: 목적지
+        used: 다른 날짜에 이미 사용한 장소 (가능하면 피함, 교체한 장소가 추가됨)
+        exclude: 교체 장소로 쓰지 않을 장소
+        dedupe: 다른 날짜에 이미 사용한 장소도 교체할지 여부
+    """
+    used = used if used is not None else set()
+    violations = find_violations(day, destination)
+    duplicates = {
+        i for i, activity in enumerate(day["activities"]) if dedupe and activity.get("location") in used
+    }
+    weekday = _weekday(day["date"])
+    if not (violations or duplicates) or weekday is None:
+        return day
+
+    index = get_opening_hours_index(destination)
+    catalog = get_spot_catalog(destination)
+    pois = {poi.name: poi for spots in catalog.values() for poi in spots}
+
+    activities = list(day["activities"])
+    in_day = {activity["location"] or "" for activity in activities} | set(exclude)
+    dropped = set()
+    for i in sorted(duplicates.union(violations)):
+        activity = activities[i]
+        name = activity["location"]
+        interval = _interval(activity)
+        if name is None or interval is None:  # 시간을 모르는 활동은 그대로
+            continue
+        start, end = interval
+        poi = pois.get(name)
+        category = poi.category if poi else ("food" if activity.get("type") == "food" else "sightseeing")
+        # 라벨이 붙은 활동("점심 - ...", "마지막 쇼핑 - ...")은 시간이 정해진 슬롯
+        fixed_slot = activity.get("activity") != name
+
+        # 중복 교체는 사용하지 않은 장소로만 (영업 중이면 원래 장소 유지)
+        closed = i in violations
+        replacement = _replacement(
+            catalog.get(category, ()), index, weekday, start, end - start, fixed_slot,
+            in_day if closed else in_day | used, used,
+        )
+        if replacement is None and not closed:
+            continue
+        if replacement is None:
+            dropped.add(i)
+            metrics.incr("opening_hours.dropped")
+            logger.info(f"Dropped {name} on {day['date']}: closed and no replacement")
+            continue
+
+        repaired = activity.copy()
+        repaired["activity"] = activity["activity"].replace(name, replacement.name)
+        repaired["location"] = replacement.name
+        repaired["duration"] = activity.get("duration") if fixed_slot else replacement.duration
+        repaired["description"] = replacement.description
+        activities[i] = repaired
+        in_day.add(replacement.name)
+        used.add(replacement.name)
+        metrics.incr("opening_hours.repaired" if closed else "opening_hours.deduplicated")
+
+    return DayPlan(
+        date=day["date"],
+        theme=day["theme"],
+        activities=[a for i, a in enumerate(activities) if i not in dropped],
+    )
@@ -0,0 +1,279 @@
+"""Immutable POI (point of interest) catalog.
+
+목적지별 추천 장소를 불변 레코드(NamedTuple)와 튜플로 고정한 카탈로그입니다.
+요청마다 목록을 섞지 않고 인덱스 순열로 장소를 고르므로
+여러 스레드에서 동시에 일정을 생성해도 공유 데이터가 바뀌지 않습니다.
+
+장소/영업시간/숙소/항공 데이터는 버전이 붙은 데이터 파일(src/data/catalog/v1/)에
+목적지별로 나뉘어 있으며, 목적지를 처음 조회할 때 로드하고 LRU 로 개수를 제한해 보관합니다.
+카탈로그마다 내용 해시(revision)를 두어, 카탈로그에서 계산한 파생 캐시(지역 묶음, 거리 행렬,
+영업시간 인덱스, 일정 템플릿)는 (목적지, revision) 으로 조회합니다.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import random
+import sys
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+from src.config import settings
+from src.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# 카탈로그 데이터 파일 형식 버전 (src/data/catalog/v{버전}/)
+CATALOG_VERSION = 1
+
+# 카탈로그 데이터 디렉터리
+CATALOG_DATA_DIR = (
+    Path(__file__).resolve().parents[2] / "data" / "catalog" / f"v{CATALOG_VERSION}"
+)
+
+
+class POI(NamedTuple):
+    """추천 장소 (불변)."""
+
+    name: str
+    category: str  # sightseeing / food / shopping
+    duration: str  # 예: "2시간"
+    description: str
+    lat: float = math.nan  # 위도 (좌표가 없으면 nan)
+    lon: float = math.nan  # 경도
+
+
+# 카테고리 -> 장소 목록
+SpotCatalog = Mapping[str, tuple[POI, ...]]
+
+# 여행 스타일 -> 장소 카테고리
+STYLE_CATEGORIES = MappingProxyType({
+    "관광": "sightseeing",
+    "맛집": "food",
+    "쇼핑": "shopping",
+    "휴양": "sightseeing",  # 휴양은 관광지 중 편한 곳으로
+    "액티비티": "sightseeing",
+    "문화": "sightseeing",
+})
+
+
+def freeze_spots(raw: dict[str, list[dict]]) -> SpotCatalog:
+    """카테고리별 장소 dict 목록을 불변 카탈로그로 변환 (문자열은 intern)."""
+    return MappingProxyType({
+        sys.intern(category): tuple(
+            POI(
+                name=sys.intern(spot["name"]),
+                category=sys.intern(category),
+                duration=sys.intern(spot["duration"]),
+                description=sys.intern(spot["description"]),
+                lat=spot.get("lat", math.nan),
+                lon=spot.get("lon", math.nan),
+            )
+            for spot in spots
+        )
+        for category, spots in raw.items()
+    })
+
+
+class DestinationCatalog(NamedTuple):
+    """목적지 하나의 카탈로그 (불변)."""
+
+    destination: str
+    spots: SpotCatalog  # 장소 데이터가 없으면 빈 매핑
+    opening_hours: Mapping[str, Mapping[str, Any]]  # 장소명 -> {"hours": [...], "closed": "월"}
+    areas: Mapping[str, tuple[float, float]]  # 숙소 지역 -> (위도, 경도)
+    hotels: Mapping[str, tuple[Mapping[str, Any], ...]]  # 등급 -> 숙소 목록
+    flight: Mapping[str, Any]  # {"airport": 공항 코드, "minutes": 비행 시간, "prices": 등급별 가격}
+    revision: str  # 데이터 내용 해시 (같은 내용을 다시 로드해도 같음)
+
+
+def _read_catalog_file(filename: str) -> dict:
+    """카탈로그 데이터 파일 로드 (형식 버전이 다르면 ValueError)."""
+    path = CATALOG_DATA_DIR / filename
+    with open(path, encoding="utf-8") as f:
+        data: dict = json.load(f)
+    if data.get("version") != CATALOG_VERSION:
+        raise ValueError(
+            f"Unsupported catalog version in {path}: {data.get('version')} "
+            f"(expected {CATALOG_VERSION})"
+        )
+    return data
+
+
+def _freeze(value: Any) -> Any:
+    """JSON 값을 읽기 전용으로 변환 (dict -> MappingProxyType, list -> tuple)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _content_hash(data: dict) -> str:
+    """데이터 내용 해시 (키 순서/공백과 무관)."""
+    text = json.dumps(data, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _freeze_catalog(destination: str, data: dict) -> DestinationCatalog:
+    return DestinationCatalog(
+        destination=destination,
+        spots=freeze_spots(data.get("spots", {})),
+        opening_hours=MappingProxyType({
+            sys.intern(name): _freeze(spec) for name, spec in data.get("opening_hours", {}).items()
+        }),
+        areas=MappingProxyType({
+            sys.intern(area): (lat, lon) for area, (lat, lon) in data.get("areas", {}).items()
+        }),
+        hotels=_freeze(data.get("hotels", {})),
+        flight=_freeze(data.get("flight", {})),
+        revision=_content_hash(data),
+    )
+
+
+@lru_cache
+def load_catalog_manifest() -> dict:
+    """카탈로그 목록 파일 로드 (목적지 -> 데이터 파일명)."""
+    return _read_catalog_file("manifest.json")
+
+
+def catalog_destinations() -> tuple[str, ...]:
+    """카탈로그가 있는 목적지 목록 (데이터 파일은 읽지 않음)."""
+    return tuple(load_catalog_manifest()["destinations"])
+
+
+@lru_cache(maxsize=settings.catalog_cache_size)
+def _load_destination_catalog(destination: str, filename: str) -> DestinationCatalog:
+    catalog = _freeze_catalog(destination, _read_catalog_file(filename))
+    metrics.incr("catalog.loads")
+    logger.info(f"Loaded catalog for {destination} from {filename}")
+    return catalog
+
+
+def get_destination_catalog(destination: str) -> DestinationCatalog | None:
+    """목적지 카탈로그 (없는 목적지는 None).
+
+    처음 조회할 때 데이터 파일을 읽고, 최근에 조회한 목적지
+    CATALOG_CACHE_SIZE 개까지만 메모리에 보관합니다.
+    """
+    filename = load_catalog_manifest()["destinations"].get(destination)
+    if filename is None:
+        return None
+    return _load_destination_catalog(destination, filename)
+
+
+@lru_cache
+def get_default_catalog() -> DestinationCatalog:
+    """카탈로그가 없는 목적지에 사용하는 기본 장소/숙소."""
+    return _freeze_catalog("", _read_catalog_file(load_catalog_manifest()["default"]))
+
+
+def catalog_revision(destination: str) -> str:
+    """목적지 카탈로그 내용 해시 (파생 캐시 키, 기본 장소를 쓰면 기본 카탈로그 해시 포함)."""
+    catalog = get_destination_catalog(destination)
+    default = get_default_catalog().revision
+    if catalog is None:
+        return default
+    return catalog.revision if catalog.spots else f"{catalog.revision}:{default}"
+
+
+# 카탈로그에서 계산한 파생 캐시의 비우기 함수 (reload_catalogs 에서 함께 비움)
+_derived_caches: list[Callable[[], Any]] = []
+
+
+def register_derived_cache(clear: Callable[[], Any]) -> None:
+    """카탈로그를 다시 읽을 때 함께 비울 파생 캐시 등록."""
+    _derived_caches.append(clear)
+
+
+def reload_catalogs() -> None:
+    """카탈로그 데이터 파일을 다시 읽도록 카탈로그와 모든 파생 캐시를 비움."""
+    load_catalog_manifest.cache_clear()
+    _load_destination_catalog.cache_clear()
+    get_default_catalog.cache_clear()
+    for clear in _derived_caches:
+        clear()
+    metrics.incr("catalog.reloads")
+    logger.info(f"Catalogs reloaded ({len(_derived_caches)} derived caches cleared)")
+
+
+def get_spot_catalog(destination: str) -> SpotCatalog:
+    """목적지 장소 카탈로그 (장소 데이터가 없으면 기본 장소)."""
+    catalog = get_destination_catalog(destination)
+    if catalog is not None and catalog.spots:
+        return catalog.spots
+    return get_default_catalog().spots
+
+
+class _CatalogView(Mapping):
+    """목적지 -> 카탈로그 항목을 조회 시점에 로드하는 읽기 전용 매핑.
+
+    항목이 비어 있는 목적지는 없는 것으로 보며,
+    순회하면 모든 목적지의 데이터 파일을 읽습니다.
+    """
+
+    def __init__(self, field: str):
+        self._field = field
+
+    def __getitem__(self, destination: str) -> Any:
+        catalog = get_destination_catalog(destination)
+        value = getattr(catalog, self._field) if catalog is not None else None
+        if not value:
+            raise KeyError(destination)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return (destination for destination in catalog_destinations() if destination in self)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+# 목적지별 추천 장소 (카테고리 -> 장소 목록)
+DESTINATION_SPOTS: Mapping[str, SpotCatalog] = _CatalogView("spots")
+
+# 목적지별 영업시간 (장소명 -> 영업 시간대 "HH:MM-HH:MM" 목록, 정기 휴무 요일)
+# 목록에 없는 장소는 항상 방문 가능, 자정을 넘기는 시간대는 "18:00-02:00" 처럼 표기
+OPENING_HOURS: Mapping[str, Mapping[str, Mapping[str, Any]]] = _CatalogView("opening_hours")
+
+# 목적지별 숙소 지역 좌표 (HotelOption.location -> (위도, 경도))
+AREA_COORDINATES: Mapping[str, Mapping[str, tuple[float, float]]] = _CatalogView("areas")
+
+
+def has_coordinates(poi: POI) -> bool:
+    """좌표가 있는 장소인지 여부."""
+    return not (math.isnan(poi.lat) or math.isnan(poi.lon))
+
+
+def get_spots_for_style(destination: str, travel_style: list[str]) -> dict[str, tuple[POI, ...]]:
+    """여행 스타일에 맞는 카테고리별 장소 (카탈로그 튜플을 그대로 참조)."""
+    spots = get_spot_catalog(destination)
+    default = get_default_catalog().spots
+
+    relevant_spots = {}
+    for style in travel_style:
+        category = STYLE_CATEGORIES.get(style, "sightseeing")
+        if category in spots:
+            relevant_spots[category] = spots[category]
+
+    # 최소한 관광과 음식은 포함
+    if "sightseeing" not in relevant_spots:
+        relevant_spots["sightseeing"] = spots.get("sightseeing", default["sightseeing"])
+    if "food" not in relevant_spots:
+        relevant_spots["food"] = spots.get("food", default["food"])
+
+    return relevant_spots
+
+
+def pick(spots: Sequence[POI], rng: random.Random) -> POI:
+    """장소 하나를 무작위로 선택."""
+    return spots[rng.randrange(len(spots))]
+
+
+def permutation(spots: Sequence[POI], rng: random.Random) -> list[int]:
+    """장소 인덱스의 무작위 순열 (원본 목록은 그대로 둠)."""
+    return rng.sample(range(len(spots)), len(spots))
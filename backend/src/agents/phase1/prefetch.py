@@ -0,0 +1,71 @@
+"""Speculative search prefetch for Phase 1.
+
+정보 수집이 끝나기 전에 목적지와 기간이 확정되면 항공권 검색을,
+인원까지 확정되면 숙박 검색을 미리 시작해 search cache에 보관합니다.
+"""
+
+import logging
+from functools import partial
+
+from src.agents.phase1.flight_searcher import search_flights
+from src.agents.phase1.hotel_searcher import search_hotels
+from src.agents.phase1.info_collector import info_collector_node
+from src.agents.phase1.search_cache import (
+    flight_search_key,
+    hotel_search_key,
+    prefetch,
+)
+from src.config import settings
+from src.models.state import TravelState
+
+logger = logging.getLogger(__name__)
+
+
+def schedule_prefetch(state: TravelState) -> list[str]:
+    """필요한 정보가 모였으면 항공권/숙박 검색을 미리 시작.
+
+    Returns:
+        새로 시작한 검색 종류 목록 ("flights", "hotels")
+    """
+    if not settings.prefetch_enabled or state.get("info_collected"):
+        return []
+
+    destination = state.get("destination")
+    duration = state.get("duration")
+    if not destination or not duration:
+        return []
+
+    scheduled = []
+
+    if prefetch(
+        flight_search_key(destination, duration),
+        partial(search_flights, destination=destination, duration=duration),
+    ):
+        scheduled.append("flights")
+
+    # 숙박 요금은 인원에 따라 달라지므로 인원이 정해진 뒤에만 미리 검색
+    num_people = state.get("num_people")
+    if num_people and prefetch(
+        hotel_search_key(destination, duration, num_people),
+        partial(
+            search_hotels,
+            destination=destination,
+            duration=duration,
+            num_people=num_people,
+        ),
+    ):
+        scheduled.append("hotels")
+
+    if scheduled:
+        logger.info(f"Prefetching {scheduled} for {destination} {duration} nights")
+    return scheduled
+
+
+def collect_info_with_prefetch(state: TravelState) -> dict:
+    """정보 수집 Node + 선행 검색.
+
+    info_collector_node 실행 후, 수집된 정보로 검색을 미리 시작합니다.
+    """
+    updates = info_collector_node(state)
+    schedule_prefetch({**state, **updates})
+    return updates
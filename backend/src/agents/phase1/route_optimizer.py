@@ -0,0 +1,200 @@
+"""Per-day route optimization.
+
+목적지별 장소/숙소 지역 좌표로 이동 거리·시간 행렬(NumPy)을 미리 계산해 두고,
+하루 방문 순서를 최근접 이웃(nearest neighbour)으로 만든 뒤 2-opt 로 개선합니다.
+숙소 좌표가 있으면 숙소에서 출발해 숙소로 돌아오는 순환 경로로 최적화합니다.
+"""
+
+import math
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+from src.agents.phase1.poi_catalog import (
+    AREA_COORDINATES,
+    DESTINATION_SPOTS,
+    POI,
+    catalog_revision,
+    has_coordinates,
+    register_derived_cache,
+)
+from src.utils.geo import EARTH_RADIUS_KM
+
+# 시내 평균 이동 속도 (km/h, 대중교통 기준)
+URBAN_SPEED_KMH = 20.0
+
+# 이동 1회당 기본 소요 시간 (분, 대기/환승)
+TRANSFER_OVERHEAD_MINUTES = 10
+
+# 2-opt 최대 반복 횟수
+TWO_OPT_MAX_ROUNDS = 50
+
+
+def haversine_matrix(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """좌표 목록의 쌍별 대원 거리 행렬 (km)."""
+    phi = np.radians(lats)[:, None]
+    lam = np.radians(lons)[:, None]
+    d_phi = phi - phi.T
+    d_lam = lam - lam.T
+    a = np.sin(d_phi / 2) ** 2 + np.cos(phi) * np.cos(phi.T) * np.sin(d_lam / 2) ** 2
+    km: np.ndarray = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+    return km
+
+
+def travel_minutes(km: np.ndarray) -> np.ndarray:
+    """거리 행렬을 이동 시간 행렬(분)로 변환 (같은 장소는 0)."""
+    minutes = km / URBAN_SPEED_KMH * 60 + TRANSFER_OVERHEAD_MINUTES
+    np.fill_diagonal(minutes, 0.0)
+    return minutes
+
+
+class DistanceMatrix(NamedTuple):
+    """목적지별 거리/이동 시간 행렬."""
+
+    positions: Mapping[str, int]  # 장소명 / "@지역명" -> 행 번호
+    km: np.ndarray
+    minutes: np.ndarray
+
+
+def area_key(area: str) -> str:
+    """숙소 지역의 행렬 키."""
+    return f"@{area}"
+
+
+def get_distance_matrix(destination: str) -> DistanceMatrix | None:
+    """목적지의 장소 + 숙소 지역 거리 행렬 (첫 호출 시 계산, 좌표가 없으면 None)."""
+    return _distance_matrix(destination, catalog_revision(destination))
+
+
+@lru_cache(maxsize=64)
+def _distance_matrix(destination: str, revision: str) -> DistanceMatrix | None:
+    catalog = DESTINATION_SPOTS.get(destination)
+    if catalog is None:
+        return None
+
+    points: dict[str, tuple[float, float]] = {}
+    for spots in catalog.values():
+        for spot in spots:
+            if has_coordinates(spot):
+                points.setdefault(spot.name, (spot.lat, spot.lon))
+    for area, point in AREA_COORDINATES.get(destination, {}).items():
+        points[area_key(area)] = point
+    if not points:
+        return None
+
+    coords = np.array(list(points.values()), dtype=np.float64)
+    km = haversine_matrix(coords[:, 0], coords[:, 1])
+    km.setflags(write=False)
+    minutes = travel_minutes(km)
+    minutes.setflags(write=False)
+    return DistanceMatrix({name: i for i, name in enumerate(points)}, km, minutes)
+
+
+register_derived_cache(_distance_matrix.cache_clear)
+
+
+def route_length(dist: np.ndarray, tour: Sequence[int], closed: bool) -> float:
+    """경로 길이 (closed 이면 출발점으로 복귀 포함)."""
+    order = np.asarray(tour, dtype=np.intp)
+    total = float(dist[order[:-1], order[1:]].sum())
+    if closed and len(order) > 1:
+        total += float(dist[order[-1], order[0]])
+    return total
+
+
+def nearest_neighbor_tour(dist: np.ndarray, start: int = 0) -> list[int]:
+    """최근접 이웃 경로."""
+    n = len(dist)
+    visited = np.zeros(n, dtype=bool)
+    tour = [start]
+    visited[start] = True
+    for _ in range(n - 1):
+        row = np.where(visited, np.inf, dist[tour[-1]])
+        nxt = int(np.argmin(row))
+        tour.append(nxt)
+        visited[nxt] = True
+    return tour
+
+
+def two_opt(dist: np.ndarray, tour: list[int], closed: bool) -> list[int]:
+    """2-opt 개선 (첫 지점은 고정).
+
+    모든 (i, j) 구간 뒤집기의 거리 변화를 한 번에 계산하고
+    가장 많이 줄어드는 뒤집기를 더 이상 개선이 없을 때까지 반복합니다.
+    """
+    tour = list(tour)
+    n = len(tour)
+    if n < 4 - (0 if closed else 1):
+        return tour
+
+    for _ in range(TWO_OPT_MAX_ROUNDS):
+        t = np.array(tour + [tour[0]] if closed else tour)
+        # 간선 (t[i-1], t[i]) 와 (t[j], t[j+1]) 를 (t[i-1], t[j]), (t[i], t[j+1]) 로 교체
+        i, j = np.triu_indices(n, k=1)
+        valid = i >= 1
+        if not closed:
+            valid &= j <= n - 1
+        i, j = i[valid], j[valid]
+        a, b = t[i - 1], t[i]
+        c = t[j]
+        if closed:
+            d = t[j + 1]
+            delta = dist[a, c] + dist[b, d] - dist[a, b] - dist[c, d]
+        else:
+            has_next = j + 1 < n
+            d = t[np.minimum(j + 1, n - 1)]
+            delta = dist[a, c] - dist[a, b] + np.where(has_next, dist[b, d] - dist[c, d], 0.0)
+
+        if not len(delta):
+            break
+        best = int(np.argmin(delta))
+        if delta[best] >= -1e-9:
+            break
+        lo, hi = int(i[best]), int(j[best])
+        tour[lo : hi + 1] = reversed(tour[lo : hi + 1])
+    return tour
+
+
+def optimize_route(
+    destination: str,
+    stops: Sequence[POI],
+    hotel_area: str | None = None,
+) -> list[POI]:
+    """하루 방문 장소의 이동 순서 최적화.
+
+    숙소 지역 좌표가 있으면 숙소에서 출발/복귀하는 순환 경로,
+    없으면 첫 장소에서 시작하는 열린 경로로 최적화합니다.
+    좌표가 없는 장소가 있으면 원래 순서를 유지합니다.
+    """
+    if len(stops) < 2:
+        return list(stops)
+    matrix = get_distance_matrix(destination)
+    if matrix is None or any(stop.name not in matrix.positions for stop in stops):
+        return list(stops)
+
+    rows = [matrix.positions[stop.name] for stop in stops]
+    anchor = matrix.positions.get(area_key(hotel_area)) if hotel_area else None
+    if anchor is not None:
+        rows = [anchor] + rows
+    closed = anchor is not None
+
+    dist = matrix.minutes[np.ix_(rows, rows)]
+    tour = two_opt(dist, nearest_neighbor_tour(dist, 0), closed)
+
+    order = [k - 1 for k in tour[1:]] if closed else tour
+    return [stops[k] for k in order]
+
+
+def route_minutes(destination: str, stops: Sequence[POI], hotel_area: str | None = None) -> float:
+    """방문 순서대로의 총 이동 시간 (분, 계산할 수 없으면 nan)."""
+    matrix = get_distance_matrix(destination)
+    if matrix is None or any(stop.name not in matrix.positions for stop in stops):
+        return math.nan
+
+    rows = [matrix.positions[stop.name] for stop in stops]
+    anchor = matrix.positions.get(area_key(hotel_area)) if hotel_area else None
+    if anchor is not None:
+        rows = [anchor] + rows
+    return route_length(matrix.minutes, rows, closed=anchor is not None)
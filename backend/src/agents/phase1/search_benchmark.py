@@ -0,0 +1,59 @@
+"""Itinerary search benchmark.
+
+후보 수에 따라 초당 후보 생성 수와 선택된 일정의 품질 점수가 어떻게 변하는지 측정합니다.
+
+    uv run python -m src.agents.phase1.search_benchmark --candidates 1,10,100,500
+"""
+
+import argparse
+import math
+from collections.abc import Sequence
+from typing import cast
+
+import numpy as np
+
+from src.agents.phase1.itinerary_planner import DAY_END, DAY_START, generate_itinerary
+from src.agents.phase1.itinerary_search import (
+    Itinerary,
+    sample_and_score,
+    score_itineraries,
+)
+from src.models.state import HotelOption
+
+
+def main() -> None:
+    """CLI 진입점."""
+    parser = argparse.ArgumentParser(description="Itinerary sample-and-score benchmark")
+    parser.add_argument("--destination", default="오사카")
+    parser.add_argument("--duration", type=int, default=3)
+    parser.add_argument("--styles", default="관광,맛집,쇼핑")
+    parser.add_argument("--hotel-area", default="난바")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--candidates", default="1,10,50,100,200,500")
+    args = parser.parse_args()
+
+    styles = args.styles.split(",")
+    # 경로 계산에는 숙소 지역만 쓰임
+    hotel = cast(HotelOption, {"location": args.hotel_area}) if args.hotel_area else None
+
+    def generate(seed: int) -> Itinerary:
+        return generate_itinerary(args.destination, args.duration, styles, seed=seed, hotel=hotel)
+
+    def score(itineraries: Sequence[Itinerary]) -> np.ndarray:
+        return score_itineraries(
+            itineraries, args.destination, styles, (DAY_START, DAY_END), args.hotel_area
+        )
+
+    print(f"{'candidates':>10} {'cand/s':>10} {'ms/search':>10} {'score':>8}")
+    for count in [int(c) for c in args.candidates.split(",")]:
+        results = [
+            sample_and_score(generate, score, count, math.inf, seed=run) for run in range(args.runs)
+        ]
+        elapsed = sum(r.elapsed_ms for r in results)
+        rate = sum(r.candidates for r in results) / (elapsed / 1000)
+        quality = sum(r.score for r in results) / len(results)
+        print(f"{count:>10} {rate:>10.0f} {elapsed / len(results):>10.1f} {quality:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
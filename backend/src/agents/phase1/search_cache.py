@@ -0,0 +1,116 @@
+"""Search result cache for Phase 1.
+
+항공권/숙박 검색 결과를 보관하는 캐시입니다.
+정보 수집 중 미리 시작한 (speculative) 검색 결과도 여기에 보관됩니다.
+"""
+
+import copy
+import logging
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from src.config import settings
+from src.utils.cache import TTLCache
+from src.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class SearchEntry:
+    """캐시 항목 (진행 중이거나 완료된 검색)."""
+
+    __slots__ = ("future", "speculative", "used")
+
+    def __init__(self, future: Future, speculative: bool, used: bool = False):
+        self.future = future
+        self.speculative = speculative
+        self.used = used
+
+
+def _on_evict(key: Hashable, entry: SearchEntry) -> None:
+    """사용되지 않고 버려진 선행 검색 집계."""
+    if entry.speculative and not entry.used:
+        metrics.incr("prefetch.wasted")
+        logger.debug(f"Speculative search wasted: {key}")
+
+
+search_cache = TTLCache(
+    maxsize=settings.search_cache_max_entries,
+    ttl=settings.search_cache_ttl_seconds,
+    on_evict=_on_evict,
+)
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.prefetch_workers,
+    thread_name_prefix="search-prefetch",
+)
+
+
+def flight_search_key(
+    destination: str,
+    duration: int,
+    departure_date: str | None = None,
+) -> tuple:
+    """항공권 검색 캐시 키."""
+    return ("flights", destination, duration, departure_date)
+
+
+def hotel_search_key(
+    destination: str,
+    duration: int,
+    num_people: int,
+    departure_date: str | None = None,
+) -> tuple:
+    """숙박 검색 캐시 키."""
+    return ("hotels", destination, duration, num_people, departure_date)
+
+
+def _store(key: Hashable, entry: SearchEntry) -> None:
+    """항목 저장 (저장할 때마다 만료된 항목을 정리해 버려진 선행 검색을 집계)."""
+    search_cache.purge_expired()
+    search_cache.set(key, entry)
+
+
+def prefetch(key: Hashable, search: Callable[[], Any]) -> bool:
+    """백그라운드에서 검색을 시작하고 결과를 캐시에 보관.
+
+    Returns:
+        새로 시작했으면 True, 이미 캐시에 있으면 False
+    """
+    if search_cache.get(key) is not None:
+        return False
+
+    future = _executor.submit(search)
+    _store(key, SearchEntry(future, speculative=True))
+    metrics.incr("prefetch.scheduled")
+    return True
+
+
+def cached_search(key: Hashable, search: Callable[[], Any]) -> Any:
+    """캐시된 결과가 있으면 사용하고, 없으면 검색 후 캐시에 보관.
+
+    진행 중인 선행 검색이 있으면 완료를 기다립니다.
+    """
+    entry: SearchEntry | None = search_cache.get(key)
+    if entry is not None:
+        try:
+            result = entry.future.result()
+        except Exception as e:
+            logger.warning(f"Prefetched search failed, searching again: {e}")
+            search_cache.pop(key)
+            metrics.incr("prefetch.failed")
+        else:
+            if entry.speculative and not entry.used:
+                metrics.incr("prefetch.hits")
+            entry.used = True
+            metrics.incr("search_cache.hits")
+            return copy.deepcopy(result)
+
+    metrics.incr("search_cache.misses")
+    result = search()
+
+    future: Future = Future()
+    future.set_result(result)
+    _store(key, SearchEntry(future, speculative=False, used=True))
+    return copy.deepcopy(result)
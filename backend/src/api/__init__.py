@@ -1,11 +1,13 @@
 """FastAPI routers for TripMate AI."""
 
 from src.api.chat import router as chat_router
+from src.api.destinations import router as destinations_router
 from src.api.plan import router as plan_router
 from src.api.sessions import router as sessions_router
 
 __all__ = [
     "chat_router",
+    "destinations_router",
     "plan_router",
     "sessions_router",
 ]
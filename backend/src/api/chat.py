@@ -3,18 +3,36 @@
 대화형 여행 플래너 API 엔드포인트입니다.
 """
 
+import asyncio
 import json
 import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from datetime import datetime
 from typing import Any
 from uuid import uuid4
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from src.agents.phase1.history_compactor import (
+    compact_history,
+    delete_archived_messages,
+    load_archived_messages,
+)
+from src.agents.phase1.itinerary_planner import stream_itinerary_with_llm
 from src.graph.phase1_graph import get_phase1_graph
-from src.models.state import TravelState, create_initial_state
+from src.models.state import (
+    TravelState,
+    append_message,
+    create_initial_state,
+    last_message,
+    sync_message_cursor,
+)
+from src.tools.llm_client import LLMUnavailableError, has_llm_budget, is_llm_enabled
+from src.tools.llm_usage import usage_session
 
 logger = logging.getLogger(__name__)
 
@@ -121,6 +139,62 @@ def get_progress(state: TravelState) -> dict:
     }
 
 
+async def run_chat_turn(request: ChatRequest) -> tuple[TravelState, ChatResponse]:
+    """메시지 한 턴 처리 (워크플로우 실행 + 히스토리 압축 + 세션 저장)."""
+    # 세션 ID 확인 또는 생성
+    session_id = request.session_id or str(uuid4())
+
+    # 기존 세션 로드 또는 새 세션 생성
+    state = load_session(session_id)
+    if state is None:
+        state = create_initial_state(session_id)
+        logger.info(f"Created new session: {session_id}")
+    else:
+        logger.info(f"Loaded existing session: {session_id}")
+
+    # 사용자 메시지 추가
+    append_message(state, "user", request.message)
+    state["updated_at"] = datetime.now().isoformat()
+
+    # LangGraph 워크플로우 실행 (일정 탐색 등 CPU 작업이 이벤트 루프를 막지 않도록 스레드에서)
+    graph = get_phase1_graph()
+    result = await asyncio.to_thread(graph.invoke, dict(state))
+
+    # 결과를 TravelState로 변환 (이번 턴에 추가된 메시지만 커서에 반영)
+    updated_state = TravelState(**{**state, **result})
+    sync_message_cursor(updated_state)
+
+    # 히스토리가 길면 오래된 메시지를 요약으로 압축
+    await compact_history(updated_state)
+
+    # 세션 저장
+    save_session(session_id, updated_state)
+
+    # 마지막 Assistant 메시지 가져오기
+    reply_message = last_message(updated_state, "assistant")
+    last_reply = reply_message["content"] if reply_message else ""
+
+    # 진행 상태 계산
+    progress = get_progress(updated_state)
+
+    response = ChatResponse(
+        reply=last_reply,
+        session_id=session_id,
+        state={
+            "destination": updated_state.get("destination", ""),
+            "duration": updated_state.get("duration", 0),
+            "budget": updated_state.get("budget", 0),
+            "num_people": updated_state.get("num_people", 0),
+            "travel_style": updated_state.get("travel_style", []),
+            "info_collected": updated_state.get("info_collected", False),
+            "current_step": updated_state.get("current_step", "collecting"),
+        },
+        progress=progress,
+        is_complete=updated_state.get("current_step") == "done",
+    )
+    return updated_state, response
+
+
 @router.post("", response_model=ChatResponse)
 async def chat(request: ChatRequest):
     """채팅 API 엔드포인트.
@@ -128,73 +202,93 @@ async def chat(request: ChatRequest):
     사용자 메시지를 받아 AI Agent 응답을 반환합니다.
     """
     try:
-        # 세션 ID 확인 또는 생성
-        session_id = request.session_id or str(uuid4())
-
-        # 기존 세션 로드 또는 새 세션 생성
-        state = load_session(session_id)
-        if state is None:
-            state = create_initial_state(session_id)
-            logger.info(f"Created new session: {session_id}")
-        else:
-            logger.info(f"Loaded existing session: {session_id}")
-
-        # 사용자 메시지 추가
-        messages = list(state.get("messages", []))
-        messages.append({"role": "user", "content": request.message})
-        state["messages"] = messages
-        state["updated_at"] = datetime.now().isoformat()
-
-        # LangGraph 워크플로우 실행
-        graph = get_phase1_graph()
-        result = graph.invoke(dict(state))
-
-        # 결과를 TravelState로 변환
-        updated_state = TravelState(**{**state, **result})
-
-        # 세션 저장
-        save_session(session_id, updated_state)
-
-        # 마지막 Assistant 메시지 가져오기
-        all_messages = updated_state.get("messages", [])
-        assistant_messages = [m for m in all_messages if m.get("role") == "assistant"]
-        last_reply = assistant_messages[-1]["content"] if assistant_messages else ""
-
-        # 진행 상태 계산
-        progress = get_progress(updated_state)
-
-        # 응답 반환
-        return ChatResponse(
-            reply=last_reply,
-            session_id=session_id,
-            state={
-                "destination": updated_state.get("destination", ""),
-                "duration": updated_state.get("duration", 0),
-                "budget": updated_state.get("budget", 0),
-                "num_people": updated_state.get("num_people", 0),
-                "travel_style": updated_state.get("travel_style", []),
-                "info_collected": updated_state.get("info_collected", False),
-                "current_step": updated_state.get("current_step", "collecting"),
-            },
-            progress=progress,
-            is_complete=updated_state.get("current_step") == "done",
-        )
+        _, response = await run_chat_turn(request)
+        return response
+
+    except LLMUnavailableError:
+        raise
 
     except Exception as e:
         logger.exception(f"Chat error: {e}")
         raise HTTPException(status_code=500, detail=f"처리 중 오류 발생: {str(e)}")
 
 
+def format_sse(event: str, data: Any) -> str:
+    """Server-Sent Events 메시지 포맷."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def stream_chat_events(request: ChatRequest) -> AsyncIterator[str]:
+    """스트리밍 채팅 이벤트 생성.
+
+    1. message: 이번 턴의 응답 (ChatResponse 와 같은 형식)
+    2. activity / day: 계획이 완료된 턴이면 LLM 일정을 완성되는 대로 전송
+    3. done: 종료
+    """
+    try:
+        previous = load_session(request.session_id) if request.session_id else None
+        was_complete = previous is not None and previous.get("current_step") == "done"
+
+        state, response = await run_chat_turn(request)
+        yield format_sse("message", response.model_dump())
+
+        if (
+            response.is_complete
+            and not was_complete
+            and is_llm_enabled()
+            and has_llm_budget(response.session_id)
+        ):
+            events = stream_itinerary_with_llm(
+                state.get("destination", ""),
+                state.get("duration", 3),
+                state.get("travel_style") or ["관광"],
+            )
+            # 클라이언트 연결이 끊기면 일정 스트림도 바로 닫음
+            with usage_session(response.session_id):
+                async with aclosing(events):
+                    async for event in events:
+                        if event["event"] == "done":
+                            state["itinerary"] = event["itinerary"]
+                            save_session(response.session_id, state)
+                            yield format_sse("itinerary", event["itinerary"])
+                        else:
+                            yield format_sse(event["event"], {k: v for k, v in event.items() if k != "event"})
+
+        yield format_sse("done", {"session_id": response.session_id})
+
+    except LLMUnavailableError as e:
+        yield format_sse("error", {"error": "LLM_UNAVAILABLE", "details": str(e)})
+
+    except Exception as e:
+        logger.exception(f"Chat stream error: {e}")
+        yield format_sse("error", {"error": "INTERNAL_ERROR", "details": str(e)})
+
+
+@router.post("/stream")
+async def chat_stream(request: ChatRequest) -> StreamingResponse:
+    """스트리밍 채팅 API 엔드포인트 (Server-Sent Events)."""
+    return StreamingResponse(stream_chat_events(request), media_type="text/event-stream")
+
+
 @router.get("/{session_id}/history")
-async def get_chat_history(session_id: str):
-    """대화 히스토리 조회."""
+async def get_chat_history(session_id: str, include_archived: bool = False):
+    """대화 히스토리 조회.
+
+    include_archived=true 이면 압축되어 cold storage 로 옮긴 메시지도 앞에 붙여 반환합니다.
+    """
     state = load_session(session_id)
     if state is None:
         raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
 
+    messages = state.get("messages", [])
+    if include_archived and state.get("archived_messages"):
+        messages = load_archived_messages(session_id) + messages
+
     return {
         "session_id": session_id,
-        "messages": state.get("messages", []),
+        "messages": messages,
+        "summary": state.get("history_summary", ""),
+        "archived_messages": state.get("archived_messages", 0),
         "created_at": state.get("created_at"),
         "updated_at": state.get("updated_at"),
     }
@@ -211,6 +305,7 @@ async def delete_session(session_id: str):
     filepath = os.path.join(SESSIONS_DIR, f"{session_id}.json")
     if os.path.exists(filepath):
         os.remove(filepath)
+        delete_archived_messages(session_id)
         return {"message": "세션이 삭제되었습니다", "session_id": session_id}
 
     raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
@@ -0,0 +1,64 @@
+"""Destinations API Router for TripMate AI.
+
+목적지 탐색 API 엔드포인트입니다.
+"""
+
+import logging
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel, Field
+
+from src.agents.phase1.cost_table import get_cost_table
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/destinations", tags=["destinations"])
+
+
+class AffordableDestination(BaseModel):
+    """예산 내 목적지 모델."""
+
+    destination: str
+    tier: str = Field(..., description="가장 저렴한 등급")
+    estimated_total: int = Field(..., description="예상 총비용 (원)")
+    slack: int = Field(..., description="예산 대비 여유 금액 (원)")
+    feasible_tiers: dict[str, int] = Field(..., description="예산 내 등급별 총비용")
+
+
+class AffordableResponse(BaseModel):
+    """예산 내 목적지 목록 응답 모델."""
+
+    budget: int
+    duration: int
+    people: int
+    destinations: list[AffordableDestination]
+    total: int
+
+
+@router.get("/affordable", response_model=AffordableResponse)
+async def get_affordable_destinations(
+    budget: int = Query(..., ge=100000, le=10000000, description="1인 예산 (원)"),
+    duration: int = Query(3, ge=1, le=14, description="기간 (박)"),
+    people: int = Query(2, ge=1, le=10, description="인원"),
+    check_in: str | None = Query(None, description="체크인 날짜 (YYYY-MM-DD, 없으면 30일 후)"),
+) -> AffordableResponse:
+    """예산으로 갈 수 있는 목적지를 여유 금액 순으로 조회."""
+    if check_in is not None:
+        try:
+            datetime.strptime(check_in, "%Y-%m-%d")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail="체크인 날짜 형식은 YYYY-MM-DD 입니다") from e
+
+    destinations = [
+        AffordableDestination(**item)
+        for item in get_cost_table(check_in).affordable(budget, duration, people)
+    ]
+
+    return AffordableResponse(
+        budget=budget,
+        duration=duration,
+        people=people,
+        destinations=destinations,
+        total=len(destinations),
+    )
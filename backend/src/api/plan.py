@@ -6,12 +6,17 @@
 import json
 import logging
 import os
-from typing import Any
+from datetime import datetime
+from typing import Annotated, Any
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException, Path, Query
+from pydantic import BaseModel, Field, StringConstraints
 
-from src.models.state import TravelState
+from src.agents.phase1.cost_table import estimate_local_costs
+from src.agents.phase1.hotel_searcher import cheapest_check_in_dates
+from src.agents.phase1.itinerary_planner import regenerate_day
+from src.api import chat
+from src.models.state import TravelState, last_message
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +69,16 @@ class BudgetBreakdown(BaseModel):
     total: int
 
 
+class RegenerateDayRequest(BaseModel):
+    """하루 일정 재생성 요청 모델."""
+
+    exclude: list[Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]] = Field(
+        default_factory=list, description="제외할 장소 이름 (정확히 일치하는 장소만 제외)"
+    )
+    theme: str | None = Field(None, max_length=100, description="새 테마")
+    travel_style: list[str] | None = Field(None, description="이 날짜에만 적용할 여행 스타일")
+
+
 class PlanResponse(BaseModel):
     """여행 계획 응답 모델."""
 
@@ -132,9 +147,10 @@ async def get_plan(session_id: str):
 
     flight_total = recommended_flight.get("price", 0) * num_people
     hotel_total = recommended_hotel.get("total_price", 0)
-    food_estimate = 50000 * (duration + 1) * num_people
-    transport_estimate = 30000 * num_people
-    activity_estimate = 20000 * (duration + 1) * num_people
+    local_costs = estimate_local_costs(duration, num_people)
+    food_estimate = local_costs["food"]
+    transport_estimate = local_costs["transport"]
+    activity_estimate = local_costs["attractions"]
 
     budget_breakdown = {
         "flights": flight_total,
@@ -201,6 +217,47 @@ async def get_hotel_options(session_id: str):
     }
 
 
+@router.get("/{session_id}/hotels/calendar")
+async def get_hotel_calendar(
+    session_id: str,
+    start: str | None = Query(None, description="조회 시작일 (YYYY-MM-DD, 없으면 30일 후)"),
+    window: int = Query(30, ge=1, le=180, description="조회 기간 (일)"),
+    top: int = Query(5, ge=1, le=30, description="타입별 결과 개수"),
+) -> dict[str, Any]:
+    """기간 내 가장 저렴한 체크인 날짜 조회."""
+    state = load_session(session_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
+
+    destination = state.get("destination", "")
+    duration = state.get("duration", 0)
+    if not destination or not duration:
+        raise HTTPException(status_code=400, detail="목적지와 기간 정보가 필요합니다")
+
+    if start is not None:
+        try:
+            datetime.strptime(start, "%Y-%m-%d")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail="시작일 형식은 YYYY-MM-DD 입니다") from e
+
+    calendar = cheapest_check_in_dates(
+        destination=destination,
+        duration=duration,
+        num_people=state.get("num_people") or 2,
+        window_start=start,
+        window_days=window,
+        top_k=top,
+    )
+
+    return {
+        "session_id": session_id,
+        "destination": destination,
+        "duration": duration,
+        "window_days": window,
+        "cheapest_dates": calendar,
+    }
+
+
 @router.get("/{session_id}/itinerary")
 async def get_itinerary(session_id: str):
     """일정만 조회."""
@@ -221,6 +278,42 @@ async def get_itinerary(session_id: str):
     }
 
 
+@router.post("/{session_id}/itinerary/{day}/regenerate")
+async def regenerate_itinerary_day(
+    session_id: str,
+    request: RegenerateDayRequest,
+    day: int = Path(..., ge=1, description="다시 만들 날짜 (1부터)"),
+) -> dict[str, Any]:
+    """하루 일정만 다시 생성 (다른 날짜 일정과 장소는 유지)."""
+    # 채팅 세션 저장소와 같은 상태를 수정 (메모리 우선)
+    state = chat.load_session(session_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
+
+    itinerary = state.get("itinerary", {})
+    if f"day{day}" not in itinerary:
+        raise HTTPException(status_code=404, detail="해당 날짜의 일정이 없습니다")
+
+    day_plan, source = await regenerate_day(
+        state,
+        day,
+        exclude=request.exclude,
+        theme=request.theme,
+        travel_style=request.travel_style,
+    )
+
+    state["itinerary"] = {**itinerary, f"day{day}": day_plan}
+    state["updated_at"] = datetime.now().isoformat()
+    chat.save_session(session_id, state)
+
+    return {
+        "session_id": session_id,
+        "day": day,
+        "source": source,
+        "plan": day_plan,
+    }
+
+
 @router.get("/{session_id}/summary")
 async def get_plan_summary(session_id: str):
     """여행 계획 요약 조회 (마크다운 형식)."""
@@ -232,11 +325,10 @@ async def get_plan_summary(session_id: str):
         raise HTTPException(status_code=400, detail="여행 계획이 아직 완성되지 않았습니다")
 
     # 마지막 메시지가 마크다운 요약
-    messages = state.get("messages", [])
-    assistant_messages = [m for m in messages if m.get("role") == "assistant"]
+    summary_message = last_message(state, "assistant")
 
-    if assistant_messages:
-        summary = assistant_messages[-1]["content"]
+    if summary_message:
+        summary = summary_message["content"]
     else:
         summary = "요약을 생성할 수 없습니다"
 
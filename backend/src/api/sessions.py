@@ -6,11 +6,15 @@
 import json
 import logging
 import os
-from datetime import datetime
-from typing import Any
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
+
+from src.agents.phase1.history_compactor import (
+    HISTORY_NAMESPACE,
+    delete_archived_messages,
+)
+from src.utils.store import get_local_store
 
 logger = logging.getLogger(__name__)
 
@@ -111,6 +115,7 @@ async def delete_session(session_id: str):
         raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
 
     os.remove(filepath)
+    delete_archived_messages(session_id)
 
     return {
         "message": "세션이 삭제되었습니다",
@@ -136,6 +141,8 @@ async def delete_all_sessions():
         except Exception as e:
             logger.warning(f"Failed to delete session {filename}: {e}")
 
+    get_local_store().clear(HISTORY_NAMESPACE)
+
     return {
         "message": f"{deleted_count}개 세션이 삭제되었습니다",
         "deleted_count": deleted_count,
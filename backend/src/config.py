@@ -18,6 +18,74 @@ class Settings(BaseSettings):
 
     # OpenAI
     openai_api_key: str = ""
+    openai_base_url: str = ""  # OpenAI 호환 서버 (예: 로컬 스텁)
+
+    # LLM Client
+    llm_timeout_seconds: float = 60.0
+    llm_max_connections: int = 20
+    llm_max_keepalive_connections: int = 10
+    info_collector_model: str = "gpt-4-turbo-preview"
+    info_collector_temperature: float = 0.7
+    itinerary_planner_model: str = "gpt-4-turbo-preview"
+    itinerary_planner_temperature: float = 0.8
+
+    # LLM Itinerary Generation
+    itinerary_llm_mode: Literal["single", "per_day"] = "per_day"
+    itinerary_day_concurrency: int = 4
+    itinerary_day_max_retries: int = 2
+
+    # Itinerary Search (후보 일정 생성 후 점수로 선택)
+    itinerary_search_candidates: int = 200  # 1 이면 후보 하나만 생성
+    itinerary_search_budget_ms: float = 150.0  # 후보 생성 CPU 시간 한도
+
+    # Itinerary Templates (목적지/스타일/기간별 일정 재사용)
+    itinerary_template_enabled: bool = True
+    itinerary_template_max_entries: int = 512
+    itinerary_template_ttl_seconds: int = 21600
+
+    # Destination Catalog (목적지별 데이터 파일 지연 로딩)
+    catalog_cache_size: int = 32  # 메모리에 보관할 목적지 수
+
+    # LLM Bulkhead (동시 실행 제한 / 부하 차단)
+    llm_max_concurrency: int = 16
+    llm_max_queue: int = 64
+    llm_queue_timeout_seconds: float = 2.0
+    llm_fallback_to_rules: bool = True  # False 면 503 LLM_UNAVAILABLE 반환
+
+    # Hedged Extraction (규칙 기반 + LLM 동시 실행)
+    llm_hedge_enabled: bool = True
+    llm_hedge_deadline_seconds: float = 3.0
+
+    # LLM Micro-batching
+    llm_batch_enabled: bool = True
+    llm_batch_window_ms: float = 5.0
+    llm_batch_max_size: int = 32
+    llm_batch_max_concurrency: int = 8
+
+    # LLM Response Cache
+    llm_cache_enabled: bool = True
+    llm_cache_ttl_seconds: int = 86400
+    llm_semantic_cache_enabled: bool = False
+    llm_semantic_cache_threshold: float = 0.9
+
+    # Conversation History Compaction
+    history_compaction_enabled: bool = True
+    history_max_messages: int = 40  # 초과 시 오래된 메시지를 요약으로 압축
+    history_keep_messages: int = 10  # 압축 후 원문으로 남기는 최근 메시지 수
+    history_llm_summary_enabled: bool = True  # LLM 사용 가능 시 LLM 요약
+    history_prompt_messages: int = 6  # LLM 프롬프트에 포함하는 최근 메시지 수
+
+    # LLM Usage & Spend Quotas (0 이면 한도 없음)
+    llm_quota_window_seconds: int = 3600
+    llm_session_cost_limit_usd: float = 0.5
+    llm_global_cost_limit_usd: float = 20.0
+    usage_flush_interval_seconds: float = 30.0
+
+    # Local Store
+    local_store_path: str = "cache/tripmate.sqlite3"
+    local_store_max_entries: int = 10000
+    # 항목 수 제한 (LRU 제거) 을 적용하지 않는 네임스페이스 (대화 원문 보관 등)
+    local_store_unbounded_namespaces: list[str] = ["history"]
 
     # External APIs (Optional)
     skyscanner_api_key: str = ""
@@ -34,6 +102,12 @@ class Settings(BaseSettings):
     # CORS
     frontend_url: str = "http://localhost:3000"
 
+    # Search Cache & Prefetch
+    search_cache_ttl_seconds: int = 600
+    search_cache_max_entries: int = 1024
+    prefetch_enabled: bool = True
+    prefetch_workers: int = 4
+
     # Logging
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
 
@@ -11,11 +11,12 @@
 from langgraph.graph import END, StateGraph
 
 from src.agents.phase1 import (
-    info_collector_node,
+    collect_info_with_prefetch,
     plan_itinerary_node,
     search_flights_node,
     search_hotels_node,
 )
+from src.agents.phase1.cost_table import estimate_local_costs
 from src.models.state import TravelState, create_initial_state
 
 logger = logging.getLogger(__name__)
@@ -155,9 +156,10 @@ def generate_response_node(state: TravelState) -> dict:
 
     flight_total = recommended_flight.get("price", 0) * num_people
     hotel_total = recommended_hotel.get("total_price", 0)
-    food_estimate = 50000 * (duration + 1) * num_people  # 1인 1일 5만원
-    transport_estimate = 30000 * num_people  # 현지 교통비
-    activity_estimate = 20000 * (duration + 1) * num_people  # 관광비
+    local_costs = estimate_local_costs(duration, num_people)
+    food_estimate = local_costs["food"]  # 1인 1일 5만원
+    transport_estimate = local_costs["transport"]  # 현지 교통비
+    activity_estimate = local_costs["attractions"]  # 관광비
 
     total = flight_total + hotel_total + food_estimate + transport_estimate + activity_estimate
     budget_total = budget * num_people
@@ -201,7 +203,7 @@ def create_phase1_graph() -> StateGraph:
     workflow = StateGraph(TravelState)
 
     # Node 추가
-    workflow.add_node("collect_info", info_collector_node)
+    workflow.add_node("collect_info", collect_info_with_prefetch)
     workflow.add_node("search_flights", search_flights_node)
     workflow.add_node("search_hotels", search_hotels_node)
     workflow.add_node("plan_itinerary", plan_itinerary_node)
@@ -1,13 +1,16 @@
 """Data models for TripMate AI."""
 
 from src.models.state import (
-    TravelState,
-    FlightOption,
-    HotelOption,
     Activity,
     DayPlan,
+    FlightOption,
+    HotelOption,
     Message,
+    TravelState,
+    append_message,
     create_initial_state,
+    last_message,
+    sync_message_cursor,
 )
 
 __all__ = [
@@ -18,4 +21,7 @@
     "DayPlan",
     "Message",
     "create_initial_state",
+    "append_message",
+    "last_message",
+    "sync_message_cursor",
 ]
@@ -1,7 +1,8 @@
 """Travel State definitions for LangGraph workflow."""
 
 from datetime import datetime
-from typing import Literal, TypedDict
+from operator import add
+from typing import Annotated, Literal, NotRequired, TypedDict
 
 
 class FlightOption(TypedDict):
@@ -25,6 +26,8 @@ class HotelOption(TypedDict):
     rating: float
     amenities: list[str]
     distance_from_center: str
+    check_in: NotRequired[str]  # 체크인 날짜 (YYYY-MM-DD)
+    nightly_prices: NotRequired[list[int]]  # 숙박일별 요금 (원)
 
 
 class Activity(TypedDict):
@@ -82,7 +85,10 @@ class TravelState(TypedDict, total=False):
     itinerary: dict[str, DayPlan]  # 일정 (day1, day2, ...)
 
     # === 대화 히스토리 ===
-    messages: list[Message]  # 채팅 히스토리
+    messages: Annotated[list[Message], add]  # 채팅 히스토리 (Node 가 반환한 메시지는 뒤에 추가)
+    message_cursor: dict[str, int]  # 역할별 마지막 메시지 인덱스
+    history_summary: str  # 압축된 이전 대화 요약
+    archived_messages: int  # cold storage 로 옮긴 메시지 수
 
     # === 메타 정보 ===
     session_id: str  # 세션 ID
@@ -116,8 +122,55 @@ def create_initial_state(session_id: str) -> TravelState:
         hotel_options=[],
         itinerary={},
         messages=[],
+        message_cursor={},
+        history_summary="",
+        archived_messages=0,
         session_id=session_id,
         created_at=now,
         updated_at=now,
         error=None,
     )
+
+
+def get_message_cursor(state: TravelState) -> dict[str, int]:
+    """역할별 마지막 메시지 인덱스.
+
+    저장된 커서 이후에 추가된 메시지만 확인하므로
+    매 턴 전체 히스토리를 다시 훑지 않습니다.
+    """
+    messages = state.get("messages", [])
+    cursor = dict(state.get("message_cursor") or {})
+    start = max(cursor.values(), default=-1) + 1
+    if start > len(messages):
+        # 히스토리가 교체된 경우 처음부터 다시 계산
+        cursor, start = {}, 0
+
+    for index in range(start, len(messages)):
+        cursor[messages[index].get("role", "")] = index
+    return cursor
+
+
+def sync_message_cursor(state: TravelState) -> dict[str, int]:
+    """커서를 최신 메시지까지 갱신하여 state 에 저장."""
+    cursor = get_message_cursor(state)
+    state["message_cursor"] = cursor
+    return cursor
+
+
+def append_message(
+    state: TravelState, role: Literal["user", "assistant", "system"], content: str
+) -> None:
+    """메시지를 추가하고 커서 갱신 (state 를 직접 수정)."""
+    cursor = get_message_cursor(state)
+    messages = state.setdefault("messages", [])
+    messages.append(Message(role=role, content=content))
+    cursor[role] = len(messages) - 1
+    state["message_cursor"] = cursor
+
+
+def last_message(state: TravelState, role: str) -> Message | None:
+    """역할별 마지막 메시지 (없으면 None)."""
+    index = get_message_cursor(state).get(role)
+    if index is None:
+        return None
+    return state["messages"][index]
@@ -0,0 +1,135 @@
+"""Bulkhead (concurrency limiter) for external dependencies.
+
+외부 의존성마다 동시 실행 수를 제한하고, 대기열 길이와 대기 시간에 상한을 둡니다.
+대기열이 가득 찼거나 제한 시간 안에 차례가 오지 않을 것으로 예상되면
+기다리지 않고 즉시 BulkheadRejectedError 를 발생시켜 호출자가 빠르게 대체 경로로 전환하게 합니다.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from src.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# 평균 점유 시간 이동 평균 가중치
+HOLD_TIME_ALPHA = 0.2
+
+
+class BulkheadRejectedError(Exception):
+    """Bulkhead 가 요청을 거절함 (대기열 초과/시간 초과)."""
+
+
+class Bulkhead:
+    """asyncio 동시 실행 제한기.
+
+    Args:
+        name: 의존성 이름 (지표 접두사)
+        max_concurrency: 최대 동시 실행 수
+        max_queue: 최대 대기 요청 수
+        timeout: 최대 대기 시간 (초)
+    """
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: int, timeout: float):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.active = 0
+        self.avg_hold_seconds = 0.0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        """대기 중인 요청 수."""
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    def estimated_wait(self) -> float:
+        """새 요청의 예상 대기 시간 (초)."""
+        return (self.queued + 1) * self.avg_hold_seconds / max(self.max_concurrency, 1)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """실행 슬롯 획득. 획득하지 못하면 BulkheadRejectedError."""
+        await self._enter()
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            held = time.monotonic() - started
+            self.avg_hold_seconds += HOLD_TIME_ALPHA * (held - self.avg_hold_seconds)
+            self._release()
+
+    async def _enter(self) -> None:
+        if self.active < self.max_concurrency and not self.queued:
+            self.active += 1
+            metrics.observe(f"bulkhead.{self.name}.queue_ms", 0)
+            return
+
+        if self.queued >= self.max_queue:
+            self._reject("queue_full")
+        if self.estimated_wait() > self.timeout:
+            self._reject("deadline")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(waiter, self.timeout)
+        except (TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 넘겨받은 직후 취소된 경우 반납
+                self._release()
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            self._reject("timeout")
+        finally:
+            metrics.observe(f"bulkhead.{self.name}.queue_ms", (time.monotonic() - started) * 1000)
+
+    def _release(self) -> None:
+        # 대기자가 있으면 슬롯을 그대로 넘겨줌
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def _reject(self, reason: str) -> None:
+        metrics.incr(f"bulkhead.{self.name}.rejected")
+        metrics.incr(f"bulkhead.{self.name}.rejected.{reason}")
+        logger.warning(f"Bulkhead {self.name} rejected request ({reason})")
+        raise BulkheadRejectedError(f"{self.name} 요청 거절: {reason}")
+
+    def stats(self) -> dict:
+        """현재 상태."""
+        return {
+            "active": self.active,
+            "queued": self.queued,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "avg_hold_ms": round(self.avg_hold_seconds * 1000, 1),
+        }
+
+
+_lock = threading.Lock()
+# asyncio 대기자는 이벤트 루프에 묶이므로 루프별로 분리
+_bulkheads: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, Bulkhead]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_bulkhead(name: str, max_concurrency: int, max_queue: int, timeout: float) -> Bulkhead:
+    """현재 이벤트 루프의 이름별 Bulkhead (첫 호출 시 생성)."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        bulkheads = _bulkheads.setdefault(loop, {})
+        if name not in bulkheads:
+            bulkheads[name] = Bulkhead(name, max_concurrency, max_queue, timeout)
+        return bulkheads[name]
@@ -0,0 +1,156 @@
+"""Micro-batching for LLM calls.
+
+동시에 들어온 LLM 요청을 짧은 시간 창(수 ms) 동안 모아 한 번에 처리합니다.
+같은 배치 안의 동일한 프롬프트는 한 번만 호출하고,
+배치 내 동시 요청 수는 제한하여 공급자 rate limit 을 넘지 않도록 합니다.
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.config import settings
+from src.tools.llm_client import invoke_llm
+from src.tools.llm_usage import current_session, usage_session
+from src.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """요청을 모아 배치 핸들러로 전달하는 asyncio 마이크로 배처.
+
+    Args:
+        handler: 요청 목록을 받아 같은 순서의 결과 목록을 반환하는 코루틴 함수
+            (결과가 예외 인스턴스이면 해당 호출자에게 예외로 전달)
+        max_batch_size: 배치 최대 크기 (도달 시 즉시 처리)
+        max_wait_ms: 첫 요청 이후 배치를 모으는 최대 대기 시간
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[Any]], Awaitable[list[Any]]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5,
+    ):
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._pending: list[tuple[Any, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, item: Any) -> Any:
+        """요청을 배치에 추가하고 결과를 기다림."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_ms / 1000, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[Any, asyncio.Future]]) -> None:
+        # 대기 중에 취소된 (예: 헤지 요청에서 진 쪽) 요청은 공급자에 보내지 않음
+        live = [(item, future) for item, future in batch if not future.done()]
+        if len(live) < len(batch):
+            metrics.incr("llm_batch.cancelled", len(batch) - len(live))
+        if not live:
+            return
+
+        metrics.incr("llm_batch.batches")
+        metrics.observe("llm_batch.size", len(live))
+
+        try:
+            results = await self.handler([item for item, _ in live])
+            if len(results) != len(live):
+                raise ValueError(f"Batch handler returned {len(results)} results for {len(live)} items")
+        except Exception as e:
+            results = [e] * len(live)
+
+        for (_, future), result in zip(live, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+def make_llm_batch_handler(
+    agent: str,
+    max_concurrency: int,
+) -> Callable[[list[tuple[str, str, str | None]]], Awaitable[list[Any]]]:
+    """(시스템 프롬프트, 사용자 프롬프트, 세션 ID) 배치를 처리하는 핸들러 생성.
+
+    같은 프롬프트의 사용량은 먼저 요청한 세션으로 집계합니다.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def call(system_prompt: str, user_prompt: str, session_id: str | None) -> str:
+        async with semaphore:
+            with usage_session(session_id):
+                return await invoke_llm(agent, system_prompt, user_prompt)
+
+    async def handle(batch: list[tuple[str, str, str | None]]) -> list[Any]:
+        # 같은 프롬프트는 한 번만 호출
+        sessions: dict[tuple[str, str], str | None] = {}
+        for system, user, session_id in batch:
+            sessions.setdefault((system, user), session_id)
+        if len(sessions) < len(batch):
+            metrics.incr("llm_batch.deduplicated", len(batch) - len(sessions))
+
+        results = await asyncio.gather(
+            *(call(system, user, session_id) for (system, user), session_id in sessions.items()),
+            return_exceptions=True,
+        )
+        by_prompt = dict(zip(sessions, results, strict=True))
+        return [by_prompt[(system, user)] for system, user, _ in batch]
+
+    return handle
+
+
+_lock = threading.Lock()
+# 배처는 이벤트 루프에 묶이므로 루프별로 분리
+_batchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, MicroBatcher]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_batcher(agent: str) -> MicroBatcher:
+    """현재 이벤트 루프의 에이전트별 배처."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        batchers = _batchers.setdefault(loop, {})
+        if agent not in batchers:
+            batchers[agent] = MicroBatcher(
+                make_llm_batch_handler(agent, settings.llm_batch_max_concurrency),
+                max_batch_size=settings.llm_batch_max_size,
+                max_wait_ms=settings.llm_batch_window_ms,
+            )
+        return batchers[agent]
+
+
+async def batched_invoke_llm(agent: str, system_prompt: str, user_prompt: str) -> str:
+    """마이크로 배치를 거쳐 LLM 호출 (비활성화 시 바로 호출)."""
+    if not settings.llm_batch_enabled:
+        return await invoke_llm(agent, system_prompt, user_prompt)
+    content: str = await get_batcher(agent).submit((system_prompt, user_prompt, current_session.get()))
+    return content
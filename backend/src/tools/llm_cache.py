@@ -0,0 +1,173 @@
+"""LLM response cache.
+
+1) 완전 일치 캐시: (모델, 시스템 프롬프트, 사용자 프롬프트, temperature 구간) 키
+2) 유사 입력 캐시 (선택): 해싱 벡터화한 프롬프트의 코사인 유사도가 임계값 이상이면 재사용
+
+두 캐시 모두 로컬 저장소(src/utils/store.py)에 TTL 과 함께 저장됩니다.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import re
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+
+from src.config import settings
+from src.utils.metrics import metrics
+from src.utils.store import LocalStore, get_local_store
+
+logger = logging.getLogger(__name__)
+
+EXACT_NAMESPACE = "llm_exact"
+SEMANTIC_NAMESPACE = "llm_semantic"
+
+# temperature 구간 크기 (0.7 과 0.74 는 같은 키)
+TEMPERATURE_BUCKET = 0.1
+
+# 해싱 벡터 차원
+VECTOR_DIM = 2**16
+
+# 유사 입력 캐시를 사용하는 에이전트 (응답이 대화 맥락에 의존하지 않는 것만)
+SEMANTIC_CACHE_AGENTS = ("itinerary_planner",)
+
+TOKEN_PATTERN = re.compile(r"\w+")
+NUMBER_PATTERN = re.compile(r"\d+")
+
+
+def _digest(*parts: object) -> str:
+    payload = json.dumps(parts, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def temperature_bucket(temperature: float) -> float:
+    """temperature 를 구간 대표값으로 변환."""
+    return round(round(temperature / TEMPERATURE_BUCKET) * TEMPERATURE_BUCKET, 2)
+
+
+def exact_cache_key(model: str, system_prompt: str, user_prompt: str, temperature: float) -> str:
+    """완전 일치 캐시 키."""
+    return _digest(model, system_prompt, user_prompt, temperature_bucket(temperature))
+
+
+def hash_vectorize(text: str) -> dict[int, float]:
+    """단어 + 단어 내 문자 trigram 을 해싱한 L2 정규화 희소 벡터."""
+    text = unicodedata.normalize("NFC", text).lower()
+    features: Counter[int] = Counter()
+    for word in TOKEN_PATTERN.findall(text):
+        grams = [word] + [word[i : i + 3] for i in range(len(word) - 2)]
+        for gram in grams:
+            digest = hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest()
+            features[int.from_bytes(digest, "big") % VECTOR_DIM] += 1
+
+    norm = math.sqrt(sum(v * v for v in features.values()))
+    if not norm:
+        return {}
+    return {index: count / norm for index, count in features.items()}
+
+
+def cosine_similarity(a: dict[int, float], b: dict[int, float]) -> float:
+    """정규화된 희소 벡터의 코사인 유사도."""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(index, 0.0) for index, weight in a.items())
+
+
+def semantic_partition(model: str, system_prompt: str, user_prompt: str) -> str:
+    """유사 검색 대상 구획.
+
+    숫자(기간, 인원 등)가 다르면 비슷한 문장이라도 다른 요청이므로
+    모델/시스템 프롬프트와 함께 숫자 목록이 모두 같은 항목끼리만 비교합니다.
+    """
+    return _digest(model, system_prompt, NUMBER_PATTERN.findall(user_prompt))[:16]
+
+
+class LLMResponseCache:
+    """완전 일치 + 유사 입력 LLM 응답 캐시.
+
+    Args:
+        store: 로컬 저장소
+        ttl: 항목 유효 시간 (초)
+        semantic_threshold: 유사 입력으로 판단할 최소 코사인 유사도
+    """
+
+    def __init__(self, store: LocalStore, ttl: float, semantic_threshold: float = 0.9):
+        self.store = store
+        self.ttl = ttl
+        self.semantic_threshold = semantic_threshold
+
+    def get(
+        self,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        semantic: bool = False,
+    ) -> str | None:
+        """캐시된 응답 조회."""
+        key = exact_cache_key(model, system_prompt, user_prompt, temperature)
+        entry = self.store.get(EXACT_NAMESPACE, key)
+        if entry is not None:
+            metrics.incr("llm_cache.exact_hits")
+            metrics.incr("llm_cache.saved_tokens", entry.get("tokens", 0))
+            return str(entry["content"])
+
+        if semantic:
+            entry = self._semantic_lookup(model, system_prompt, user_prompt)
+            if entry is not None:
+                metrics.incr("llm_cache.semantic_hits")
+                metrics.incr("llm_cache.saved_tokens", entry.get("tokens", 0))
+                return str(entry["content"])
+
+        metrics.incr("llm_cache.misses")
+        return None
+
+    def set(
+        self,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        content: str,
+        tokens: int = 0,
+        semantic: bool = False,
+    ) -> None:
+        """응답 저장."""
+        key = exact_cache_key(model, system_prompt, user_prompt, temperature)
+        self.store.set(EXACT_NAMESPACE, key, {"content": content, "tokens": tokens}, self.ttl)
+
+        if semantic:
+            partition = semantic_partition(model, system_prompt, user_prompt)
+            vector = hash_vectorize(user_prompt)
+            self.store.set(
+                SEMANTIC_NAMESPACE,
+                f"{partition}:{key}",
+                {"content": content, "tokens": tokens, "vector": list(vector.items())},
+                self.ttl,
+            )
+
+    def _semantic_lookup(self, model: str, system_prompt: str, user_prompt: str) -> dict | None:
+        partition = semantic_partition(model, system_prompt, user_prompt)
+        query = hash_vectorize(user_prompt)
+
+        best, best_score = None, self.semantic_threshold
+        for _, entry in self.store.scan(SEMANTIC_NAMESPACE, f"{partition}:"):
+            score = cosine_similarity(query, dict(entry["vector"]))
+            if score >= best_score:
+                best, best_score = entry, score
+
+        if best is not None:
+            logger.info(f"LLM semantic cache hit (similarity {best_score:.3f})")
+        return best
+
+
+@lru_cache
+def get_llm_cache() -> LLMResponseCache:
+    """설정 기반 전역 LLM 응답 캐시."""
+    return LLMResponseCache(
+        get_local_store(),
+        ttl=settings.llm_cache_ttl_seconds,
+        semantic_threshold=settings.llm_semantic_cache_threshold,
+    )
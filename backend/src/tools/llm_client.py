@@ -0,0 +1,312 @@
+"""Shared LLM client registry.
+
+에이전트별 ChatOpenAI 클라이언트를 프로세스 전역에서 지연 생성하여 재사용합니다.
+HTTP 연결은 공유 커넥션 풀(httpx)로 유지되며,
+모델/temperature 는 에이전트별 설정(src/config.py)을 따릅니다.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from collections.abc import AsyncGenerator, Callable, Mapping
+from typing import Any
+
+import httpx
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_openai import ChatOpenAI
+from pydantic import SecretStr
+
+from src.config import settings
+from src.tools.bulkhead import BulkheadRejectedError, get_bulkhead
+from src.tools.llm_cache import SEMANTIC_CACHE_AGENTS, get_llm_cache
+from src.tools.llm_usage import current_session, get_usage_tracker
+from src.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# LLM 을 사용하는 에이전트 목록 (설정 키 접두사)
+LLM_AGENTS = ("info_collector", "itinerary_planner")
+
+# base_url(로컬 스텁 등)만 지정되고 API 키가 없을 때 사용하는 자리표시 키
+PLACEHOLDER_API_KEY = "sk-local"
+
+_lock = threading.Lock()
+_sync_http_client: httpx.Client | None = None
+# 비동기 커넥션은 이벤트 루프에 묶이므로 루프별로 분리
+_async_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_llm_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, ChatOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class LLMUnavailableError(Exception):
+    """LLM 을 사용할 수 없음 (동시 실행 한도 초과, 공급자 장애 등)."""
+
+
+class LLMQuotaExceededError(LLMUnavailableError):
+    """LLM 사용 비용 한도 초과."""
+
+
+def is_llm_enabled() -> bool:
+    """LLM 호출 가능 여부 (API 키 또는 base_url 설정)."""
+    return bool(settings.openai_api_key or settings.openai_base_url)
+
+
+def has_llm_budget(session_id: str | None = None) -> bool:
+    """세션/전역 비용 한도가 남아 있는지 여부."""
+    return get_usage_tracker().quota_exceeded(session_id or current_session.get()) is None
+
+
+def should_fallback(error: LLMUnavailableError) -> bool:
+    """LLM 사용 불가 시 규칙 기반으로 전환할지 여부 (한도 초과는 항상 전환)."""
+    return settings.llm_fallback_to_rules or isinstance(error, LLMQuotaExceededError)
+
+
+def _check_quota(agent: str) -> None:
+    exceeded = get_usage_tracker().quota_exceeded(current_session.get())
+    if exceeded:
+        metrics.incr("llm.quota_exceeded")
+        metrics.incr(f"llm.quota_exceeded.{exceeded}")
+        raise LLMQuotaExceededError(f"{agent} LLM 비용 한도 초과 ({exceeded})")
+
+
+def _text(content: str | list[str | dict[str, Any]]) -> str:
+    """메시지 content 를 문자열로 변환 (블록 목록이면 텍스트 블록만 이어붙임)."""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block if isinstance(block, str) else str(block.get("text", ""))
+        for block in content
+        if isinstance(block, str) or block.get("type") == "text"
+    )
+
+
+def _record_usage(agent: str, model: str, usage: Mapping[str, Any], latency_ms: float) -> None:
+    get_usage_tracker().record(
+        agent,
+        model,
+        prompt_tokens=usage.get("input_tokens", 0),
+        completion_tokens=usage.get("output_tokens", 0),
+        latency_ms=latency_ms,
+        session_id=current_session.get(),
+    )
+
+
+def get_agent_config(agent: str) -> dict:
+    """에이전트별 모델 설정."""
+    if agent not in LLM_AGENTS:
+        raise ValueError(f"Unknown LLM agent: {agent}")
+    return {
+        "model": getattr(settings, f"{agent}_model"),
+        "temperature": getattr(settings, f"{agent}_temperature"),
+    }
+
+
+def _http_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.llm_max_connections,
+        max_keepalive_connections=settings.llm_max_keepalive_connections,
+    )
+
+
+def _get_sync_http_client() -> httpx.Client:
+    global _sync_http_client
+    if _sync_http_client is None:
+        _sync_http_client = httpx.Client(
+            limits=_http_limits(),
+            timeout=settings.llm_timeout_seconds,
+        )
+    return _sync_http_client
+
+
+def _current_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def get_llm(agent: str) -> ChatOpenAI:
+    """에이전트용 공유 ChatOpenAI 클라이언트 (지연 생성)."""
+    config = get_agent_config(agent)
+    loop = _current_loop()
+
+    with _lock:
+        clients = _llm_clients.get(loop) if loop is not None else None
+        if clients is not None and agent in clients:
+            return clients[agent]
+
+        kwargs: dict[str, Any] = {}
+        if loop is not None:
+            http_async_client = _async_http_clients.get(loop)
+            if http_async_client is None:
+                http_async_client = httpx.AsyncClient(
+                    limits=_http_limits(),
+                    timeout=settings.llm_timeout_seconds,
+                )
+                _async_http_clients[loop] = http_async_client
+            kwargs["http_async_client"] = http_async_client
+
+        llm = ChatOpenAI(
+            api_key=SecretStr(settings.openai_api_key or PLACEHOLDER_API_KEY),
+            base_url=settings.openai_base_url or None,
+            timeout=settings.llm_timeout_seconds,
+            http_client=_get_sync_http_client(),
+            stream_usage=True,
+            **config,
+            **kwargs,
+        )
+        if loop is not None:
+            _llm_clients.setdefault(loop, {})[agent] = llm
+        logger.info(f"LLM client created: {agent} ({config['model']})")
+        return llm
+
+
+async def invoke_llm(
+    agent: str,
+    system_prompt: str,
+    user_prompt: str,
+    cache_if: Callable[[str], bool] | None = None,
+) -> str:
+    """에이전트 LLM 호출 후 응답 텍스트 반환.
+
+    응답 캐시가 켜져 있으면 캐시를 먼저 조회하고, 새 응답은 캐시에 저장합니다.
+    캐시 조회/저장 (SQLite) 은 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+    cache_if 가 주어지면 이를 통과한 응답만 저장합니다 (예: 파싱 가능한 JSON).
+    실제 호출은 "llm" bulkhead 를 거치며, 거절되면 LLMUnavailableError 를,
+    비용 한도를 넘었으면 LLMQuotaExceededError 를 발생시킵니다.
+    """
+    config = get_agent_config(agent)
+    cache = get_llm_cache() if settings.llm_cache_enabled else None
+    semantic = settings.llm_semantic_cache_enabled and agent in SEMANTIC_CACHE_AGENTS
+    cache_args = (config["model"], system_prompt, user_prompt, config["temperature"])
+
+    if cache is not None:
+        cached = await asyncio.to_thread(cache.get, *cache_args, semantic=semantic)
+        if cached is not None:
+            return cached
+
+    _check_quota(agent)
+    llm = get_llm(agent)
+    bulkhead = get_bulkhead(
+        "llm",
+        max_concurrency=settings.llm_max_concurrency,
+        max_queue=settings.llm_max_queue,
+        timeout=settings.llm_queue_timeout_seconds,
+    )
+    started = time.perf_counter()
+    try:
+        async with bulkhead.acquire():
+            response = await llm.ainvoke([
+                SystemMessage(content=system_prompt),
+                HumanMessage(content=user_prompt),
+            ])
+    except BulkheadRejectedError as e:
+        raise LLMUnavailableError(str(e)) from e
+    except Exception:
+        metrics.incr(f"llm.{agent}.errors")
+        raise
+    finally:
+        metrics.observe(f"llm.{agent}.latency_ms", (time.perf_counter() - started) * 1000)
+
+    metrics.incr(f"llm.{agent}.calls")
+    content = _text(response.content)
+    usage: Mapping[str, Any] = response.usage_metadata or {}
+    _record_usage(agent, config["model"], usage, (time.perf_counter() - started) * 1000)
+
+    if cache is not None and (cache_if is None or cache_if(content)):
+        await asyncio.to_thread(
+            cache.set, *cache_args, content, tokens=usage.get("total_tokens", 0), semantic=semantic
+        )
+    return content
+
+
+async def stream_llm(
+    agent: str,
+    system_prompt: str,
+    user_prompt: str,
+    cache_if: Callable[[str], bool] | None = None,
+) -> AsyncGenerator[str, None]:
+    """에이전트 LLM 스트리밍 호출. 응답 텍스트 조각을 순서대로 반환.
+
+    캐시에 있으면 전체 응답을 한 조각으로 반환하고,
+    스트림이 끝나면 전체 응답을 캐시에 저장합니다.
+    Bulkhead 슬롯은 업스트림을 읽는 동안만 잡고, 소비자를 기다리는 동안에는 잡지 않습니다.
+    """
+    config = get_agent_config(agent)
+    cache = get_llm_cache() if settings.llm_cache_enabled else None
+    cache_args = (config["model"], system_prompt, user_prompt, config["temperature"])
+
+    if cache is not None:
+        cached = await asyncio.to_thread(cache.get, *cache_args)
+        if cached is not None:
+            yield cached
+            return
+
+    _check_quota(agent)
+    llm = get_llm(agent)
+    bulkhead = get_bulkhead(
+        "llm",
+        max_concurrency=settings.llm_max_concurrency,
+        max_queue=settings.llm_max_queue,
+        timeout=settings.llm_queue_timeout_seconds,
+    )
+    chunks: list[str] = []
+    usage: dict[str, int] = {}
+    queue: asyncio.Queue[str | None] = asyncio.Queue()
+
+    async def pump() -> None:
+        # 업스트림은 소비 속도와 관계없이 끝까지 읽고 바로 슬롯 반납
+        try:
+            async with bulkhead.acquire():
+                async for chunk in llm.astream([
+                    SystemMessage(content=system_prompt),
+                    HumanMessage(content=user_prompt),
+                ]):
+                    for key, value in (chunk.usage_metadata or {}).items():
+                        if isinstance(value, int):
+                            usage[key] = usage.get(key, 0) + value
+                    text = _text(chunk.content)
+                    if text:
+                        queue.put_nowait(text)
+        finally:
+            queue.put_nowait(None)
+
+    started = time.perf_counter()
+    task = asyncio.create_task(pump())
+    try:
+        while (text := await queue.get()) is not None:
+            chunks.append(text)
+            yield text
+        await task  # 업스트림 오류 전달
+    except BulkheadRejectedError as e:
+        raise LLMUnavailableError(str(e)) from e
+    except Exception:
+        metrics.incr(f"llm.{agent}.errors")
+        raise
+    finally:
+        # 소비자가 중간에 닫으면 (클라이언트 연결 종료 등) 업스트림도 중단하고 슬롯 반납
+        task.cancel()
+        await asyncio.wait([task])
+        metrics.observe(f"llm.{agent}.latency_ms", (time.perf_counter() - started) * 1000)
+
+    metrics.incr(f"llm.{agent}.calls")
+    _record_usage(agent, config["model"], usage, (time.perf_counter() - started) * 1000)
+    content = "".join(chunks)
+    if cache is not None and (cache_if is None or cache_if(content)):
+        await asyncio.to_thread(cache.set, *cache_args, content, tokens=usage.get("total_tokens", 0))
+
+
+def reset_llm_clients() -> None:
+    """캐시된 클라이언트 제거 (설정 변경/테스트용)."""
+    global _sync_http_client
+    with _lock:
+        if _sync_http_client is not None:
+            _sync_http_client.close()
+            _sync_http_client = None
+        _async_http_clients.clear()
+        _llm_clients.clear()
@@ -0,0 +1,254 @@
+"""Offline OpenAI-compatible stub server.
+
+네트워크 없이 LLM 경로를 테스트/벤치마크하기 위한 로컬 스텁입니다.
+/v1/chat/completions 요청에 지정된 지연 후 미리 준비된 JSON 응답을 반환합니다.
+
+실행:
+    python -m src.tools.llm_stub_server --port 8001 --latency-ms 300
+
+백엔드 설정:
+    OPENAI_BASE_URL=http://localhost:8001/v1
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+# 프롬프트에 포함된 표식 -> 응답 종류 (먼저 일치하는 표식 사용)
+AGENT_MARKERS = {
+    "일정 뼈대": "itinerary_skeleton",
+    "하루 일정": "itinerary_day",
+    "여행 상담사": "info_collector",
+    "여행 일정 플래너": "itinerary_planner",
+    "대화 요약가": "history_summary",
+}
+
+# 에이전트별 기본 응답
+DEFAULT_RESPONSES = {
+    "info_collector": {
+        "extracted_info": {
+            "destination": "오사카",
+            "duration": 3,
+            "budget": 1000000,
+            "num_people": 2,
+            "travel_style": ["맛집"],
+        },
+        "response": "오사카 3박 4일 맛집 여행으로 준비할게요!",
+        "info_complete": True,
+    },
+    "itinerary_planner": {
+        "day1": {
+            "date": "2026-01-01",
+            "theme": "도착 & 시내 탐방",
+            "activities": [
+                {
+                    "time": "14:00",
+                    "activity": "공항 도착",
+                    "type": "transport",
+                    "location": "공항",
+                    "duration": "1시간",
+                    "description": "입국 수속 후 시내 이동",
+                },
+                {
+                    "time": "18:00",
+                    "activity": "현지 맛집 저녁",
+                    "type": "food",
+                    "location": "시내",
+                    "duration": "1시간 30분",
+                    "description": "현지 인기 메뉴로 저녁 식사",
+                },
+            ],
+        },
+    },
+    "history_summary": "오사카 3박 4일, 1인 100만원, 2명, 맛집 위주 여행을 상담 중입니다.",
+    "itinerary_skeleton": {
+        "day1": "도착 & 시내 탐방",
+        **{f"day{n}": f"{n}일차 명소 탐방" for n in range(2, 16)},
+    },
+    "itinerary_day": {
+        "date": "2026-01-01",
+        "theme": "명소 탐방",
+        "activities": [
+            {
+                "time": "10:00",
+                "activity": "대표 명소 방문",
+                "type": "sightseeing",
+                "location": "시내",
+                "duration": "2시간",
+                "description": "도시의 대표 명소 관람",
+            },
+            {
+                "time": "12:30",
+                "activity": "현지 맛집 점심",
+                "type": "food",
+                "location": "시내",
+                "duration": "1시간",
+                "description": "현지 인기 메뉴",
+            },
+        ],
+    },
+}
+
+
+class ChatMessage(BaseModel):
+    """채팅 메시지."""
+
+    role: str
+    content: str = ""
+
+
+class ChatCompletionRequest(BaseModel):
+    """Chat Completions 요청 (스텁에 필요한 필드만)."""
+
+    model: str = "stub"
+    messages: list[ChatMessage]
+    temperature: float | None = None
+    stream: bool = False
+
+
+def detect_agent(messages: list[ChatMessage]) -> str | None:
+    """프롬프트 표식으로 요청 종류 판별."""
+    text = " ".join(m.content for m in messages)
+    for marker, agent in AGENT_MARKERS.items():
+        if marker in text:
+            return agent
+    return None
+
+
+def stream_chunks(
+    completion_id: str,
+    model: str,
+    content: str,
+    chunk_size: int,
+    delay_ms: float,
+    usage: dict,
+) -> AsyncIterator[str]:
+    """Chat Completions 스트리밍 (SSE) 응답 생성기."""
+
+    def event(choices: list, **extra: Any) -> str:
+        payload = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": choices,
+            **extra,
+        }
+        return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+    async def generate() -> AsyncIterator[str]:
+        yield event([{"index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": None}])
+        for start in range(0, len(content), chunk_size):
+            if delay_ms:
+                await asyncio.sleep(delay_ms / 1000)
+            piece = content[start : start + chunk_size]
+            yield event([{"index": 0, "delta": {"content": piece}, "finish_reason": None}])
+        yield event([{"index": 0, "delta": {}, "finish_reason": "stop"}])
+        yield event([], usage=usage)
+        yield "data: [DONE]\n\n"
+
+    return generate()
+
+
+def create_stub_app(
+    latency_ms: float = 0,
+    responses: dict[str, dict | str | list] | None = None,
+    chunk_size: int = 16,
+    chunk_delay_ms: float = 0,
+) -> FastAPI:
+    """스텁 서버 앱 생성.
+
+    Args:
+        latency_ms: 응답마다 추가되는 지연 시간 (밀리초)
+        responses: 종류별 응답 (기본 응답을 덮어씀).
+            리스트이면 요청마다 순서대로 사용하고 마지막 응답을 반복합니다.
+        chunk_size: 스트리밍 응답 조각 크기 (문자 수)
+        chunk_delay_ms: 스트리밍 응답 조각 사이 지연 시간 (밀리초)
+    """
+    app = FastAPI(title="TripMate LLM Stub")
+    app.state.latency_ms = latency_ms
+    app.state.chunk_size = chunk_size
+    app.state.chunk_delay_ms = chunk_delay_ms
+    app.state.responses = {**DEFAULT_RESPONSES, **(responses or {})}
+    app.state.request_count = 0
+    app.state.counts = {}
+
+    @app.post("/v1/chat/completions", response_model=None)
+    async def chat_completions(request: ChatCompletionRequest) -> StreamingResponse | dict[str, Any]:
+        app.state.request_count += 1
+        if app.state.latency_ms:
+            await asyncio.sleep(app.state.latency_ms / 1000)
+
+        agent = detect_agent(request.messages)
+        body = app.state.responses.get(agent, {"response": "stub"})
+        if isinstance(body, list):
+            index = app.state.counts.get(agent, 0)
+            app.state.counts[agent] = index + 1
+            body = body[min(index, len(body) - 1)]
+        content = body if isinstance(body, str) else json.dumps(body, ensure_ascii=False)
+
+        prompt_tokens = sum(len(m.content) for m in request.messages) // 4
+        completion_tokens = len(content) // 4
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+
+        if request.stream:
+            return StreamingResponse(
+                stream_chunks(
+                    completion_id, request.model, content,
+                    app.state.chunk_size, app.state.chunk_delay_ms, usage,
+                ),
+                media_type="text/event-stream",
+            )
+
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": usage,
+        }
+
+    @app.get("/v1/models")
+    async def list_models() -> dict[str, Any]:
+        return {"object": "list", "data": [{"id": "stub", "object": "model"}]}
+
+    return app
+
+
+def main() -> None:
+    """CLI 진입점."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="OpenAI-compatible LLM stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--chunk-delay-ms", type=float, default=0)
+    args = parser.parse_args()
+
+    app = create_stub_app(latency_ms=args.latency_ms, chunk_delay_ms=args.chunk_delay_ms)
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""LLM token/cost accounting and spend quotas.
+
+LLM 호출마다 토큰 수, 지연 시간, 비용을 전역/에이전트별/세션별로 집계합니다.
+집계는 메모리에서만 갱신하고 백그라운드 작업이 일정 주기마다 로컬 저장소에 한꺼번에 기록합니다.
+오래 사용되지 않은 세션 집계는 기록 후 메모리에서 제거합니다.
+최근 시간 창(rolling window)의 비용이 한도를 넘으면 LLM 호출을 막고
+에이전트가 규칙 기반 경로로 전환하도록 합니다.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+
+from src.config import settings
+from src.utils.store import LocalStore, get_local_store
+
+logger = logging.getLogger(__name__)
+
+USAGE_NAMESPACE = "usage"
+
+# 모델별 1K 토큰당 가격 (USD, 입력/출력)
+MODEL_PRICES = {
+    "gpt-4-turbo-preview": (0.01, 0.03),
+    "gpt-4-turbo": (0.01, 0.03),
+    "gpt-4o": (0.0025, 0.01),
+    "gpt-4o-mini": (0.00015, 0.0006),
+    "gpt-3.5-turbo": (0.0005, 0.0015),
+}
+
+# 가격을 모르는 모델은 보수적으로 가장 비싼 가격 적용
+DEFAULT_PRICE = (0.01, 0.03)
+
+# 시간 창 집계 단위 (초)
+BUCKET_SECONDS = 10
+
+# 세션 사용량 보관 기간 (초)
+SESSION_USAGE_TTL = 7 * 24 * 3600
+
+# 이 시간 (초) 동안 호출이 없던 세션 집계는 메모리에서 제거 (저장소에는 유지)
+SESSION_IDLE_SECONDS = 3600
+
+# 메모리에 유지하는 최대 세션 수 (초과 시 가장 오래 사용되지 않은 세션부터 제거)
+MAX_TRACKED_SESSIONS = 10000
+
+# 현재 LLM 호출이 속한 세션
+current_session: ContextVar[str | None] = ContextVar("current_session", default=None)
+
+
+@contextmanager
+def usage_session(session_id: str | None) -> Iterator[None]:
+    """블록 안의 LLM 호출을 세션 사용량으로 집계."""
+    token = current_session.set(session_id)
+    try:
+        yield
+    finally:
+        current_session.reset(token)
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """토큰 수로 비용 계산 (USD)."""
+    input_price, output_price = MODEL_PRICES.get(model, DEFAULT_PRICE)
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1000
+
+
+def _empty_totals() -> dict:
+    return {
+        "calls": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "cost_usd": 0.0,
+        "latency_ms": 0.0,
+    }
+
+
+class UsageTracker:
+    """메모리 사용량 집계기.
+
+    Args:
+        store: 주기적으로 집계를 기록할 로컬 저장소
+        window_seconds: 한도 계산에 쓰는 최근 시간 창 (초)
+        flush_interval: 저장소 기록 주기 (초)
+        idle_seconds: 세션 집계를 메모리에서 제거할 유휴 시간 (초, 시간 창보다 짧으면 시간 창)
+        max_sessions: 메모리에 유지하는 최대 세션 수
+    """
+
+    def __init__(
+        self,
+        store: LocalStore,
+        window_seconds: float,
+        flush_interval: float,
+        idle_seconds: float = SESSION_IDLE_SECONDS,
+        max_sessions: int = MAX_TRACKED_SESSIONS,
+    ):
+        self.store = store
+        self.window_seconds = window_seconds
+        self.flush_interval = flush_interval
+        self.idle_seconds = max(idle_seconds, window_seconds)
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._totals: dict[str, dict] = {}
+        self._dirty: set[str] = set()
+        # 범위별 (구간 시작 시각, 비용) 목록
+        self._windows: dict[str, deque[list[float]]] = defaultdict(deque)
+        # 세션 범위 -> 마지막 호출 시각 (오래된 순)
+        self._sessions: OrderedDict[str, float] = OrderedDict()
+
+    @staticmethod
+    def scopes(agent: str, session_id: str | None) -> list[str]:
+        """집계 범위 키 목록."""
+        scopes = ["global", f"agent:{agent}"]
+        if session_id:
+            scopes.append(f"session:{session_id}")
+        return scopes
+
+    def _load(self, scope: str) -> dict:
+        totals = self._totals.get(scope)
+        if totals is None:
+            totals = self.store.get(USAGE_NAMESPACE, scope) or _empty_totals()
+            self._totals[scope] = totals
+        return totals
+
+    def _prune(self, window: deque[list[float]], now: float) -> None:
+        """시간 창을 벗어난 구간 제거."""
+        cutoff = now - self.window_seconds
+        while window and window[0][0] + BUCKET_SECONDS <= cutoff:
+            window.popleft()
+
+    def record(
+        self,
+        agent: str,
+        model: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        latency_ms: float,
+        session_id: str | None = None,
+    ) -> float:
+        """호출 1건 기록 (메모리만 갱신). 계산된 비용 반환."""
+        cost = estimate_cost(model, prompt_tokens, completion_tokens)
+        now = time.time()
+        bucket = now - now % BUCKET_SECONDS
+
+        with self._lock:
+            for scope in self.scopes(agent, session_id):
+                totals = self._load(scope)
+                totals["calls"] += 1
+                totals["prompt_tokens"] += prompt_tokens
+                totals["completion_tokens"] += completion_tokens
+                totals["cost_usd"] += cost
+                totals["latency_ms"] += latency_ms
+                self._dirty.add(scope)
+
+                window = self._windows[scope]
+                self._prune(window, now)
+                if window and window[-1][0] == bucket:
+                    window[-1][1] += cost
+                else:
+                    window.append([bucket, cost])
+
+                if scope.startswith("session:"):
+                    self._sessions[scope] = now
+                    self._sessions.move_to_end(scope)
+        return cost
+
+    def window_cost(self, scope: str) -> float:
+        """최근 시간 창의 비용 합계."""
+        with self._lock:
+            window = self._windows.get(scope)
+            if not window:
+                return 0.0
+            self._prune(window, time.time())
+            return sum(cost for _, cost in window)
+
+    def quota_exceeded(self, session_id: str | None = None) -> str | None:
+        """한도를 넘은 범위 이름 (없으면 None)."""
+        global_limit = settings.llm_global_cost_limit_usd
+        if global_limit and self.window_cost("global") >= global_limit:
+            return "global"
+
+        session_limit = settings.llm_session_cost_limit_usd
+        if session_id and session_limit and self.window_cost(f"session:{session_id}") >= session_limit:
+            return "session"
+        return None
+
+    def totals(self, scope: str) -> dict:
+        """범위의 누적 사용량 (메모리에 없으면 저장소에서 읽기만 함)."""
+        with self._lock:
+            totals = self._totals.get(scope)
+            if totals is not None:
+                return dict(totals)
+        return self.store.get(USAGE_NAMESPACE, scope) or _empty_totals()
+
+    def tracked_sessions(self) -> int:
+        """메모리에 있는 세션 집계 수."""
+        with self._lock:
+            return len(self._sessions)
+
+    def flush(self) -> int:
+        """변경된 집계를 저장소에 기록하고 유휴 세션 제거. 기록한 범위 수 반환."""
+        with self._lock:
+            dirty = {scope: dict(self._totals[scope]) for scope in self._dirty}
+            self._dirty.clear()
+
+        for scope, totals in dirty.items():
+            ttl = SESSION_USAGE_TTL if scope.startswith("session:") else None
+            self.store.set(USAGE_NAMESPACE, scope, totals, ttl)
+        if dirty:
+            logger.debug(f"Flushed usage for {len(dirty)} scopes")
+
+        self._evict_sessions()
+        return len(dirty)
+
+    def _evict_sessions(self) -> None:
+        """기록이 끝난 세션 중 유휴/초과분을 메모리에서 제거."""
+        cutoff = time.time() - self.idle_seconds
+        with self._lock:
+            overflow = len(self._sessions) - self.max_sessions
+            for scope, last_used in list(self._sessions.items()):
+                if last_used > cutoff and overflow <= 0:
+                    break
+                if scope in self._dirty:
+                    # 기록 이후 새로 들어온 호출은 다음 주기에 처리
+                    continue
+                del self._sessions[scope]
+                self._totals.pop(scope, None)
+                self._windows.pop(scope, None)
+                overflow -= 1
+
+    async def run_flusher(self) -> None:
+        """flush_interval 마다 요청 경로 밖 (스레드) 에서 저장소 기록."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception as e:
+                logger.error(f"Usage flush failed: {e}")
+
+    def snapshot(self) -> dict:
+        """전역/에이전트별 사용량과 현재 시간 창 비용."""
+        with self._lock:
+            scopes = [s for s in self._totals if not s.startswith("session:")]
+        return {
+            "window_seconds": self.window_seconds,
+            "tracked_sessions": self.tracked_sessions(),
+            "scopes": {
+                scope: {**self.totals(scope), "window_cost_usd": self.window_cost(scope)}
+                for scope in scopes
+            },
+        }
+
+
+@lru_cache
+def get_usage_tracker() -> UsageTracker:
+    """전역 사용량 집계기."""
+    return UsageTracker(
+        get_local_store(),
+        window_seconds=settings.llm_quota_window_seconds,
+        flush_interval=settings.usage_flush_interval_seconds,
+    )
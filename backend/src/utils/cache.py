@@ -0,0 +1,105 @@
+"""In-memory TTL/LRU cache."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+_MISSING = object()
+
+
+class TTLCache:
+    """크기 제한과 만료 시간을 가진 스레드 안전 LRU 캐시.
+
+    Args:
+        maxsize: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+        ttl: 항목 유효 시간 (초), None이면 만료 없음
+        on_evict: 용량 초과/만료/덮어쓰기로 항목이 빠질 때 호출되는 콜백
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float | None = None,
+        on_evict: Callable[[Hashable, Any], None] | None = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def _expires_at(self) -> float:
+        return time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+
+    def _evict(self, key: Hashable, value: Any) -> None:
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """항목 조회. 없거나 만료되었으면 default 반환."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self._evict(key, value)
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """항목 저장."""
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None and old[1] is not value:
+                self._evict(key, old[1])
+
+            self._data[key] = (self._expires_at(), value)
+            while len(self._data) > self.maxsize:
+                old_key, (_, old_value) = self._data.popitem(last=False)
+                self._evict(old_key, old_value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """항목 제거 후 반환 (evict 콜백 없음)."""
+        with self._lock:
+            item = self._data.pop(key, None)
+            return default if item is None else item[1]
+
+    def purge_expired(self) -> int:
+        """만료된 항목 일괄 제거. 제거된 개수 반환."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [k for k, (exp, _) in self._data.items() if exp < now]
+            for key in expired:
+                _, value = self._data.pop(key)
+                self._evict(key, value)
+            return len(expired)
+
+    def clear(self) -> None:
+        """모든 항목 제거 (evict 콜백 없음)."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """캐시 통계."""
+        with self._lock:
+            return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,133 @@
+"""Fuzzy, romanization-tolerant name matching.
+
+한글은 자모 단위로 분해/정규화하고 (예: "오사까" ≈ "오사카"),
+라틴 문자는 대소문자/공백/하이픈/반복 문자를 정규화한 뒤
+문자 trigram 역색인으로 유사한 이름을 찾습니다.
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Any, NamedTuple
+
+# 한글 음절 분해용 자모 테이블
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+             "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+HANGUL_BASE = 0xAC00
+HANGUL_END = 0xD7A3
+
+# 표기 흔들림이 잦은 자모 정규화 (경음/격음 -> 평음, 비슷한 모음 통합)
+JAMO_NORMALIZATION = str.maketrans({
+    "ㄲ": "ㄱ", "ㅋ": "ㄱ",
+    "ㄸ": "ㄷ", "ㅌ": "ㄷ",
+    "ㅃ": "ㅂ", "ㅍ": "ㅂ",
+    "ㅆ": "ㅅ",
+    "ㅉ": "ㅈ", "ㅊ": "ㅈ",
+    "ㅐ": "ㅔ",
+    "ㅒ": "ㅖ",
+    "ㅙ": "ㅞ", "ㅚ": "ㅞ",
+})
+
+NON_WORD = re.compile(r"[^0-9a-zㄱ-ㅣ]+")
+
+
+def decompose_hangul(text: str) -> str:
+    """한글 음절을 자모 문자열로 분해."""
+    result = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_END:
+            index = code - HANGUL_BASE
+            result.append(CHOSEONG[index // 588])
+            result.append(JUNGSEONG[(index % 588) // 28])
+            result.append(JONGSEONG[index % 28])
+        else:
+            result.append(ch)
+    return "".join(result)
+
+
+def normalize_name(text: str) -> str:
+    """비교용 정규화 문자열.
+
+    소문자화, 한글 자모 분해/정규화, 공백/기호 제거, 연속 반복 문자 축약.
+    """
+    text = unicodedata.normalize("NFC", text).lower()
+    text = decompose_hangul(text).translate(JAMO_NORMALIZATION)
+    text = NON_WORD.sub("", text)
+    # "osakaa" -> "osaka"
+    return re.sub(r"(.)\1+", r"\1", text)
+
+
+def trigrams(normalized: str) -> set[str]:
+    """양 끝을 패딩한 문자 trigram 집합."""
+    padded = f"${normalized}$"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class FuzzyMatch(NamedTuple):
+    """유사 매칭 결과."""
+
+    score: float  # Dice 계수 (0~1)
+    name: str  # 매칭된 이름/별칭
+    value: Any  # 정규화된 값 (예: 대표 도시명)
+
+
+class TrigramIndex:
+    """문자 trigram 역색인 기반 유사 이름 검색."""
+
+    def __init__(self) -> None:
+        self._names: list[tuple[str, Any, int]] = []  # (이름, 값, trigram 수)
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        self._exact: dict[str, int] = {}
+
+    def add(self, name: str, value: Any) -> None:
+        """이름 등록."""
+        normalized = normalize_name(name)
+        if not normalized or normalized in self._exact:
+            return
+
+        grams = trigrams(normalized)
+        entry_id = len(self._names)
+        self._names.append((name, value, len(grams)))
+        self._exact[normalized] = entry_id
+        for gram in grams:
+            self._postings[gram].append(entry_id)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 3,
+        min_score: float = 0.0,
+    ) -> list[FuzzyMatch]:
+        """유사도 순으로 매칭 결과 반환."""
+        normalized = normalize_name(query)
+        if not normalized:
+            return []
+
+        # 정규화 후 완전 일치
+        exact = self._exact.get(normalized)
+        if exact is not None:
+            name, value, _ = self._names[exact]
+            return [FuzzyMatch(1.0, name, value)]
+
+        grams = trigrams(normalized)
+        overlaps: dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for entry_id in self._postings.get(gram, ()):
+                overlaps[entry_id] += 1
+
+        results = []
+        for entry_id, overlap in overlaps.items():
+            name, value, size = self._names[entry_id]
+            score = 2 * overlap / (len(grams) + size)
+            if score >= min_score:
+                results.append(FuzzyMatch(score, name, value))
+
+        results.sort(key=lambda m: -m.score)
+        return results[:limit]
+
+    def __len__(self) -> int:
+        return len(self._names)
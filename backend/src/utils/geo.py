@@ -0,0 +1,265 @@
+"""Geo index for airports and cities.
+
+로컬 데이터 파일(src/data/geo.json)의 공항/도시 좌표를 KD-tree로 색인하여
+가장 가까운 상업 공항과 인근 도시를 빠르게 찾습니다.
+"""
+
+import heapq
+import json
+import math
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, TypedDict
+
+# 데이터 파일 경로
+GEO_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "geo.json"
+
+# 지구 반지름 (km)
+EARTH_RADIUS_KM = 6371.0
+
+
+class Airport(TypedDict):
+    """공항 정보 타입."""
+
+    iata: str
+    name: str
+    city: str
+    country: str
+    lat: float
+    lon: float
+    commercial: bool
+
+
+class City(TypedDict):
+    """도시 정보 타입."""
+
+    name: str
+    aliases: list[str]
+    country: str
+    lat: float
+    lon: float
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """두 좌표 사이의 대원 거리 (km)."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def to_unit_vector(lat: float, lon: float) -> tuple[float, float, float]:
+    """위경도를 단위 구 위의 3차원 좌표로 변환.
+
+    3차원 유클리드(현) 거리는 대원 거리와 단조 관계이므로
+    KD-tree 최근접 탐색을 그대로 사용할 수 있습니다.
+    """
+    phi, lam = math.radians(lat), math.radians(lon)
+    return (
+        math.cos(phi) * math.cos(lam),
+        math.cos(phi) * math.sin(lam),
+        math.sin(phi),
+    )
+
+
+def chord_to_km(chord: float) -> float:
+    """단위 구 위의 현 길이를 대원 거리 (km)로 변환."""
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2))
+
+
+def km_to_chord(km: float) -> float:
+    """대원 거리 (km)를 단위 구 위의 현 길이로 변환."""
+    return 2 * math.sin(min(math.pi / 2, km / (2 * EARTH_RADIUS_KM)))
+
+
+# 3차원 좌표 및 KD-tree 노드 (point, payload, axis, left, right)
+Point = tuple[float, float, float]
+KDNode = tuple[Point, Any, int, "KDNode | None", "KDNode | None"]
+
+
+class KDTree:
+    """3차원 KD-tree (k-최근접 탐색 전용).
+
+    노드는 (point, payload, axis, left, right) 튜플로 저장합니다.
+    """
+
+    def __init__(self, items: Iterable[tuple[Point, Any]]):
+        self._root = self._build(list(items), depth=0)
+        self.size = self._count(self._root)
+
+    def _build(self, items: list[tuple[Point, Any]], depth: int) -> KDNode | None:
+        if not items:
+            return None
+        axis = depth % 3
+        items.sort(key=lambda item: item[0][axis])
+        mid = len(items) // 2
+        point, payload = items[mid]
+        return (
+            point,
+            payload,
+            axis,
+            self._build(items[:mid], depth + 1),
+            self._build(items[mid + 1 :], depth + 1),
+        )
+
+    def _count(self, node: KDNode | None) -> int:
+        if node is None:
+            return 0
+        return 1 + self._count(node[3]) + self._count(node[4])
+
+    def query(
+        self,
+        point: tuple[float, float, float],
+        k: int = 1,
+        max_distance: float | None = None,
+    ) -> list[tuple[float, Any]]:
+        """가장 가까운 k개 (거리, payload) 목록을 거리순으로 반환."""
+        # 최대 힙 (음수 거리) 으로 현재까지의 최근접 k개 유지
+        best: list[tuple[float, int, Any]] = []
+        limit = max_distance if max_distance is not None else math.inf
+        counter = 0
+
+        # (노드, 분할 평면까지의 거리) - 꺼낼 때 현재 반경으로 가지치기
+        stack: list[tuple[Any, float]] = [(self._root, 0.0)]
+        while stack:
+            node, plane_dist = stack.pop()
+            if node is None:
+                continue
+            radius = -best[0][0] if len(best) == k else limit
+            if plane_dist > radius:
+                continue
+            node_point, payload, axis, left, right = node
+
+            dist = math.dist(point, node_point)
+            if dist <= limit:
+                counter += 1
+                if len(best) < k:
+                    heapq.heappush(best, (-dist, counter, payload))
+                elif dist < -best[0][0]:
+                    heapq.heapreplace(best, (-dist, counter, payload))
+
+            diff = point[axis] - node_point[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+
+            # 가까운 쪽을 먼저 탐색하고, 반대편은 평면 거리로 가지치기
+            stack.append((far, abs(diff)))
+            stack.append((near, plane_dist))
+
+        return sorted((-neg_dist, payload) for neg_dist, _, payload in best)
+
+
+class GeoIndex:
+    """공항/도시 지리 색인."""
+
+    def __init__(self, airports: list[Airport], cities: list[City]):
+        self.airports = airports
+        self.cities = cities
+
+        # 상업 공항만 색인 (군 공항 등 제외)
+        self._airport_tree = KDTree(
+            (to_unit_vector(a["lat"], a["lon"]), a)
+            for a in airports
+            if a.get("commercial", True)
+        )
+        self._city_tree = KDTree(
+            (to_unit_vector(c["lat"], c["lon"]), c) for c in cities
+        )
+
+        # 도시명/별칭 -> 도시 정보
+        self._city_by_name: dict[str, City] = {}
+        for city in cities:
+            self._city_by_name[city["name"]] = city
+            for alias in city.get("aliases", []):
+                self._city_by_name[alias.lower()] = city
+
+    @property
+    def city_names(self) -> dict[str, str]:
+        """매칭용 키워드 -> 대표 도시명 매핑."""
+        return {keyword: city["name"] for keyword, city in self._city_by_name.items()}
+
+    def find_city(self, name: str) -> City | None:
+        """도시명 또는 별칭으로 도시 정보 조회."""
+        if not name:
+            return None
+        return self._city_by_name.get(name) or self._city_by_name.get(name.lower())
+
+    def nearest_airports(
+        self,
+        lat: float,
+        lon: float,
+        k: int = 3,
+        max_km: float | None = None,
+    ) -> list[tuple[float, Airport]]:
+        """좌표에서 가장 가까운 상업 공항 목록 (거리 km, 공항)."""
+        max_chord = km_to_chord(max_km) if max_km is not None else None
+        results = self._airport_tree.query(to_unit_vector(lat, lon), k, max_chord)
+        return [(chord_to_km(dist), airport) for dist, airport in results]
+
+    def nearest_airports_for_city(
+        self,
+        city: str,
+        k: int = 3,
+        max_km: float | None = None,
+    ) -> list[tuple[float, Airport]]:
+        """도시에서 가장 가까운 상업 공항 목록. 모르는 도시면 빈 목록."""
+        info = self.find_city(city)
+        if info is None:
+            return []
+        return self.nearest_airports(info["lat"], info["lon"], k, max_km)
+
+    def nearby_cities(
+        self,
+        city: str,
+        k: int = 3,
+        max_km: float | None = None,
+        served: Iterable[str] | None = None,
+    ) -> list[tuple[float, City]]:
+        """주변 도시 목록 (거리 km, 도시). 자기 자신은 제외.
+
+        Args:
+            city: 기준 도시명
+            k: 최대 개수
+            max_km: 최대 거리 (km)
+            served: 지정 시 이 도시들 중에서만 검색
+        """
+        info = self.find_city(city)
+        if info is None:
+            return []
+
+        served_set = set(served) if served is not None else None
+        point = to_unit_vector(info["lat"], info["lon"])
+        max_chord = km_to_chord(max_km) if max_km is not None else None
+
+        # 필터링으로 빠지는 도시가 있으면 탐색 개수를 두 배씩 늘려 다시 탐색
+        fetch = k + 1
+        while True:
+            candidates = self._city_tree.query(point, fetch, max_chord)
+            results = [
+                (chord_to_km(dist), candidate)
+                for dist, candidate in candidates
+                if candidate["name"] != info["name"]
+                and (served_set is None or candidate["name"] in served_set)
+            ]
+            if len(results) >= k or len(candidates) < fetch or fetch >= self._city_tree.size:
+                return results[:k]
+            fetch *= 2
+
+
+@lru_cache
+def load_geo_data() -> dict:
+    """공항/도시 데이터 파일 로드."""
+    with open(GEO_DATA_PATH, encoding="utf-8") as f:
+        data: dict = json.load(f)
+    return data
+
+
+@lru_cache
+def get_geo_index() -> GeoIndex:
+    """캐시된 GeoIndex 인스턴스 반환."""
+    data = load_geo_data()
+    return GeoIndex(data["airports"], data["cities"])
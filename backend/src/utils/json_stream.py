@@ -0,0 +1,179 @@
+"""Incremental (streaming) JSON parser.
+
+LLM 스트리밍 응답처럼 조각(chunk) 단위로 들어오는 JSON 텍스트를 받아
+객체/배열이 닫히는 즉시 (경로, 값) 이벤트를 내보냅니다.
+응답이 중간에 잘려도 그때까지 완성된 값은 모두 사용할 수 있습니다.
+"""
+
+import json
+from collections.abc import Iterator
+from typing import Any, NamedTuple
+
+
+class JSONEvent(NamedTuple):
+    """완성된 JSON 값 이벤트."""
+
+    path: tuple[str | int, ...]  # 루트부터의 키/인덱스 경로 (예: ("day1", "activities", 0))
+    value: Any
+
+
+WHITESPACE = " \t\r\n"
+
+
+class _Frame:
+    """열려 있는 컨테이너 (객체/배열)."""
+
+    __slots__ = ("kind", "value", "key", "index", "valid", "has_value")
+
+    def __init__(self, kind: str):
+        self.kind = kind  # "{" 또는 "["
+        self.value: Any = {} if kind == "{" else []  # 지금까지 완성된 원소로 만든 값
+        self.key: str | None = None  # 객체: 현재 값의 키
+        self.index = 0  # 현재 원소 인덱스 (배열 경로에 사용)
+        self.valid = True  # 문법 오류가 없었는지
+        self.has_value = False  # 마지막 구분자 뒤에 값이 있었는지
+
+
+class IncrementalJSONParser:
+    """조각 단위 JSON 파서.
+
+    feed() 로 텍스트를 넣으면 이번 조각에서 닫힌 객체/배열을 이벤트로 반환합니다.
+    최상위 값 앞뒤의 다른 텍스트(예: 코드 펜스)는 무시합니다.
+    문자열/숫자 같은 말단 값만 한 번 디코딩하고, 컨테이너 값은 이미 완성된
+    원소로 조립하므로 입력 길이에 선형입니다 (이벤트 값은 상위 값과 객체를 공유).
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[str] = []
+        self._stack: list[_Frame] = []
+        self._in_string = False
+        self._in_scalar = False
+        self._escape = False
+        self._token: list[str] = []  # 조각 경계를 넘어 이어지는 문자열/숫자 토큰
+        self._last_string: str | None = None  # 직전에 닫힌 문자열 (객체 키 후보)
+        self.done = False
+
+    @property
+    def text(self) -> str:
+        """지금까지 받은 전체 텍스트."""
+        return "".join(self._chunks)
+
+    def _path(self) -> tuple[str | int, ...]:
+        path: list[str | int] = []
+        for frame in self._stack:
+            path.append((frame.key or "") if frame.kind == "{" else frame.index)
+        return tuple(path)
+
+    def _add(self, value: Any, valid: bool = True) -> None:
+        """완성된 값을 현재 컨테이너에 추가."""
+        frame = self._stack[-1]
+        if frame.has_value or (frame.kind == "{" and frame.key is None):
+            frame.valid = False
+        frame.has_value = True
+        if not valid:
+            frame.valid = False
+        elif frame.kind == "[":
+            frame.value.append(value)
+        elif frame.key is not None:
+            frame.value[frame.key] = value
+
+    def _end_scalar(self) -> None:
+        """숫자/true/false/null 토큰 종료."""
+        self._in_scalar = False
+        token = "".join(self._token)
+        self._token.clear()
+        try:
+            self._add(json.loads(token))
+        except json.JSONDecodeError:
+            self._add(None, valid=False)
+
+    def feed(self, chunk: str) -> list[JSONEvent]:
+        """텍스트 조각 입력. 이번 조각에서 완성된 값의 이벤트 목록 반환."""
+        events: list[JSONEvent] = []
+        self._chunks.append(chunk)
+        token_start = 0  # 이번 조각에서 진행 중인 토큰의 시작 위치
+
+        for i, ch in enumerate(chunk):
+            if self.done:
+                break
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    self._token.append(chunk[token_start : i + 1])
+                    try:
+                        string: str | None = json.loads("".join(self._token))
+                    except json.JSONDecodeError:
+                        string = None
+                    self._token.clear()
+                    frame = self._stack[-1]
+                    if frame.kind == "{" and frame.key is None and not frame.has_value:
+                        if self._last_string is not None:
+                            frame.valid = False  # 콜론 없는 키
+                        self._last_string = string  # 객체 키
+                    else:
+                        self._add(string, valid=string is not None)
+                continue
+
+            if self._in_scalar:
+                if ch not in WHITESPACE and ch not in ",:{}[]\"":
+                    continue
+                self._token.append(chunk[token_start:i])
+                self._end_scalar()
+
+            if not self._stack and ch not in "{[":
+                continue  # 최상위 값 앞의 텍스트
+
+            if ch == '"':
+                self._in_string = True
+                token_start = i
+            elif ch in "{[":
+                self._stack.append(_Frame(ch))
+                self._last_string = None
+            elif ch in "}]":
+                frame = self._stack[-1]
+                valid = frame.valid and frame.kind == ("{" if ch == "}" else "[")
+                if frame.key is not None or frame.index:
+                    valid = valid and frame.has_value  # 값 없는 키, 끝의 쉼표
+                if self._last_string is not None:
+                    valid = False  # 콜론 없는 키
+                self._last_string = None
+                path = self._path()[:-1]
+                self._stack.pop()
+                if valid:
+                    events.append(JSONEvent(path, frame.value))
+                if not self._stack:
+                    self.done = True
+                else:
+                    self._add(frame.value, valid)
+            elif ch == ":":
+                frame = self._stack[-1]
+                if frame.kind == "{" and frame.key is None and self._last_string is not None:
+                    frame.key = self._last_string
+                    self._last_string = None
+                else:
+                    frame.valid = False
+            elif ch == ",":
+                frame = self._stack[-1]
+                if not frame.has_value:
+                    frame.valid = False
+                frame.index += 1
+                frame.key = None
+                frame.has_value = False
+                self._last_string = None
+            elif ch not in WHITESPACE:
+                self._in_scalar = True
+                token_start = i
+
+        if self._in_string or self._in_scalar:
+            self._token.append(chunk[token_start:])
+        return events
+
+    def iter_feed(self, chunks: Iterator[str]) -> Iterator[JSONEvent]:
+        """조각 목록을 순서대로 입력하며 이벤트 반환."""
+        for chunk in chunks:
+            yield from self.feed(chunk)
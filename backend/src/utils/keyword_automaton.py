@@ -0,0 +1,114 @@
+"""Aho-Corasick multi-pattern keyword automaton.
+
+여러 키워드를 하나의 오토마톤으로 컴파일하여
+텍스트를 한 번만 훑어 모든 키워드와 위치를 찾습니다.
+"""
+
+from collections import deque
+from collections.abc import Iterator
+from typing import Any, NamedTuple
+
+
+class KeywordMatch(NamedTuple):
+    """키워드 매칭 결과."""
+
+    start: int  # 시작 위치 (포함)
+    end: int  # 끝 위치 (미포함)
+    keyword: str
+    kind: str  # 엔티티 종류 (예: "city", "style")
+    value: Any  # 정규화된 값 (예: "오사카")
+
+
+class KeywordAutomaton:
+    """Aho-Corasick 오토마톤.
+
+    키워드를 add()로 등록한 뒤 build()로 실패 링크를 계산합니다.
+    검색은 텍스트 길이 n, 매칭 수 m 에 대해 O(n + m) 입니다.
+    """
+
+    def __init__(self) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # 각 노드에서 끝나는 (키워드, 종류, 값) 목록
+        self._own: list[list[tuple[str, str, Any]]] = [[]]
+        # 실패 링크를 따라 병합된 출력 (build 후 사용)
+        self._outputs: list[list[tuple[str, str, Any]]] = [[]]
+        self._built = False
+        self.size = 0
+
+    def add(self, keyword: str, kind: str, value: Any) -> bool:
+        """키워드 등록. 같은 키워드+종류가 이미 있으면 무시하고 False 반환."""
+        if not keyword:
+            return False
+
+        node = 0
+        for ch in keyword:
+            next_node = self._goto[node].get(ch)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][ch] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._own.append([])
+            node = next_node
+
+        if any(k == kind for _, k, _ in self._own[node]):
+            return False
+
+        self._own[node].append((keyword, kind, value))
+        self._built = False
+        self.size += 1
+        return True
+
+    def build(self) -> "KeywordAutomaton":
+        """BFS로 실패 링크와 출력 링크 계산."""
+        self._outputs = [list(outputs) for outputs in self._own]
+
+        queue: deque[int] = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._outputs[child] = (
+                    self._outputs[child] + self._outputs[self._fail[child]]
+                )
+
+        self._built = True
+        return self
+
+    def iter_matches(self, text: str) -> Iterator[KeywordMatch]:
+        """겹치는 것을 포함한 모든 매칭을 끝 위치 순으로 반환."""
+        if not self._built:
+            self.build()
+
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for keyword, kind, value in outputs[node]:
+                yield KeywordMatch(i + 1 - len(keyword), i + 1, keyword, kind, value)
+
+    def find_all(self, text: str) -> list[KeywordMatch]:
+        """겹치지 않는 매칭 목록 (가장 왼쪽, 같은 위치면 가장 긴 것 우선)."""
+        matches = sorted(
+            self.iter_matches(text),
+            key=lambda m: (m.start, -(m.end - m.start)),
+        )
+
+        selected = []
+        last_end = 0
+        for match in matches:
+            if match.start >= last_end:
+                selected.append(match)
+                last_end = match.end
+        return selected
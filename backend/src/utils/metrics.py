@@ -0,0 +1,60 @@
+"""In-process metrics registry.
+
+카운터와 관측값(count/sum/max)을 메모리에 집계하고
+/api/metrics 엔드포인트에서 스냅샷으로 노출합니다.
+"""
+
+import threading
+from collections import defaultdict
+
+
+class Metrics:
+    """스레드 안전 카운터/관측값 레지스트리."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = defaultdict(float)
+        self._observations: dict[str, dict[str, float]] = {}
+
+    def incr(self, name: str, value: float = 1) -> None:
+        """카운터 증가."""
+        with self._lock:
+            self._counters[name] += value
+
+    def observe(self, name: str, value: float) -> None:
+        """관측값 기록 (예: 지연 시간 ms)."""
+        with self._lock:
+            stats = self._observations.get(name)
+            if stats is None:
+                self._observations[name] = {"count": 1, "sum": value, "max": value}
+            else:
+                stats["count"] += 1
+                stats["sum"] += value
+                stats["max"] = max(stats["max"], value)
+
+    def get(self, name: str) -> float:
+        """카운터 값 조회."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> dict:
+        """현재 지표 스냅샷."""
+        with self._lock:
+            observations = {
+                name: {
+                    **stats,
+                    "avg": stats["sum"] / stats["count"] if stats["count"] else 0,
+                }
+                for name, stats in self._observations.items()
+            }
+            return {"counters": dict(self._counters), "observations": observations}
+
+    def reset(self) -> None:
+        """모든 지표 초기화."""
+        with self._lock:
+            self._counters.clear()
+            self._observations.clear()
+
+
+# 전역 지표 인스턴스
+metrics = Metrics()
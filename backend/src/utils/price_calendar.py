@@ -0,0 +1,104 @@
+"""Nightly price calendar for accommodation.
+
+요일(주말), 계절, 현지 공휴일별 숙박 요금 배수를 계산합니다.
+공휴일/계절 데이터는 src/data/holidays.json 에서 로드합니다.
+"""
+
+import json
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from src.utils.geo import get_geo_index
+
+# 데이터 파일 경로
+HOLIDAYS_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "holidays.json"
+
+# 주말 요금이 적용되는 숙박일 (금요일, 토요일 밤)
+WEEKEND_NIGHTS = (4, 5)
+
+
+@lru_cache
+def load_calendar_data() -> dict:
+    """공휴일/계절 데이터 파일 로드."""
+    with open(HOLIDAYS_DATA_PATH, encoding="utf-8") as f:
+        data: dict = json.load(f)
+
+    # 공휴일은 datetime64 배열로 미리 변환
+    for profile in data["countries"].values():
+        profile["holidays"] = np.array(profile["holidays"], dtype="datetime64[D]")
+        profile["seasons"] = np.array(profile["seasons"], dtype=np.float64)
+    return data
+
+
+def get_country(destination: str) -> str:
+    """목적지의 국가 코드. 모르는 도시면 "default"."""
+    city = get_geo_index().find_city(destination)
+    return city["country"] if city else "default"
+
+
+def rate_multipliers(destination: str, start: date | str, nights: int) -> np.ndarray:
+    """체크인 날짜부터 각 숙박일의 요금 배수.
+
+    Args:
+        destination: 목적지 도시명
+        start: 체크인 날짜
+        nights: 숙박 일수
+
+    Returns:
+        길이 nights 의 요금 배수 배열
+    """
+    data = load_calendar_data()
+    profile = data["countries"].get(get_country(destination), data["countries"]["default"])
+
+    days = np.datetime64(start, "D") + np.arange(nights)
+
+    # 1970-01-01 은 목요일 (월요일=0 기준 3)
+    weekdays = (days.astype(np.int64) + 3) % 7
+    months = days.astype("datetime64[M]").astype(np.int64) % 12
+
+    multipliers: np.ndarray = profile["seasons"][months]
+    multipliers = np.where(
+        np.isin(weekdays, WEEKEND_NIGHTS),
+        multipliers * data["weekend_multiplier"],
+        multipliers,
+    )
+    multipliers = np.where(
+        np.isin(days, profile["holidays"]),
+        multipliers * data["holiday_multiplier"],
+        multipliers,
+    )
+    return multipliers
+
+
+def price_nights(
+    base_prices: np.ndarray,
+    destination: str,
+    start: date | str,
+    nights: int,
+) -> np.ndarray:
+    """후보 숙소 전체의 숙박일별 요금 행렬 (후보 수 × nights)."""
+    multipliers = rate_multipliers(destination, start, nights)
+    prices: np.ndarray = np.asarray(base_prices, dtype=np.float64)[:, None] * multipliers[None, :]
+    return prices
+
+
+def window_totals(
+    base_prices: np.ndarray,
+    destination: str,
+    window_start: date | str,
+    window_days: int,
+    nights: int,
+) -> np.ndarray:
+    """체크인 날짜별 총 숙박 요금 행렬 (후보 수 × window_days).
+
+    window_start 부터 window_days 일 동안의 각 체크인 날짜에 대해
+    nights 박의 요금 합계를 누적합으로 한 번에 계산합니다.
+    """
+    multipliers = rate_multipliers(destination, window_start, window_days + nights - 1)
+    cumulative = np.concatenate(([0.0], np.cumsum(multipliers)))
+    sums = cumulative[nights:] - cumulative[:-nights]
+    totals: np.ndarray = np.asarray(base_prices, dtype=np.float64)[:, None] * sums[None, :]
+    return totals
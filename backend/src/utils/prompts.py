@@ -36,6 +36,9 @@
 - 인원: {num_people}
 - 여행 스타일: {travel_style}
 
+이전 대화:
+{conversation_context}
+
 사용자 메시지: {user_message}
 
 위 정보를 바탕으로:
@@ -112,6 +115,54 @@
 """
 
 
+ITINERARY_SKELETON_USER_PROMPT = """다음 정보로 {duration}박 {days}일 여행의 일정 뼈대를 만드세요.
+
+목적지: {destination}
+여행 스타일: {travel_style}
+
+요구사항:
+- 각 날짜의 테마만 정하세요 (상세 활동 제외)
+- 첫날은 도착, 마지막 날은 출발을 고려하세요
+- 날짜별 테마가 겹치지 않게 하세요
+
+JSON 형식으로 출력:
+{{
+    "day1": "이 날의 테마",
+    "day2": "이 날의 테마",
+    ...
+}}
+"""
+
+ITINERARY_DAY_USER_PROMPT = """{destination} {duration}박 {days}일 여행 중 {day_num}일차의 하루 일정을 생성하세요.
+
+날짜: {date}
+테마: {theme}
+여행 스타일: {travel_style}
+{day_note}
+
+요구사항:
+- 시간대별 상세 일정
+- 각 활동의 설명과 예상 소요 시간
+- 테마에 맞는 현지 명소와 맛집 포함
+
+JSON 형식으로 출력:
+{{
+    "date": "{date}",
+    "theme": "{theme}",
+    "activities": [
+        {{
+            "time": "HH:MM",
+            "activity": "활동 이름",
+            "type": "활동 타입",
+            "location": "장소",
+            "duration": "소요 시간",
+            "description": "활동 설명"
+        }}
+    ]
+}}
+"""
+
+
 # ===========================
 # 응답 생성 Agent 프롬프트
 # ===========================
@@ -154,3 +205,27 @@
 위 정보를 보기 좋은 마크다운 형식으로 정리해주세요.
 예상 총 비용도 계산해서 알려주세요.
 """
+
+
+# ===========================
+# 대화 요약 프롬프트
+# ===========================
+
+HISTORY_SUMMARY_SYSTEM_PROMPT = """당신은 여행 상담 대화 요약가입니다.
+이전 요약과 새 대화를 합쳐 다음 상담에 필요한 내용만 짧게 정리하세요.
+
+## 요약 원칙
+- 확정된 여행 정보(목적지, 기간, 예산, 인원, 스타일)를 먼저 적으세요
+- 사용자의 선호/제약/변경 요청을 빠짐없이 적으세요
+- 인사말, 반복 질문은 생략하세요
+- 5문장 이내의 평문으로 작성하세요
+"""
+
+HISTORY_SUMMARY_USER_PROMPT = """이전 요약:
+{previous_summary}
+
+새 대화:
+{conversation}
+
+위 내용을 하나의 요약으로 합쳐주세요.
+"""
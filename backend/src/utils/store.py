@@ -0,0 +1,194 @@
+"""Local persistent key-value store.
+
+SQLite 기반의 네임스페이스별 키-값 저장소입니다.
+항목마다 만료 시간(TTL)을 가지며, 네임스페이스별 최대 항목 수를 넘으면
+가장 오래 사용되지 않은 항목부터 제거합니다 (제한 없음으로 지정한 네임스페이스 제외).
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 조회 시각 갱신을 모아 두는 최대 건수 (넘으면 한 번에 기록, 쓰기 때도 함께 기록)
+ACCESS_FLUSH_BATCH = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (namespace, accessed_at);
+"""
+
+
+class LocalStore:
+    """스레드 안전 SQLite 키-값 저장소.
+
+    Args:
+        path: 데이터베이스 파일 경로 (":memory:" 이면 메모리)
+        max_entries: 네임스페이스별 최대 항목 수
+        unbounded_namespaces: 최대 항목 수를 적용하지 않는 네임스페이스
+    """
+
+    def __init__(
+        self,
+        path: str | Path = ":memory:",
+        max_entries: int = 10000,
+        unbounded_namespaces: Iterable[str] = (),
+    ):
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.unbounded_namespaces = frozenset(unbounded_namespaces)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        # 아직 기록하지 않은 조회 시각 ((네임스페이스, 키) -> 시각)
+        self._accessed: dict[tuple[str, str], float] = {}
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        """항목 조회. 없거나 만료되었으면 default 반환."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is None:
+                return default
+
+            value, expires_at = row
+            if expires_at is not None and expires_at < now:
+                self._conn.execute(
+                    "DELETE FROM entries WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                )
+                self._conn.commit()
+                return default
+
+            # 조회마다 커밋하지 않고 모아 두었다가 기록
+            self._accessed[(namespace, key)] = now
+            if len(self._accessed) >= ACCESS_FLUSH_BATCH:
+                self._flush_accessed()
+                self._conn.commit()
+        return json.loads(value)
+
+    def set(self, namespace: str, key: str, value: Any, ttl: float | None = None) -> None:
+        """항목 저장 (JSON 직렬화 가능한 값)."""
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock:
+            self._flush_accessed()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, json.dumps(value, ensure_ascii=False), expires_at, now),
+            )
+            if namespace not in self.unbounded_namespaces:
+                self._enforce_limit(namespace)
+            self._conn.commit()
+
+    def delete(self, namespace: str, key: str) -> bool:
+        """항목 삭제. 삭제되었으면 True."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            )
+            self._conn.commit()
+            return cursor.rowcount > 0
+
+    def scan(self, namespace: str, prefix: str = "") -> Iterator[tuple[str, Any]]:
+        """접두사가 일치하는 유효 항목 (key, value) 목록."""
+        pattern = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value FROM entries WHERE namespace = ? AND key LIKE ? ESCAPE '\\' "
+                "AND (expires_at IS NULL OR expires_at >= ?)",
+                (namespace, pattern, time.time()),
+            ).fetchall()
+        for key, value in rows:
+            yield key, json.loads(value)
+
+    def count(self, namespace: str) -> int:
+        """네임스페이스 항목 수 (만료 포함)."""
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM entries WHERE namespace = ?", (namespace,)
+            ).fetchone()
+        return int(count)
+
+    def purge_expired(self) -> int:
+        """만료된 항목 일괄 제거. 제거된 개수 반환."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at < ?",
+                (time.time(),),
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def clear(self, namespace: str | None = None) -> None:
+        """항목 전체 제거 (namespace 지정 시 해당 네임스페이스만)."""
+        with self._lock:
+            if namespace is None:
+                self._conn.execute("DELETE FROM entries")
+            else:
+                self._conn.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+            self._conn.commit()
+
+    def close(self) -> None:
+        """연결 종료."""
+        with self._lock:
+            self._flush_accessed()
+            self._conn.commit()
+            self._conn.close()
+
+    def _flush_accessed(self) -> None:
+        """모아 둔 조회 시각 기록 (커밋은 호출 측에서)."""
+        if self._accessed:
+            self._conn.executemany(
+                "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                [(at, namespace, key) for (namespace, key), at in self._accessed.items()],
+            )
+            self._accessed.clear()
+
+    def _enforce_limit(self, namespace: str) -> None:
+        """최대 항목 수를 넘으면 오래 사용되지 않은 항목부터 제거."""
+        count = self._conn.execute(
+            "SELECT COUNT(*) FROM entries WHERE namespace = ?", (namespace,)
+        ).fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM entries WHERE rowid IN ("
+                "SELECT rowid FROM entries WHERE namespace = ? "
+                "ORDER BY accessed_at LIMIT ?)",
+                (namespace, overflow),
+            )
+            logger.debug(f"Store evicted {overflow} entries from {namespace}")
+
+
+@lru_cache
+def get_local_store() -> LocalStore:
+    """설정 경로의 전역 저장소 (첫 사용 시 생성)."""
+    return LocalStore(
+        settings.local_store_path,
+        settings.local_store_max_entries,
+        settings.local_store_unbounded_namespaces,
+    )
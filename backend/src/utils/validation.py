@@ -0,0 +1,80 @@
+"""Runtime validation against TypedDict schemas.
+
+LLM 이 생성한 dict 가 Activity/DayPlan 같은 TypedDict 형식과 맞는지
+런타임에 검사합니다. None 을 허용하는 필드와 NotRequired 필드는 생략할 수 있습니다.
+"""
+
+import types
+from functools import lru_cache
+from typing import (
+    Any,
+    Literal,
+    NotRequired,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+    is_typeddict,
+)
+
+
+@lru_cache
+def _schema_fields(schema: type) -> tuple[tuple[str, Any, bool], ...]:
+    """(필드명, 타입, 생략 가능 여부) 목록."""
+    fields = []
+    for name, hint in get_type_hints(schema, include_extras=True).items():
+        optional = get_origin(hint) is NotRequired
+        if optional:
+            hint = get_args(hint)[0]
+        if _allows_none(hint):
+            optional = True
+        fields.append((name, hint, optional))
+    return tuple(fields)
+
+
+def _allows_none(hint: Any) -> bool:
+    return get_origin(hint) in (Union, types.UnionType) and type(None) in get_args(hint)
+
+
+def matches_type(value: Any, hint: Any) -> bool:
+    """값이 타입 힌트와 맞는지 검사."""
+    if hint is Any:
+        return True
+    if hint is type(None):
+        return value is None
+    if is_typeddict(hint):
+        return matches_typed_dict(value, hint)
+
+    origin = get_origin(hint)
+    if origin is Literal:
+        return value in get_args(hint)
+    if origin in (Union, types.UnionType):
+        return any(matches_type(value, arg) for arg in get_args(hint))
+    if origin is list:
+        args = get_args(hint)
+        return isinstance(value, list) and (
+            not args or all(matches_type(item, args[0]) for item in value)
+        )
+    if origin is dict:
+        return isinstance(value, dict)
+    if hint is float:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if hint is int:
+        return isinstance(value, int) and not isinstance(value, bool)
+    if isinstance(hint, type):
+        return isinstance(value, hint)
+    return True
+
+
+def matches_typed_dict(value: Any, schema: type) -> bool:
+    """dict 가 TypedDict 스키마와 맞는지 검사."""
+    if not isinstance(value, dict):
+        return False
+    for name, hint, optional in _schema_fields(schema):
+        if name not in value:
+            if not optional:
+                return False
+            continue
+        if not matches_type(value[name], hint):
+            return False
+    return True
@@ -3,11 +3,17 @@
 Phase 1 프로토타입을 위한 간단한 채팅 인터페이스입니다.
 """
 
-import streamlit as st
 from uuid import uuid4
 
+import streamlit as st
+
 from src.graph.phase1_graph import get_phase1_graph
-from src.models.state import create_initial_state, TravelState
+from src.models.state import (
+    TravelState,
+    append_message,
+    create_initial_state,
+    sync_message_cursor,
+)
 
 # 페이지 설정
 st.set_page_config(
@@ -54,12 +60,11 @@ def init_session_state():
     if "state" not in st.session_state:
         st.session_state.state = create_initial_state(st.session_state.session_id)
         # 첫 인사 메시지 추가
-        st.session_state.state["messages"] = [
-            {
-                "role": "assistant",
-                "content": "안녕하세요! 🌏 여행 계획을 도와드리겠습니다.\n\n어디로 여행을 가고 싶으세요?",
-            }
-        ]
+        append_message(
+            st.session_state.state,
+            "assistant",
+            "안녕하세요! 🌏 여행 계획을 도와드리겠습니다.\n\n어디로 여행을 가고 싶으세요?",
+        )
 
 
 def get_progress_info(state: TravelState) -> dict:
@@ -322,16 +327,15 @@ def process_user_input(user_message: str):
     state = st.session_state.state
 
     # 사용자 메시지 추가
-    messages = list(state.get("messages", []))
-    messages.append({"role": "user", "content": user_message})
-    state["messages"] = messages
+    append_message(state, "user", user_message)
 
     # LangGraph 워크플로우 실행
     graph = get_phase1_graph()
     result = graph.invoke(dict(state))
 
-    # 상태 업데이트
+    # 상태 업데이트 (이번 턴에 추가된 메시지만 커서에 반영)
     st.session_state.state = {**state, **result}
+    sync_message_cursor(st.session_state.state)
 
 
 def main():
@@ -355,12 +359,11 @@ def main():
         if st.button("🔄 새 여행 계획 시작", use_container_width=True):
             st.session_state.session_id = str(uuid4())
             st.session_state.state = create_initial_state(st.session_state.session_id)
-            st.session_state.state["messages"] = [
-                {
-                    "role": "assistant",
-                    "content": "안녕하세요! 🌏 여행 계획을 도와드리겠습니다.\n\n어디로 여행을 가고 싶으세요?",
-                }
-            ]
+            append_message(
+                st.session_state.state,
+                "assistant",
+                "안녕하세요! 🌏 여행 계획을 도와드리겠습니다.\n\n어디로 여행을 가고 싶으세요?",
+            )
             st.rerun()
 
         st.markdown("---")
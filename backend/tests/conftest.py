@@ -1,9 +1,43 @@
 """Pytest configuration and fixtures."""
 
+import socket
+import threading
+import time
+
 import pytest
+import uvicorn
 from fastapi.testclient import TestClient
 
 
+@pytest.fixture(autouse=True)
+def local_store(tmp_path, monkeypatch):
+    """테스트마다 임시 경로의 로컬 저장소 사용."""
+    from src.config import settings
+    from src.tools.llm_cache import get_llm_cache
+    from src.tools.llm_usage import get_usage_tracker
+    from src.utils.store import get_local_store
+
+    monkeypatch.setattr(settings, "local_store_path", str(tmp_path / "store.sqlite3"))
+    get_local_store.cache_clear()
+    get_llm_cache.cache_clear()
+    get_usage_tracker.cache_clear()
+    yield get_local_store()
+    get_local_store().close()
+    get_local_store.cache_clear()
+    get_llm_cache.cache_clear()
+    get_usage_tracker.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def itinerary_templates():
+    """테스트마다 빈 일정 템플릿 캐시 사용."""
+    from src.agents.phase1.itinerary_templates import template_cache
+
+    template_cache.clear()
+    yield template_cache
+    template_cache.clear()
+
+
 @pytest.fixture
 def sample_travel_state():
     """Sample travel state for testing."""
@@ -93,3 +127,32 @@ def partial_state():
         updated_at="2024-12-01T00:00:00",
         error=None,
     )
+
+
+@pytest.fixture
+def llm_stub(monkeypatch):
+    """로컬 LLM 스텁 서버를 띄우고 LLM 클라이언트가 이를 사용하도록 설정."""
+    from src.config import settings
+    from src.tools.llm_client import reset_llm_clients
+    from src.tools.llm_stub_server import create_stub_app
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    app = create_stub_app()
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+
+    monkeypatch.setattr(settings, "openai_base_url", f"http://127.0.0.1:{port}/v1")
+    reset_llm_clients()
+    yield app
+
+    server.should_exit = True
+    thread.join(timeout=5)
+    reset_llm_clients()
@@ -1,17 +1,13 @@
 """Tests for Phase 1 Agents."""
 
+from concurrent.futures import Future
+from functools import partial
+
 import pytest
 
-from src.agents.phase1.info_collector import (
-    extract_budget,
-    extract_destination,
-    extract_duration,
-    extract_num_people,
-    extract_travel_style,
-    get_missing_fields,
-    info_collector_node,
-)
+from src.agents.phase1.cost_table import get_cost_table
 from src.agents.phase1.flight_searcher import (
+    estimate_flight_minutes,
     get_airport_code,
     search_flights,
     search_flights_node,
@@ -20,10 +16,30 @@
     search_hotels,
     search_hotels_node,
 )
+from src.agents.phase1.info_collector import (
+    extract_budget,
+    extract_destination,
+    extract_duration,
+    extract_entities,
+    extract_num_people,
+    extract_travel_style,
+    fuzzy_match_destination,
+    get_missing_fields,
+    info_collector_node,
+    suggest_nearby_cities,
+)
 from src.agents.phase1.itinerary_planner import (
     generate_itinerary,
     plan_itinerary_node,
 )
+from src.agents.phase1.prefetch import schedule_prefetch
+from src.agents.phase1.search_cache import (
+    SearchEntry,
+    flight_search_key,
+    hotel_search_key,
+    search_cache,
+)
+from src.utils.metrics import metrics
 
 
 class TestInfoCollector:
@@ -40,6 +56,81 @@ def test_extract_destination_english(self):
         assert extract_destination("osaka trip") == "오사카"
         assert extract_destination("Let's go to tokyo") == "도쿄"
 
+    def test_extract_destination_fuzzy(self):
+        """오타/다른 표기 목적지 추출 테스트."""
+        assert extract_destination("오사까 가고 싶어요") == "오사카"
+        assert extract_destination("Osakaa") == "오사카"
+        assert extract_destination("new-york 여행") == "뉴욕"
+        assert extract_destination("방꼭으로 갈래요") == "방콕"
+
+    def test_fuzzy_match_destination_no_false_positive(self):
+        """도시가 없는 문장은 유사 매칭하지 않음 테스트."""
+        assert fuzzy_match_destination("여행 가고 싶어요") is None
+        assert fuzzy_match_destination("안녕하세요") is None
+        assert extract_destination("3박 4일 맛집 위주로") is None
+
+    def test_common_words_are_not_destinations(self):
+        """도시 이름과 비슷한 일상 단어는 목적지로 매칭하지 않음 테스트."""
+        for text in [
+            "바다 보이는 곳이면 좋겠어요",
+            "친구랑 사이 좋게 다녀올래요",
+            "시드 머니가 부족해요",
+            "마닐 여행 가고 싶어",
+            "로마자로 써주세요",
+            "하와이안 피자 먹고 싶어요",
+            "파리바게트 들를래요",
+        ]:
+            assert extract_destination(text) is None, text
+
+    def test_city_names_inside_words_are_not_destinations(self):
+        """다른 단어 안에 든 도시 이름은 목적지로 매칭하지 않음 테스트."""
+        assert extract_destination("아로마 마사지 받고 싶어요") is None
+        assert extract_destination("chrome 브라우저로 예약") is None
+        assert extract_destination("balinese 스타일 리조트 찾아요") is None
+        assert extract_destination("bali, 그리고 세부") == "발리"
+        assert extract_destination("osaka로 갈래요") == "오사카"
+
+    def test_fuzzy_match_requires_margin_and_cue(self):
+        """유사 매칭은 차순위와 점수 차, 목적지 표현이 있어야 함 테스트."""
+        assert extract_destination("싱가폴 여행 가고 싶어요") == "싱가포르"
+        assert extract_destination("쿠알라룸프르로 떠나요") == "쿠알라룸푸르"
+        assert fuzzy_match_destination("하와이안 여행 가요") is None
+        assert fuzzy_match_destination("어제 본 영화 싱가폴 배경이었어요 정말 좋았어요") is None
+        assert extract_destination("로마에서 3일 보낼래요") == "로마"
+
+    def test_extract_destination_earliest(self):
+        """가장 먼저 등장한 목적지 추출 테스트."""
+        assert extract_destination("도쿄 말고 오사카") == "도쿄"
+        assert extract_destination("I want to visit new york, not paris") == "뉴욕"
+
+    def test_extract_entities_offsets(self):
+        """엔티티 위치 추출 테스트."""
+        entities = extract_entities("오사카 먹방 혼자")
+        assert [(e.start, e.end, e.kind, e.value) for e in entities] == [
+            (0, 3, "city", "오사카"),
+            (4, 6, "style", "맛집"),
+            (7, 9, "people", 1),
+        ]
+
+    def test_extract_destination_geo_city(self):
+        """지리 데이터 도시 추출 테스트."""
+        assert extract_destination("고베 가고 싶어요") == "고베"
+        assert extract_destination("phuket trip") == "푸켓"
+
+    def test_short_geo_aliases_match_whole_words(self):
+        """짧은 지리 데이터 별칭은 단어 전체가 일치할 때만 매칭 테스트."""
+        from src.agents.phase1.info_collector import ENTITY_AUTOMATON
+
+        assert not [m for m in ENTITY_AUTOMATON.find_all("chrome 아로마") if m.kind == "city"]
+        assert extract_destination("rome trip") == "로마"
+        assert extract_destination("로마는 처음이에요") == "로마"
+        assert extract_destination("로마 말고 도쿄") == "로마"
+
+    def test_suggest_nearby_cities(self):
+        """인근 지원 도시 추천 테스트."""
+        assert "오사카" in suggest_nearby_cities("고베")
+        assert suggest_nearby_cities("오사카") == []
+
     def test_extract_destination_none(self):
         """목적지 없을 때 테스트."""
         assert extract_destination("여행 가고 싶어요") is None
@@ -70,6 +161,7 @@ def test_extract_budget(self):
     def test_extract_budget_text(self):
         """텍스트 예산 추출 테스트."""
         assert extract_budget("백만원") == 1000000
+        assert extract_budget("이백만원") == 2000000
 
     def test_extract_budget_none(self):
         """예산 없을 때 테스트."""
@@ -153,6 +245,41 @@ def test_info_collector_node_extracts_info(self, collecting_state):
         assert "맛집" in result.get("travel_style", [])
 
 
+class TestMessageCursor:
+    """대화 커서 테스트."""
+
+    def test_cursor_tracks_last_message_per_role(self):
+        """역할별 마지막 메시지를 커서로 조회하는지 테스트."""
+        from src.models.state import append_message, create_initial_state, last_message
+
+        state = create_initial_state("cursor-test")
+        assert last_message(state, "user") is None
+
+        append_message(state, "assistant", "안녕하세요")
+        append_message(state, "user", "오사카")
+        append_message(state, "assistant", "몇 박인가요?")
+        assert state["message_cursor"] == {"assistant": 2, "user": 1}
+        assert last_message(state, "user")["content"] == "오사카"
+
+    def test_cursor_scans_only_new_messages(self):
+        """Node 가 추가한 메시지만 이어서 반영하는지 테스트."""
+        from src.models.state import last_message, sync_message_cursor
+
+        state = {
+            "messages": [{"role": "user", "content": f"m{i}"} for i in range(3)],
+            "message_cursor": {"user": 1},
+        }
+        # 커서 이전 메시지는 다시 보지 않음
+        state["messages"][0]["role"] = "broken"
+        state["messages"].append({"role": "assistant", "content": "reply"})
+        assert sync_message_cursor(state) == {"user": 2, "assistant": 3}
+
+        # 히스토리가 줄어들면 처음부터 다시 계산
+        state["messages"] = [{"role": "user", "content": "new"}]
+        assert last_message(state, "user")["content"] == "new"
+        assert last_message(state, "assistant") is None
+
+
 class TestFlightSearcher:
     """Flight Searcher Agent 테스트."""
 
@@ -163,6 +290,45 @@ def test_get_airport_code(self):
         assert get_airport_code("방콕") == "BKK"
         assert get_airport_code("제주") == "CJU"
 
+    def test_get_airport_code_nearest(self):
+        """매핑에 없는 도시의 최근접 공항 테스트."""
+        assert get_airport_code("푸켓") == "HKT"
+        assert get_airport_code("삿포로") == "CTS"
+        assert get_airport_code("고베") != "ICN"
+
+    def test_search_flights_unknown_city(self):
+        """매핑에 없는 도시 항공권 검색 테스트."""
+        flights = search_flights("푸켓", 3)
+        assert all(f["outbound"]["arrival_airport"] == "HKT" for f in flights)
+        assert estimate_flight_minutes("푸켓") > estimate_flight_minutes("오사카")
+
+    def test_unresolvable_destination_has_no_flights(self, sample_travel_state):
+        """알 수 없는 목적지는 항공권을 만들지 않는지 테스트."""
+        assert get_airport_code("없는도시") is None
+        assert search_flights("없는도시", 3) == []
+
+        sample_travel_state.update(destination="없는도시", flight_options=[])
+        result = search_flights_node(sample_travel_state)
+        assert result["flight_options"] == []
+        assert "찾을 수 없습니다" in result["messages"][0]["content"]
+
+    def test_price_city_is_limited_by_distance(self):
+        """먼 카탈로그 도시의 가격을 빌려 쓰지 않는지 테스트."""
+        from src.agents.phase1.flight_searcher import (
+            estimate_base_prices,
+            get_price_city,
+        )
+
+        assert get_price_city("고베") == "오사카"
+        for city in ("프랑크푸르트", "로마", "부산", "상하이"):
+            assert get_price_city(city) is None
+
+        paris = estimate_base_prices("파리")
+        frankfurt = estimate_base_prices("프랑크푸르트")
+        assert frankfurt != paris
+        assert frankfurt["budget"] < frankfurt["standard"] < frankfurt["premium"]
+        assert estimate_base_prices("부산")["budget"] < estimate_base_prices("프랑크푸르트")["budget"]
+
     def test_search_flights_returns_3_options(self):
         """항공권 검색이 3개 옵션 반환 테스트."""
         flights = search_flights("오사카", 3)
@@ -230,6 +396,21 @@ def test_search_hotels_total_price(self):
             expected_max = hotel["price_per_night"] * 3 * 1.2
             assert expected_min <= hotel["total_price"] <= expected_max
 
+    def test_search_hotels_nightly_prices(self):
+        """숙박일별 요금 합계 테스트."""
+        hotels = search_hotels("오사카", 3, 2, check_in_date="2026-05-01")
+        for hotel in hotels:
+            assert len(hotel["nightly_prices"]) == 3
+            assert sum(hotel["nightly_prices"]) == hotel["total_price"]
+
+    def test_search_hotels_weekend_and_holiday_rates(self):
+        """주말/공휴일 요금 할증 테스트."""
+        # 2026-05-03 (일, 헌법기념일) / 2026-05-07 (목, 평일)
+        hotels = search_hotels("오사카", 5, 2, check_in_date="2026-05-03")
+        for hotel in hotels:
+            holiday, *_, weekday = hotel["nightly_prices"]
+            assert holiday > weekday
+
     def test_search_hotels_node(self, sample_travel_state):
         """숙박 검색 노드 테스트."""
         sample_travel_state["hotel_options"] = []
@@ -239,6 +420,118 @@ def test_search_hotels_node(self, sample_travel_state):
         assert len(result["hotel_options"]) == 3
 
 
+class TestCostTable:
+    """Cost Table 테스트."""
+
+    def test_cost_table_shape(self):
+        """비용 테이블 차원 테스트."""
+        table = get_cost_table()
+        assert table.costs.shape == (len(table.destinations), 14, 10, 3)
+
+    def test_cost_table_monotonic(self):
+        """기간/인원/등급이 늘수록 비용 증가 테스트."""
+        table = get_cost_table()
+        assert (table.costs[:, 1:] > table.costs[:, :-1]).all()
+        assert (table.costs[:, :, 1:] > table.costs[:, :, :-1]).all()
+        assert (table.costs[..., 1:] >= table.costs[..., :-1]).all()
+
+    def test_affordable_respects_budget(self):
+        """예산 초과 목적지 제외 테스트."""
+        table = get_cost_table()
+        results = table.affordable(budget=500000, duration=2, num_people=1)
+        for result in results:
+            assert result["estimated_total"] <= 500000
+            assert table.lookup(result["destination"], 2, 1)[result["tier"]] == (
+                result["estimated_total"]
+            )
+
+    def test_lodging_follows_price_calendar(self):
+        """숙박비가 숙박 캘린더와 같은 날짜별 요금 배수로 계산되는지 테스트."""
+        import numpy as np
+
+        from src.agents.phase1.cost_table import (
+            HOTEL_PRICE_FACTOR,
+            estimate_local_costs,
+        )
+        from src.agents.phase1.flight_searcher import get_flight_data
+        from src.agents.phase1.hotel_searcher import get_hotel_candidates
+        from src.utils.price_calendar import window_totals
+
+        weekday = get_cost_table("2026-03-09")  # 월요일
+        weekend = get_cost_table("2026-03-13")  # 금요일
+        assert weekend.lookup("도쿄", 1, 2)["standard"] > weekday.lookup("도쿄", 1, 2)["standard"]
+
+        base = np.mean([h["base_price"] for h in get_hotel_candidates("오사카", "budget")])
+        expected = window_totals(np.array([base * HOTEL_PRICE_FACTOR]), "오사카", "2026-03-13", 1, 3)
+        lodging = (
+            weekend.lookup("오사카", 3, 2)["budget"]
+            - 2 * get_flight_data("오사카")["prices"]["budget"]
+            - sum(estimate_local_costs(3, 2).values())
+        )
+        assert lodging == pytest.approx(expected[0, 0], abs=1)
+
+
+class TestSearchPrefetch:
+    """Speculative Prefetch 테스트."""
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self):
+        search_cache.clear()
+        metrics.reset()
+        yield
+        search_cache.clear()
+
+    def test_prefetch_requires_destination_and_duration(self, collecting_state):
+        """목적지/기간 없으면 선행 검색 안 함 테스트."""
+        collecting_state["destination"] = "오사카"
+        assert schedule_prefetch(collecting_state) == []
+
+    def test_prefetch_warms_search_nodes(self, partial_state):
+        """선행 검색 결과를 검색 노드가 사용하는지 테스트."""
+        assert schedule_prefetch(partial_state) == ["flights"]
+        assert schedule_prefetch({**partial_state, "num_people": 2}) == ["hotels"]
+        assert schedule_prefetch({**partial_state, "num_people": 2}) == []
+
+        state = {**partial_state, "info_collected": True, "num_people": 2}
+        flights = search_flights_node(state)["flight_options"]
+        hotels = search_hotels_node(state)["hotel_options"]
+
+        entry = search_cache.get(flight_search_key("오사카", 3))
+        assert flights == entry.future.result()
+        assert len(hotels) == 3
+        assert metrics.get("prefetch.hits") == 2
+
+    def test_hotel_prefetch_keyed_on_num_people(self, partial_state):
+        """인원이 정해지기 전에는 숙박을 미리 검색하지 않고, 정해진 인원으로 검색하는지 테스트."""
+        schedule_prefetch(partial_state)
+        assert hotel_search_key("오사카", 3, 2) not in search_cache
+
+        schedule_prefetch({**partial_state, "num_people": 4})
+        search_hotels_node({**partial_state, "info_collected": True, "num_people": 4})
+        assert metrics.get("prefetch.hits") == 1
+        assert metrics.get("search_cache.misses") == 0
+
+    def test_prefetch_wasted_on_eviction(self, partial_state):
+        """사용되지 않은 선행 검색이 캐시에서 밀려나면 낭비로 집계되는지 테스트."""
+        schedule_prefetch(partial_state)
+        key = flight_search_key("오사카", 3)
+        search_cache.set(key, SearchEntry(Future(), speculative=False))
+        assert metrics.get("prefetch.wasted") == 1
+
+    def test_prefetch_wasted_on_expiry(self, partial_state, monkeypatch):
+        """읽히지 않고 만료된 선행 검색이 다음 저장 시 낭비로 집계되는지 테스트."""
+        import time
+
+        monkeypatch.setattr(search_cache, "ttl", 0.01)
+        schedule_prefetch({**partial_state, "num_people": 2})
+        time.sleep(0.02)
+        assert metrics.get("prefetch.wasted") == 0
+
+        schedule_prefetch({**partial_state, "destination": "도쿄"})
+        assert metrics.get("prefetch.wasted") == 2
+        assert flight_search_key("오사카", 3) not in search_cache
+
+
 class TestItineraryPlanner:
     """Itinerary Planner Agent 테스트."""
 
@@ -250,7 +543,7 @@ def test_generate_itinerary_correct_days(self):
     def test_generate_itinerary_has_activities(self):
         """일정에 활동이 있는지 테스트."""
         itinerary = generate_itinerary("오사카", 3, ["관광"])
-        for day_key, day_plan in itinerary.items():
+        for day_plan in itinerary.values():
             assert "activities" in day_plan
             assert len(day_plan["activities"]) > 0
 
@@ -279,3 +572,1292 @@ def test_plan_itinerary_node(self, sample_travel_state):
 
         assert "itinerary" in result
         assert len(result["itinerary"]) == 4  # 3박 4일
+
+    def test_catalog_is_immutable(self):
+        """장소 카탈로그를 수정할 수 없는지 테스트."""
+        from src.agents.phase1.poi_catalog import DESTINATION_SPOTS
+
+        spots = DESTINATION_SPOTS["오사카"]["sightseeing"]
+        assert isinstance(spots, tuple)
+        with pytest.raises(AttributeError):
+            spots[0].name = "변경"
+        with pytest.raises(TypeError):
+            DESTINATION_SPOTS["오사카"]["sightseeing"] = ()
+
+    def test_concurrent_generation_leaves_catalog_untouched(self):
+        """여러 스레드에서 일정을 생성해도 카탈로그 순서가 그대로인지 테스트."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.agents.phase1.poi_catalog import DESTINATION_SPOTS
+
+        before = {
+            city: {category: list(spots) for category, spots in catalog.items()}
+            for city, catalog in DESTINATION_SPOTS.items()
+        }
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(
+                lambda i: generate_itinerary("오사카", 4, ["관광", "쇼핑"], seed=i), range(200)
+            ))
+
+        assert all(len(itinerary) == 5 for itinerary in results)
+        after = {
+            city: {category: list(spots) for category, spots in catalog.items()}
+            for city, catalog in DESTINATION_SPOTS.items()
+        }
+        assert after == before
+
+    def test_seeded_generation_is_deterministic(self):
+        """같은 시드면 같은 일정이 생성되는지 테스트."""
+        first = generate_itinerary("도쿄", 3, ["관광"], departure_date="2026-03-01", seed=7)
+        second = generate_itinerary("도쿄", 3, ["관광"], departure_date="2026-03-01", seed=7)
+        assert first == second
+
+
+class TestDayScheduler:
+    """소요 시간 기반 하루 일정 배치 테스트."""
+
+    def test_parse_duration_minutes(self):
+        """소요 시간 문자열 변환 테스트."""
+        from src.agents.phase1.day_scheduler import parse_duration_minutes
+
+        assert parse_duration_minutes("8시간") == 480
+        assert parse_duration_minutes("1.5시간") == 90
+        assert parse_duration_minutes("1시간 30분") == 90
+        assert parse_duration_minutes("30분") == 30
+        assert parse_duration_minutes("") == 60
+
+    def test_all_day_spot_takes_lunch_slot(self):
+        """하루 종일 장소가 점심 슬롯을 대신 차지하고 저녁과는 겹치지 않는지 테스트."""
+        from src.agents.phase1.day_scheduler import Reserved, pack_day, to_minutes
+        from src.agents.phase1.poi_catalog import POI
+
+        usj = POI("유니버셜 스튜디오 재팬", "sightseeing", "8시간", "")
+        tower = POI("아베노 하루카스", "sightseeing", "1시간", "")
+        reserved = [
+            Reserved(to_minutes("12:30"), to_minutes("13:30"), "lunch", optional=True),
+            Reserved(to_minutes("18:30"), to_minutes("20:00"), "dinner"),
+        ]
+        schedule = pack_day([usj, tower], (to_minutes("09:00"), to_minutes("21:00")), reserved)
+
+        assert schedule.absorbed == ["lunch"]
+        assert [p.poi for p in schedule.placements] == [usj, tower]
+        assert schedule.placements[0].end <= to_minutes("18:30")
+        assert schedule.placements[1].end <= to_minutes("18:30")
+        assert [r.key for r in schedule.reserved] == ["dinner"]
+
+    def test_generated_days_have_no_conflicts(self):
+        """생성된 일정에 겹치는 활동이 없는지 테스트."""
+        from src.agents.phase1.day_scheduler import find_conflicts
+
+        for seed in range(100):
+            for destination in ["오사카", "제주", "방콕"]:
+                itinerary = generate_itinerary(destination, 4, ["관광", "맛집", "쇼핑"], seed=seed)
+                for day in itinerary.values():
+                    assert find_conflicts(day["activities"]) == []
+
+    def test_first_and_last_day_follow_flight_times(self):
+        """늦게 도착/출발하는 항공편에 맞춰 첫날/마지막 날 시간대가 정해지는지 테스트."""
+        from src.agents.phase1.day_scheduler import find_conflicts, to_minutes
+
+        flight = {
+            "type": "standard",
+            "price": 300000,
+            "airline": "대한항공",
+            "outbound": {"departure_time": "17:00", "arrival_time": "19:00", "flight_time": "2시간"},
+            "inbound": {"departure_time": "22:00", "arrival_time": "00:00", "flight_time": "2시간"},
+        }
+        for seed in range(20):
+            itinerary = generate_itinerary(
+                "오사카", 3, ["관광", "맛집", "쇼핑"], seed=seed, flight=flight
+            )
+            first, last = itinerary["day1"]["activities"], itinerary["day4"]["activities"]
+
+            assert first[0]["time"] == "17:00"
+            assert first[1] == {**first[1], "activity": "오사카 도착", "time": "19:00"}
+            check_in = next(a for a in first if a["activity"] == "숙소 체크인")
+            assert check_in["time"] == "21:00"
+            # 체크인 이후에는 관광/식사를 넣지 않음 (21:00 이후 하루 종료)
+            assert all(to_minutes(a["time"]) <= to_minutes("21:00") for a in first)
+            assert not any(a["type"] in ("sightseeing", "food") for a in first)
+
+            airport = next(a for a in last if a["activity"] == "공항 이동")
+            assert airport["time"] == "19:00"
+            assert last[-1]["activity"] == "인천공항 도착"
+            assert last[-1]["time"] == "00:00"
+            # 늦은 귀국편이면 체크아웃 후 관광/식사 시간이 생김
+            assert any(a["type"] == "sightseeing" for a in last)
+            assert all(
+                to_minutes(a["time"]) < to_minutes("19:00")
+                for a in last if a["type"] in ("sightseeing", "food", "shopping")
+            )
+            assert find_conflicts(first) == []
+            assert find_conflicts(last[:-1]) == []
+
+    def test_default_flight_times(self):
+        """항공편이 없으면 기본 출국/귀국 시각으로 일정을 만드는지 테스트."""
+        itinerary = generate_itinerary("오사카", 2, ["관광"], seed=0)
+        first = {a["activity"]: a["time"] for a in itinerary["day1"]["activities"]}
+        last = {a["activity"]: a["time"] for a in itinerary["day3"]["activities"]}
+
+        assert first["인천공항 출발"] == "09:00"
+        assert first["숙소 체크인"] == "14:00"
+        assert last["숙소 체크아웃"] == "10:00"
+        assert last["공항 이동"] == "12:00"
+
+    def test_packs_hundreds_of_candidates(self):
+        """후보 장소가 많아도 빠르게 배치되는지 테스트."""
+        import time
+
+        from src.agents.phase1.day_scheduler import pack_day, to_minutes
+        from src.agents.phase1.poi_catalog import POI
+
+        candidates = [
+            POI(f"장소 {i}", "sightseeing", f"{30 + (i * 37) % 240}분", "") for i in range(500)
+        ]
+        started = time.perf_counter()
+        for _ in range(100):
+            schedule = pack_day(candidates, (to_minutes("09:00"), to_minutes("21:00")))
+        assert time.perf_counter() - started < 1.0
+
+        placements = schedule.placements
+        assert all(a.end <= b.start for a, b in zip(placements, placements[1:], strict=False))
+        assert placements[-1].end <= to_minutes("21:00")
+
+
+class TestRouteOptimizer:
+    """이동 경로 최적화 테스트."""
+
+    def test_two_opt_improves_nearest_neighbor(self):
+        """2-opt 결과가 최근접 이웃 경로보다 길지 않고 교차 경로를 풀어내는지 테스트."""
+        import numpy as np
+
+        from src.agents.phase1.route_optimizer import (
+            haversine_matrix,
+            nearest_neighbor_tour,
+            route_length,
+            two_opt,
+        )
+
+        rng = np.random.default_rng(0)
+        for _ in range(50):
+            points = rng.uniform([34.6, 135.4], [34.7, 135.6], size=(8, 2))
+            dist = haversine_matrix(points[:, 0], points[:, 1])
+            for closed in (True, False):
+                greedy = nearest_neighbor_tour(dist)
+                improved = two_opt(dist, greedy, closed)
+                assert sorted(improved) == list(range(8))
+                assert improved[0] == 0
+                assert route_length(dist, improved, closed) <= route_length(dist, greedy, closed) + 1e-9
+
+        # 정사각형 꼭짓점: 대각선으로 교차하는 경로는 둘레 경로로 바뀜
+        square = np.array([[0.0, 0.0], [0.0, 0.01], [0.01, 0.0], [0.01, 0.01]])
+        dist = haversine_matrix(square[:, 0], square[:, 1])
+        assert two_opt(dist, [0, 1, 2, 3], closed=True) == [0, 1, 3, 2]
+
+    def test_route_starts_and_ends_at_hotel(self):
+        """숙소 기준 순환 경로가 원래 순서보다 짧거나 같은지 테스트."""
+        from itertools import permutations
+
+        from src.agents.phase1.poi_catalog import DESTINATION_SPOTS
+        from src.agents.phase1.route_optimizer import optimize_route, route_minutes
+
+        spots = DESTINATION_SPOTS["오사카"]["sightseeing"][:3] + DESTINATION_SPOTS["오사카"]["shopping"][:1]
+        for order in permutations(spots):
+            ordered = optimize_route("오사카", list(order), "우메다")
+            assert sorted(ordered) == sorted(spots)
+            assert route_minutes("오사카", ordered, "우메다") <= route_minutes("오사카", list(order), "우메다") + 1e-9
+
+        best = min(route_minutes("오사카", list(order), "우메다") for order in permutations(spots))
+        assert route_minutes("오사카", optimize_route("오사카", spots, "우메다"), "우메다") == pytest.approx(best)
+
+        # 좌표를 모르는 숙소 지역이면 열린 경로로 최적화
+        assert sorted(optimize_route("오사카", spots, "모르는 지역")) == sorted(spots)
+
+    def test_itinerary_with_hotel_is_fast(self):
+        """숙소 기준 경로 최적화를 포함한 일정 생성이 빠르고 겹치지 않는지 테스트."""
+        import time
+
+        from src.agents.phase1.day_scheduler import find_conflicts
+
+        hotel = {"type": "standard", "location": "난바"}
+        started = time.perf_counter()
+        for seed in range(100):
+            itinerary = generate_itinerary("오사카", 4, ["관광", "맛집", "쇼핑"], seed=seed, hotel=hotel)
+            for day in itinerary.values():
+                assert find_conflicts(day["activities"]) == []
+        assert time.perf_counter() - started < 2.0
+        assert metrics.snapshot()["observations"]["itinerary.route_minutes"]["count"] > 0
+
+
+class TestDayClusters:
+    """지역 묶음 기반 날짜 배정 테스트."""
+
+    def test_weighted_kmeans_separates_neighbourhoods(self):
+        """떨어진 지역의 점들이 같은 묶음으로 나뉘는지 테스트."""
+        import numpy as np
+
+        from src.agents.phase1.day_clusters import weighted_kmeans
+
+        rng = np.random.default_rng(1)
+        blobs = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+        points = np.vstack([rng.normal(center, 0.02, size=(10, 2)) for center in blobs])
+        labels = weighted_kmeans(points, np.ones(len(points)), 3)
+
+        groups = [set(labels[i * 10 : (i + 1) * 10]) for i in range(3)]
+        assert all(len(group) == 1 for group in groups)
+        assert len(set.union(*groups)) == 3
+
+    def test_day_clusters_partition_and_cache(self):
+        """묶음이 후보 장소를 겹치지 않게 나누고 캐시되는지 테스트."""
+        from src.agents.phase1.day_clusters import _day_clusters, get_day_clusters
+        from src.agents.phase1.poi_catalog import DESTINATION_SPOTS
+
+        _day_clusters.cache_clear()
+        clusters = get_day_clusters("도쿄", 3, frozenset(["관광", "쇼핑"]))
+        assert len(clusters) == 3
+
+        names = [spot.name for cluster in clusters for spot in cluster]
+        catalog = DESTINATION_SPOTS["도쿄"]
+        expected = [s.name for s in catalog["sightseeing"] + catalog["shopping"]]
+        assert sorted(names) == sorted(expected)
+
+        assert get_day_clusters("도쿄", 3, frozenset(["쇼핑", "관광"])) is clusters
+        assert _day_clusters.cache_info().hits == 1
+        assert get_day_clusters("파리", 3, frozenset(["관광"])) == ()
+
+    def test_middle_days_visit_their_cluster(self):
+        """중간 날마다 배정된 묶음의 장소를 방문하는지 테스트."""
+        from src.agents.phase1.day_clusters import get_day_clusters
+
+        clusters = get_day_clusters("제주", 3, frozenset(["관광"]))
+        for seed in range(20):
+            itinerary = generate_itinerary("제주", 4, ["관광"], seed=seed)
+            for day_num, cluster in enumerate(clusters, start=2):
+                names = {a["activity"] for a in itinerary[f"day{day_num}"]["activities"]}
+                assert names & {spot.name for spot in cluster}
+
+
+class TestItinerarySearch:
+    """후보 일정 탐색/점수 테스트."""
+
+    @staticmethod
+    def score(itineraries, styles=("관광", "맛집")):
+        from src.agents.phase1.itinerary_planner import DAY_END, DAY_START
+        from src.agents.phase1.itinerary_search import score_itineraries
+
+        return score_itineraries(itineraries, "오사카", styles, (DAY_START, DAY_END), "난바")
+
+    def test_duplicate_spots_lower_score(self):
+        """같은 장소를 반복 방문하는 일정의 점수가 낮은지 테스트."""
+        import copy
+
+        itinerary = generate_itinerary("오사카", 3, ["관광", "맛집"], seed=3)
+        repeated = copy.deepcopy(itinerary)
+        repeated["day3"]["activities"] = copy.deepcopy(itinerary["day2"]["activities"])
+
+        scores = self.score([itinerary, repeated])
+        assert scores.shape == (2,)
+        assert scores[1] < scores[0]
+
+    def test_sample_and_score_respects_budget(self):
+        """CPU 시간 한도 안에서만 후보를 만들고 최고 점수 후보를 고르는지 테스트."""
+        import time
+
+        import numpy as np
+
+        from src.agents.phase1.itinerary_search import sample_and_score
+
+        def generate(seed):
+            end = time.thread_time() + 0.005
+            while time.thread_time() < end:
+                pass
+            return {"seed": seed}
+
+        result = sample_and_score(
+            generate, lambda c: np.array([i["seed"] for i in c], dtype=float), 1000, 30, seed=1
+        )
+        assert 1 <= result.candidates < 20
+        assert result.score == result.itinerary["seed"]
+
+        single = sample_and_score(generate, lambda c: np.zeros(len(c)), 1000, 0)
+        assert single.candidates == 1
+
+    def test_search_beats_single_candidate(self, monkeypatch):
+        """탐색 결과가 후보 하나만 만든 결과보다 점수가 낮지 않은지 테스트."""
+        from src.agents.phase1.itinerary_planner import search_itinerary
+        from src.config import settings
+
+        hotel = {"type": "standard", "location": "난바"}
+        monkeypatch.setattr(settings, "itinerary_search_budget_ms", float("inf"))
+        for seed in range(5):
+            monkeypatch.setattr(settings, "itinerary_search_candidates", 1)
+            single = search_itinerary("오사카", 3, ["관광", "맛집"], hotel=hotel, seed=seed)
+            monkeypatch.setattr(settings, "itinerary_search_candidates", 50)
+            best = search_itinerary("오사카", 3, ["관광", "맛집"], hotel=hotel, seed=seed)
+
+            single_score, best_score = self.score([single, best])
+            assert best_score >= single_score
+        assert metrics.get("itinerary_search.candidates") >= 255
+
+
+class TestItineraryTemplates:
+    """일정 템플릿 캐시 테스트."""
+
+    def test_template_reused_with_dates_and_hotel(self, monkeypatch):
+        """같은 요청은 템플릿을 재사용하고 날짜/숙소만 다시 적용하는지 테스트."""
+        from src.agents.phase1.day_scheduler import find_conflicts
+        from src.agents.phase1.itinerary_planner import plan_from_template
+        from src.config import settings
+
+        metrics.reset()
+        monkeypatch.setattr(settings, "itinerary_search_candidates", 5)
+        first = plan_from_template("오사카", 3, ["관광", "맛집"], "2026-05-01")
+        second = plan_from_template(
+            "오사카", 3, ["맛집", "관광"], "2026-06-01", hotel={"location": "우메다"}
+        )
+
+        assert metrics.get("itinerary_template.misses") == 1
+        assert metrics.get("itinerary_template.hits") == 1
+        assert [day["date"] for day in second.values()][0] == "2026-06-01"
+        for key in first:
+            assert first[key]["date"] != second[key]["date"]
+            names = sorted(a["activity"] for a in first[key]["activities"])
+            assert names == sorted(a["activity"] for a in second[key]["activities"])
+            assert find_conflicts(second[key]["activities"]) == []
+
+        # 반환된 일정을 수정해도 템플릿은 그대로
+        first["day2"]["activities"].clear()
+        assert plan_from_template("오사카", 3, ["관광", "맛집"])["day2"]["activities"]
+
+    def test_catalog_change_invalidates_template(self, monkeypatch):
+        """카탈로그가 바뀌면 템플릿을 다시 만드는지 테스트."""
+        from src.agents.phase1 import itinerary_templates, poi_catalog
+        from src.agents.phase1.itinerary_templates import get_template
+
+        metrics.reset()
+
+        def build():
+            return generate_itinerary("제주", 2, ["관광"], seed=1)
+
+        first = get_template("제주", ["관광"], 2, build)
+        assert get_template("제주", ["관광"], 2, build) is first
+
+        # 같은 내용을 다시 로드하면 (LRU 에서 밀려난 경우) 그대로 사용
+        poi_catalog._load_destination_catalog.cache_clear()
+        assert get_template("제주", ["관광"], 2, build) is first
+        assert metrics.get("itinerary_template.stale") == 0
+
+        monkeypatch.setattr(itinerary_templates, "catalog_revision", lambda destination: "changed")
+        assert get_template("제주", ["관광"], 2, build) is not first
+        assert metrics.get("itinerary_template.stale") == 1
+
+    def test_reload_clears_derived_caches(self, itinerary_templates):
+        """카탈로그를 다시 읽으면 파생 캐시가 함께 비워지는지 테스트."""
+        from src.agents.phase1.day_clusters import _day_clusters, get_day_clusters
+        from src.agents.phase1.itinerary_templates import get_template
+        from src.agents.phase1.opening_hours import (
+            _opening_hours_index,
+            get_opening_hours_index,
+        )
+        from src.agents.phase1.poi_catalog import reload_catalogs
+        from src.agents.phase1.route_optimizer import (
+            _distance_matrix,
+            get_distance_matrix,
+        )
+
+        get_template("오사카", ["관광"], 2, partial(generate_itinerary, "오사카", 2, ["관광"]))
+        get_day_clusters("오사카", 2, frozenset(["관광"]))
+        get_distance_matrix("오사카")
+        get_opening_hours_index("오사카")
+
+        reload_catalogs()
+        assert len(itinerary_templates) == 0
+        for cache in (_day_clusters, _distance_matrix, _opening_hours_index):
+            assert cache.cache_info().currsize == 0
+
+    def test_catalog_revision_follows_content(self):
+        """카탈로그 내용 해시가 내용에만 따라 바뀌는지 테스트."""
+        from src.agents.phase1 import poi_catalog
+
+        data = {"version": 1, "spots": {"food": [{"name": "A", "duration": "1시간", "description": ""}]}}
+        same = {"spots": data["spots"], "version": 1}
+        changed = {"version": 1, "spots": {"food": [{"name": "B", "duration": "1시간", "description": ""}]}}
+
+        revision = poi_catalog._freeze_catalog("x", data).revision
+        assert poi_catalog._freeze_catalog("x", same).revision == revision
+        assert poi_catalog._freeze_catalog("x", changed).revision != revision
+        assert poi_catalog.catalog_revision("없는도시") == poi_catalog.get_default_catalog().revision
+
+    def test_template_cache_is_bounded(self, itinerary_templates, monkeypatch):
+        """템플릿 캐시 크기가 제한되는지 테스트."""
+        from src.agents.phase1.itinerary_templates import (
+            get_template,
+            invalidate_templates,
+        )
+
+        monkeypatch.setattr(itinerary_templates, "maxsize", 2)
+        for duration in (1, 2, 3):
+            get_template("도쿄", ["관광"], duration, partial(generate_itinerary, "도쿄", duration, ["관광"]))
+        assert len(itinerary_templates) == 2
+        assert invalidate_templates() == 2
+        assert len(itinerary_templates) == 0
+
+
+class TestOpeningHours:
+    """영업시간/휴무일 검사 테스트."""
+
+    def test_index_lookup(self):
+        """휴무일, 브레이크 타임, 자정을 넘기는 영업시간 조회 테스트."""
+        from src.agents.phase1.day_scheduler import to_minutes as m
+        from src.agents.phase1.opening_hours import get_opening_hours_index
+
+        osaka = get_opening_hours_index("오사카")
+        assert osaka.is_open("텐노지 동물원", 1, m("10:00"), m("13:00"))
+        assert not osaka.is_open("텐노지 동물원", 0, m("10:00"), m("13:00"))  # 월요일 휴무
+        assert not osaka.is_open("쿠시카츠 맛집", 2, m("15:00"), m("16:00"))  # 브레이크 타임
+        assert osaka.is_open("도톤보리", 0, m("03:00"), m("05:00"))  # 정보 없음
+        assert osaka.day_intervals("쿠시카츠 맛집", 2) == [(m("11:00"), m("14:00")), (m("17:00"), m("23:00"))]
+
+        bangkok = get_opening_hours_index("방콕")
+        assert bangkok.is_open("루프탑 바", 6, m("23:00"), m("24:30"))  # 일요일 밤 -> 월요일 새벽
+        assert not bangkok.is_open("루프탑 바", 6, m("12:30"), m("13:30"))
+        assert not bangkok.is_open("짜뚜짝 시장", 2, m("10:00"), m("14:00"))  # 주말에만 영업
+
+    def test_pack_day_respects_opening_hours(self):
+        """영업 시간 안에만 장소를 배치하는지 테스트."""
+        from src.agents.phase1.day_scheduler import pack_day, to_minutes
+        from src.agents.phase1.opening_hours import hours_on
+        from src.agents.phase1.poi_catalog import DESTINATION_SPOTS
+
+        spots = {s.name: s for s in DESTINATION_SPOTS["방콕"]["shopping"] + DESTINATION_SPOTS["방콕"]["sightseeing"]}
+        candidates = [spots["아시아티크"], spots["짐 톰슨 하우스"], spots["짜뚜짝 시장"]]
+        window = (to_minutes("09:00"), to_minutes("21:00"))
+
+        weekday = pack_day(candidates, window, hours=hours_on("방콕", "2026-05-06"))  # 수요일
+        placed = {p.poi.name: p for p in weekday.placements}
+        assert "짜뚜짝 시장" not in placed
+        assert placed["아시아티크"].start >= to_minutes("16:00")
+        assert placed["짐 톰슨 하우스"].start >= to_minutes("10:00")
+
+        weekend = pack_day(candidates, window, hours=hours_on("방콕", "2026-05-09"))  # 토요일
+        assert "짜뚜짝 시장" in {p.poi.name for p in weekend.placements}
+
+    def test_sampled_itineraries_need_no_repair(self, monkeypatch):
+        """후보 일정 생성 단계에서 식당/쇼핑도 영업 시간 안에 배치되는지 테스트."""
+        from src.agents.phase1 import itinerary_planner
+        from src.agents.phase1.opening_hours import validate_itinerary
+
+        def unrepaired(itinerary, destination):
+            assert validate_itinerary(itinerary, destination) == {}
+            return itinerary
+
+        monkeypatch.setattr(itinerary_planner, "repair_itinerary", unrepaired)
+        for destination in ["오사카", "도쿄", "제주", "방콕"]:
+            for seed in range(50):
+                generate_itinerary(
+                    destination, 4, ["관광", "맛집", "쇼핑"], departure_date="2026-05-04", seed=seed
+                )
+
+    def test_repair_swaps_closed_spot(self):
+        """영업하지 않는 식당/장소를 같은 카테고리 장소로 바꾸는지 테스트."""
+        from src.agents.phase1.day_scheduler import find_conflicts
+        from src.agents.phase1.opening_hours import find_violations, repair_day
+        from src.models.state import DayPlan
+
+        day = DayPlan(
+            date="2026-05-04",  # 월요일
+            theme="테스트",
+            activities=[
+                {"time": "10:00", "activity": "텐노지 동물원", "type": "sightseeing",
+                 "location": "텐노지 동물원", "duration": "3시간", "description": ""},
+                {"time": "18:30", "activity": "저녁 - 카이센동 (해산물 덮밥)", "type": "food",
+                 "location": "카이센동 (해산물 덮밥)", "duration": "1시간", "description": ""},
+            ],
+        )
+        assert find_violations(day, "오사카") == [0, 1]
+
+        repaired = repair_day(day, "오사카", used={"오사카성"})
+        assert find_violations(repaired, "오사카") == []
+        assert find_conflicts(repaired["activities"]) == []
+        first, dinner = repaired["activities"]
+        assert first["location"] not in {"텐노지 동물원", "오사카성"}
+        assert dinner["activity"] == f"저녁 - {dinner['location']}"
+        assert dinner["duration"] == "1시간"
+
+    def test_batch_validation(self):
+        """생성된 일정 일괄 검사 (위반 없음, 빠른 검사) 테스트."""
+        import time
+
+        from src.agents.phase1.opening_hours import count_violations
+
+        for destination in ["오사카", "도쿄", "방콕", "제주"]:
+            itineraries = [
+                generate_itinerary(destination, 4, ["관광", "맛집", "쇼핑"], "2026-05-01", seed=seed)
+                for seed in range(50)
+            ]
+            started = time.perf_counter()
+            for _ in range(10):
+                assert count_violations(itineraries, destination) == [0] * 50
+            assert time.perf_counter() - started < 1.0
+
+
+class TestDestinationCatalog:
+    """목적지 카탈로그 지연 로딩 테스트."""
+
+    def test_loads_destination_once_on_first_use(self):
+        """목적지 데이터 파일을 처음 조회할 때 한 번만 읽는지 테스트."""
+        from src.agents.phase1 import poi_catalog
+        from src.agents.phase1.poi_catalog import get_destination_catalog
+
+        poi_catalog._load_destination_catalog.cache_clear()
+        metrics.reset()
+
+        assert get_destination_catalog("없는도시") is None
+        assert metrics.get("catalog.loads") == 0
+
+        first = get_destination_catalog("방콕")
+        assert get_destination_catalog("방콕") is first
+        assert metrics.get("catalog.loads") == 1
+        assert first.flight["airport"] == "BKK"
+        assert "왕궁" in first.opening_hours
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """최근에 조회한 목적지만 보관하는지 테스트."""
+        from functools import lru_cache
+
+        from src.agents.phase1 import poi_catalog
+        from src.agents.phase1.poi_catalog import (
+            catalog_destinations,
+            get_destination_catalog,
+        )
+        from src.config import settings
+
+        cache = poi_catalog._load_destination_catalog
+        assert cache.cache_info().maxsize == settings.catalog_cache_size
+
+        monkeypatch.setattr(poi_catalog, "_load_destination_catalog", lru_cache(maxsize=2)(cache.__wrapped__))
+        for destination in catalog_destinations():
+            assert get_destination_catalog(destination).flight["prices"]
+        assert poi_catalog._load_destination_catalog.cache_info().currsize == 2
+
+    def test_rejects_unknown_catalog_version(self, tmp_path, monkeypatch):
+        """데이터 파일 형식 버전이 다르면 로드하지 않는지 테스트."""
+        import json
+
+        from src.agents.phase1 import poi_catalog
+
+        (tmp_path / "old.json").write_text(json.dumps({"version": 0}), encoding="utf-8")
+        monkeypatch.setattr(poi_catalog, "CATALOG_DATA_DIR", tmp_path)
+        with pytest.raises(ValueError, match="catalog version"):
+            poi_catalog._read_catalog_file("old.json")
+
+    def test_destinations_without_spots_fall_back_to_defaults(self):
+        """장소/숙소 데이터가 없는 목적지는 기본 데이터를 쓰는지 테스트."""
+        from src.agents.phase1.hotel_searcher import get_hotel_candidates
+        from src.agents.phase1.poi_catalog import (
+            DESTINATION_SPOTS,
+            get_default_catalog,
+            get_spot_catalog,
+        )
+
+        assert "파리" not in DESTINATION_SPOTS
+        assert get_spot_catalog("파리") is get_default_catalog().spots
+        assert get_hotel_candidates("파리", "budget") == get_default_catalog().hotels["budget"]
+        assert get_airport_code("파리") == "CDG"
+
+
+class TestLLMClient:
+    """LLM Client 테스트."""
+
+    async def test_client_reused_per_agent(self):
+        """에이전트별 클라이언트 재사용 테스트."""
+        from src.tools.llm_client import get_llm, reset_llm_clients
+
+        reset_llm_clients()
+        info = get_llm("info_collector")
+        assert get_llm("info_collector") is info
+        assert get_llm("itinerary_planner") is not info
+        assert info.temperature == 0.7
+        reset_llm_clients()
+
+    def test_unknown_agent(self):
+        """알 수 없는 에이전트 오류 테스트."""
+        from src.tools.llm_client import get_agent_config
+
+        with pytest.raises(ValueError):
+            get_agent_config("unknown")
+
+    async def test_itinerary_via_stub(self, llm_stub, sample_travel_state, monkeypatch):
+        """스텁 서버를 통한 LLM 일정 생성 테스트."""
+        from src.agents.phase1.itinerary_planner import plan_itinerary_with_llm
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "itinerary_llm_mode", "single")
+
+        result = await plan_itinerary_with_llm(sample_travel_state)
+        assert result["itinerary"]["day1"]["theme"] == "도착 & 시내 탐방"
+        assert "AI" in result["messages"][0]["content"]
+
+        # 같은 요청은 응답 캐시에서 반환
+        hits = metrics.get("llm_cache.exact_hits")
+        await plan_itinerary_with_llm(sample_travel_state)
+        assert llm_stub.state.request_count == 1
+        assert metrics.get("llm_cache.exact_hits") == hits + 1
+        assert metrics.get("llm_cache.saved_tokens") > 0
+
+    async def test_info_collector_via_stub(self, llm_stub, collecting_state):
+        """스텁 서버를 통한 LLM 정보 추출 테스트."""
+        from src.agents.phase1.info_collector import info_collector_node_with_llm
+
+        collecting_state["messages"] = [{"role": "user", "content": "음 글쎄요"}]
+        result = await info_collector_node_with_llm(collecting_state)
+        assert result["destination"] == "오사카"
+        assert result["num_people"] == 2
+        assert result["info_collected"] is True
+
+
+class TestLLMResponseCache:
+    """LLM Response Cache 테스트."""
+
+    def test_exact_key_temperature_bucket(self):
+        """temperature 구간별 키 테스트."""
+        from src.tools.llm_cache import exact_cache_key
+
+        assert exact_cache_key("m", "s", "u", 0.7) == exact_cache_key("m", "s", "u", 0.72)
+        assert exact_cache_key("m", "s", "u", 0.7) != exact_cache_key("m", "s", "u", 0.9)
+        assert exact_cache_key("m", "s", "u", 0.7) != exact_cache_key("m2", "s", "u", 0.7)
+
+    def test_semantic_hit_for_near_identical_prompt(self, local_store):
+        """거의 같은 입력의 유사 캐시 적중 테스트."""
+        from src.tools.llm_cache import LLMResponseCache
+
+        cache = LLMResponseCache(local_store, ttl=60, semantic_threshold=0.8)
+        prompt = "3박 4일 여행 일정\n목적지: 오사카\n여행 스타일: 맛집, 관광"
+        cache.set("m", "s", prompt, 0.8, "cached", tokens=100, semantic=True)
+
+        similar = "3박 4일 여행 일정\n목적지: 오사카\n여행 스타일: 관광, 맛집"
+        assert cache.get("m", "s", similar, 0.8, semantic=True) == "cached"
+        assert cache.get("m", "s", similar, 0.8, semantic=False) is None
+
+        # 숫자(기간)가 다르면 재사용하지 않음
+        other = "4박 5일 여행 일정\n목적지: 오사카\n여행 스타일: 맛집, 관광"
+        assert cache.get("m", "s", other, 0.8, semantic=True) is None
+
+
+class TestMicroBatcher:
+    """Micro Batcher 테스트."""
+
+    async def test_concurrent_requests_share_batch(self):
+        """동시 요청이 하나의 배치로 처리되는지 테스트."""
+        import asyncio
+
+        from src.tools.llm_batcher import MicroBatcher
+
+        batches = []
+
+        async def handler(items):
+            batches.append(list(items))
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher(handler, max_batch_size=10, max_wait_ms=5)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(4)))
+
+        assert results == [0, 2, 4, 6]
+        assert batches == [[0, 1, 2, 3]]
+
+    async def test_max_batch_size_and_errors(self):
+        """최대 배치 크기 및 개별 오류 전달 테스트."""
+        import asyncio
+
+        from src.tools.llm_batcher import MicroBatcher
+
+        sizes = []
+
+        async def handler(items):
+            sizes.append(len(items))
+            return [ValueError("bad") if item < 0 else item for item in items]
+
+        batcher = MicroBatcher(handler, max_batch_size=2, max_wait_ms=50)
+        results = await asyncio.gather(
+            *(batcher.submit(i) for i in [1, -1, 3]),
+            return_exceptions=True,
+        )
+
+        assert sizes == [2, 1]
+        assert results[0] == 1 and results[2] == 3
+        assert isinstance(results[1], ValueError)
+
+    async def test_cancelled_requests_are_not_sent(self):
+        """배치 대기 중 취소된 요청은 핸들러로 보내지 않는지 테스트."""
+        import asyncio
+
+        from src.tools.llm_batcher import MicroBatcher
+        from src.utils.metrics import metrics
+
+        metrics.reset()
+        batches = []
+
+        async def handler(items):
+            batches.append(list(items))
+            return list(items)
+
+        batcher = MicroBatcher(handler, max_batch_size=10, max_wait_ms=20)
+        kept = asyncio.create_task(batcher.submit(1))
+        dropped = asyncio.create_task(batcher.submit(2))
+        await asyncio.sleep(0)
+        dropped.cancel()
+
+        assert await kept == 1
+        assert batches == [[1]]
+        assert metrics.get("llm_batch.cancelled") == 1
+
+    async def test_llm_batch_deduplicates_prompts(
+        self, llm_stub, collecting_state, monkeypatch
+    ):
+        """동일 프롬프트를 한 번만 호출하는지 테스트."""
+        import asyncio
+
+        from src.agents.phase1.info_collector import info_collector_node_with_llm
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "llm_cache_enabled", False)
+        collecting_state["messages"] = [{"role": "user", "content": "음 글쎄요"}]
+        results = await asyncio.gather(
+            *(info_collector_node_with_llm(dict(collecting_state)) for _ in range(5))
+        )
+
+        assert all(r["destination"] == "오사카" for r in results)
+        assert llm_stub.state.request_count == 1
+
+
+class TestBulkhead:
+    """Bulkhead 테스트."""
+
+    async def test_limits_concurrency_and_rejects_overflow(self):
+        """동시 실행 제한 및 대기열 초과 거절 테스트."""
+        import asyncio
+
+        from src.tools.bulkhead import Bulkhead, BulkheadRejectedError
+
+        bulkhead = Bulkhead("test", max_concurrency=2, max_queue=1, timeout=1.0)
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            async with bulkhead.acquire():
+                peak = max(peak, bulkhead.active)
+                await asyncio.sleep(0.02)
+                return True
+
+        results = await asyncio.gather(*(work() for _ in range(5)), return_exceptions=True)
+
+        assert peak == 2
+        assert results.count(True) == 3
+        assert sum(isinstance(r, BulkheadRejectedError) for r in results) == 2
+        assert bulkhead.active == 0
+
+    async def test_queue_timeout(self):
+        """대기 시간 초과 거절 테스트."""
+        import asyncio
+
+        from src.tools.bulkhead import Bulkhead, BulkheadRejectedError
+
+        bulkhead = Bulkhead("test", max_concurrency=1, max_queue=10, timeout=0.01)
+
+        async def hold():
+            async with bulkhead.acquire():
+                await asyncio.sleep(0.05)
+
+        task = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        with pytest.raises(BulkheadRejectedError):
+            async with bulkhead.acquire():
+                pass
+        await task
+        assert bulkhead.active == 0
+
+    async def test_stream_releases_slot_on_early_close(self, llm_stub, monkeypatch):
+        """스트림을 중간에 닫거나 업스트림이 끝나면 슬롯 반납 테스트."""
+        import asyncio
+        import json
+
+        from src.config import settings
+        from src.tools.bulkhead import get_bulkhead
+        from src.tools.llm_client import stream_llm
+
+        monkeypatch.setattr(settings, "llm_cache_enabled", False)
+        monkeypatch.setattr(settings, "llm_max_concurrency", 1)
+        bulkhead = get_bulkhead("llm", 1, settings.llm_max_queue, settings.llm_queue_timeout_seconds)
+
+        # 소비자가 첫 조각만 읽고 닫음 (클라이언트 연결 종료)
+        llm_stub.state.chunk_delay_ms = 20
+        stream = stream_llm("itinerary_planner", "여행 일정 플래너", "오사카")
+        await anext(stream)
+        assert bulkhead.active == 1
+        await stream.aclose()
+        assert bulkhead.active == 0
+
+        # 소비자가 읽지 않고 있어도 업스트림이 끝나면 반납
+        llm_stub.state.chunk_delay_ms = 0
+        stream = stream_llm("itinerary_planner", "여행 일정 플래너", "오사카")
+        chunks = [await anext(stream)]
+        for _ in range(100):
+            if not bulkhead.active:
+                break
+            await asyncio.sleep(0.01)
+        assert bulkhead.active == 0
+        chunks += [chunk async for chunk in stream]
+        assert json.loads("".join(chunks))["day1"]
+
+    async def test_itinerary_falls_back_when_unavailable(
+        self, llm_stub, sample_travel_state, monkeypatch
+    ):
+        """LLM 거절 시 규칙 기반 일정으로 대체 테스트."""
+        from src.agents.phase1.itinerary_planner import plan_itinerary_with_llm
+        from src.config import settings
+        from src.tools.llm_client import LLMUnavailableError
+
+        monkeypatch.setattr(settings, "llm_max_queue", 0)
+        monkeypatch.setattr(settings, "llm_max_concurrency", 0)
+
+        result = await plan_itinerary_with_llm(sample_travel_state)
+        assert "AI" not in result["messages"][0]["content"]
+        assert result["itinerary"]
+        assert llm_stub.state.request_count == 0
+
+        monkeypatch.setattr(settings, "llm_fallback_to_rules", False)
+        with pytest.raises(LLMUnavailableError):
+            await plan_itinerary_with_llm(sample_travel_state)
+
+
+class TestHedgedExtraction:
+    """Hedged Extraction 테스트."""
+
+    async def test_rule_confident_cancels_llm(self, llm_stub, collecting_state):
+        """규칙 기반으로 누락 필드를 모두 찾으면 LLM 을 기다리지 않음 테스트."""
+        import time
+
+        from src.agents.phase1.info_collector import info_collector_node_hedged
+
+        llm_stub.state.latency_ms = 1000
+        collecting_state["messages"] = [
+            {"role": "user", "content": "도쿄 3박 4일, 2명이서 100만원으로 맛집 위주로 갈래요"}
+        ]
+        wins = metrics.get("hedge.rule_wins")
+
+        started = time.monotonic()
+        result = await info_collector_node_hedged(collecting_state)
+
+        assert time.monotonic() - started < 0.5
+        assert result["destination"] == "도쿄"
+        assert metrics.get("hedge.rule_wins") == wins + 1
+
+    async def test_deadline_falls_back_to_rules(
+        self, llm_stub, collecting_state, monkeypatch
+    ):
+        """마감 시간 초과 시 규칙 기반 결과 반환 테스트."""
+        import time
+
+        from src.agents.phase1.info_collector import info_collector_node_hedged
+        from src.config import settings
+
+        llm_stub.state.latency_ms = 1000
+        monkeypatch.setattr(settings, "llm_hedge_deadline_seconds", 0.05)
+        collecting_state["messages"] = [{"role": "user", "content": "음 글쎄요"}]
+        timeouts = metrics.get("hedge.timeouts")
+
+        started = time.monotonic()
+        result = await info_collector_node_hedged(collecting_state)
+
+        assert time.monotonic() - started < 0.5
+        assert "destination" not in result
+        assert metrics.get("hedge.timeouts") == timeouts + 1
+
+    async def test_llm_fills_fields_rules_missed(self, llm_stub, collecting_state):
+        """규칙이 일부 필드만 찾으면 LLM 응답으로 나머지를 채움 테스트."""
+        from src.agents.phase1.info_collector import info_collector_node_hedged
+
+        llm_stub.state.latency_ms = 10
+        collecting_state["messages"] = [{"role": "user", "content": "도쿄 가고 싶어요"}]
+        wins = metrics.get("hedge.llm_wins")
+
+        result = await info_collector_node_hedged(collecting_state)
+
+        assert result["destination"] == "도쿄"
+        assert result["duration"] == 3
+        assert result["num_people"] == 2
+        assert metrics.get("hedge.llm_wins") == wins + 1
+
+    def test_apply_llm_result_keeps_rule_fields(self):
+        """LLM 결과 병합 시 규칙 기반 필드 유지 테스트."""
+        from src.agents.phase1.info_collector import apply_llm_result
+
+        merged = apply_llm_result(
+            {"destination": "도쿄"},
+            {"extracted_info": {"destination": "오사카", "duration": "3", "budget": 5}},
+        )
+        assert merged["destination"] == "도쿄"
+        assert merged["duration"] == 3
+        assert "budget" not in merged
+
+
+class TestPerDayItinerary:
+    """Per-day LLM Itinerary 테스트."""
+
+    def test_validate_day_plan(self):
+        """하루 일정 검증 테스트."""
+        from src.agents.phase1.itinerary_planner import validate_day_plan
+
+        activity = {"time": "10:00", "activity": "오사카성", "type": "sightseeing"}
+        assert validate_day_plan({"activities": [activity]})
+        assert not validate_day_plan({"activities": []})
+        assert not validate_day_plan({"activities": [{**activity, "type": "party"}]})
+        assert not validate_day_plan({"activities": [{**activity, "time": "오전"}]})
+        assert not validate_day_plan(None)
+
+    async def test_days_generated_concurrently(
+        self, llm_stub, sample_travel_state, monkeypatch
+    ):
+        """뼈대 + 날짜별 동시 생성 테스트."""
+        import time
+
+        from src.agents.phase1.itinerary_planner import plan_itinerary_with_llm
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "llm_cache_enabled", False)
+        await plan_itinerary_with_llm(sample_travel_state)  # 클라이언트 준비
+
+        llm_stub.state.latency_ms = 100
+        started = time.monotonic()
+        result = await plan_itinerary_with_llm(sample_travel_state)
+        elapsed = time.monotonic() - started
+
+        itinerary = result["itinerary"]
+        assert list(itinerary) == ["day1", "day2", "day3", "day4"]
+        assert itinerary["day1"]["theme"] == "도착 & 시내 탐방"
+        assert itinerary["day2"]["theme"] == "2일차 명소 탐방"
+        assert len({day["date"] for day in itinerary.values()}) == 4
+        assert llm_stub.state.request_count == 10
+        # 뼈대 1회 + 날짜별 동시 1회 (직렬이면 0.5초 이상)
+        assert elapsed < 0.45
+
+    async def test_invalid_day_retried_individually(self, llm_stub, sample_travel_state):
+        """파싱 실패한 날짜만 재시도 테스트."""
+        from src.agents.phase1.itinerary_planner import plan_itinerary_with_llm
+        from src.tools.llm_stub_server import DEFAULT_RESPONSES
+
+        llm_stub.state.responses["itinerary_day"] = [
+            '{"activities": [',
+            DEFAULT_RESPONSES["itinerary_day"],
+        ]
+        retries = metrics.get("itinerary.day_retries")
+        fallbacks = metrics.get("itinerary.day_fallbacks")
+
+        result = await plan_itinerary_with_llm(sample_travel_state)
+
+        assert len(result["itinerary"]) == 4
+        assert llm_stub.state.request_count == 6
+        assert metrics.get("itinerary.day_retries") == retries + 1
+        assert metrics.get("itinerary.day_fallbacks") == fallbacks
+
+    async def test_regenerated_day_replaces_places_used_on_other_days(self, llm_stub, monkeypatch):
+        """LLM 이 다른 날짜의 장소를 다시 넣으면 사용하지 않은 장소로 교체 테스트."""
+        import json
+
+        from src.agents.phase1.itinerary_planner import regenerate_day
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "llm_cache_enabled", False)
+        castle = {
+            "time": "10:00", "activity": "오사카성", "type": "sightseeing",
+            "location": "오사카성", "duration": "2시간", "description": "",
+        }
+        llm_stub.state.responses["itinerary_day"] = [
+            json.dumps({"theme": "명소 탐방", "activities": [castle]}, ensure_ascii=False)
+        ]
+        state = {
+            "session_id": "regenerate-dedupe",
+            "destination": "오사카",
+            "travel_style": ["관광"],
+            "itinerary": {
+                "day1": {"date": "2030-01-08", "theme": "도착", "activities": [castle]},
+                "day2": {"date": "2030-01-09", "theme": "탐방", "activities": []},
+                "day3": {"date": "2030-01-10", "theme": "출발", "activities": []},
+            },
+        }
+
+        day, source = await regenerate_day(state, 2)
+
+        assert source == "llm"
+        locations = [a["location"] for a in day["activities"]]
+        assert len(locations) == 1
+        assert locations[0] != "오사카성"
+
+
+class TestStreamingItinerary:
+    """Streaming LLM Itinerary 테스트."""
+
+    async def test_activities_stream_before_day(self, llm_stub):
+        """활동 이벤트가 하루 일정보다 먼저 도착하는지 테스트."""
+        from src.agents.phase1.itinerary_planner import stream_itinerary_with_llm
+
+        events = [e async for e in stream_itinerary_with_llm("오사카", 1, ["맛집"])]
+        kinds = [(e["event"], e.get("fallback")) for e in events]
+
+        assert kinds[:3] == [("activity", None), ("activity", None), ("day", False)]
+        assert kinds[3] == ("day", True)  # 스텁 응답에 없는 day2 는 규칙 기반
+        assert events[-1]["event"] == "done"
+        assert events[-1]["llm_days"] == 1
+        assert list(events[-1]["itinerary"]) == ["day1", "day2"]
+
+    async def test_truncated_stream_keeps_completed_days(self, llm_stub):
+        """잘린 응답에서도 완성된 날짜는 유지하는지 테스트."""
+        import json
+
+        from src.agents.phase1.itinerary_planner import stream_itinerary_with_llm
+        from src.tools.llm_stub_server import DEFAULT_RESPONSES
+
+        day = DEFAULT_RESPONSES["itinerary_day"]
+        full = json.dumps({"day1": day, "day2": day}, ensure_ascii=False)
+        llm_stub.state.responses["itinerary_planner"] = full[: full.index('"day2"') + 30]
+
+        events = [e async for e in stream_itinerary_with_llm("오사카", 1, ["관광"])]
+        done = events[-1]
+
+        assert done["llm_days"] == 1
+        assert done["itinerary"]["day1"]["activities"] == day["activities"]
+        assert [e["fallback"] for e in events if e["event"] == "day"] == [False, True]
+
+    async def test_streamed_itinerary_is_repaired(self, llm_stub):
+        """스트리밍 일정도 휴무일 장소를 교체한 뒤 완료되는지 테스트."""
+        import json
+
+        from src.agents.phase1.itinerary_planner import stream_itinerary_with_llm
+
+        closed = {
+            "time": "10:00", "activity": "텐노지 동물원", "type": "sightseeing",
+            "location": "텐노지 동물원", "duration": "2시간", "description": "",
+        }
+        day = {"date": "2030-01-07", "theme": "동물원", "activities": [closed]}  # 월요일 휴무
+        llm_stub.state.responses["itinerary_planner"] = json.dumps({"day1": day}, ensure_ascii=False)
+
+        events = [e async for e in stream_itinerary_with_llm("오사카", 1, ["관광"], "2030-01-07")]
+        done = events[-1]
+
+        assert done["llm_days"] == 1
+        assert done["itinerary"]["day1"]["activities"][0]["location"] != "텐노지 동물원"
+
+
+class TestLLMUsage:
+    """LLM 사용량 집계 / 비용 한도 테스트."""
+
+    def test_tracker_aggregates_and_flushes_periodically(self, local_store):
+        """사용량이 범위별로 집계되고 주기적으로만 저장되는지 테스트."""
+        from src.tools.llm_usage import USAGE_NAMESPACE, UsageTracker, estimate_cost
+
+        tracker = UsageTracker(local_store, window_seconds=60, flush_interval=3600)
+        cost = tracker.record("info_collector", "gpt-4o-mini", 1000, 500, 120, session_id="s1")
+        tracker.record("itinerary_planner", "gpt-4o-mini", 1000, 500, 80, session_id="s1")
+
+        assert cost == pytest.approx(estimate_cost("gpt-4o-mini", 1000, 500))
+        assert tracker.totals("global")["calls"] == 2
+        assert tracker.totals("agent:info_collector")["prompt_tokens"] == 1000
+        assert tracker.window_cost("session:s1") == pytest.approx(cost * 2)
+
+        # 기록 주기 전에는 저장소에 쓰지 않음
+        assert local_store.get(USAGE_NAMESPACE, "global") is None
+        assert tracker.flush() == 4
+        assert local_store.get(USAGE_NAMESPACE, "session:s1")["completion_tokens"] == 1000
+
+        # 새 집계기는 저장된 누적값에서 이어서 집계
+        restored = UsageTracker(local_store, window_seconds=60, flush_interval=3600)
+        restored.record("info_collector", "gpt-4o-mini", 10, 10, 5)
+        assert restored.totals("global")["calls"] == 3
+        assert restored.window_cost("global") < cost
+
+    def test_tracker_reads_do_not_track_sessions(self, local_store):
+        """조회만 한 세션은 메모리에 남지 않는지 테스트."""
+        from src.tools.llm_usage import UsageTracker
+
+        tracker = UsageTracker(local_store, window_seconds=60, flush_interval=3600)
+        for n in range(100):
+            assert tracker.totals(f"session:random-{n}")["calls"] == 0
+            assert tracker.window_cost(f"session:random-{n}") == 0.0
+
+        assert tracker.tracked_sessions() == 0
+        assert tracker.snapshot()["scopes"] == {}
+
+    def test_tracker_evicts_idle_and_excess_sessions(self, local_store):
+        """기록 후 유휴/초과 세션을 메모리에서 제거하고 저장소에서 읽는지 테스트."""
+        from src.tools.llm_usage import UsageTracker
+
+        tracker = UsageTracker(
+            local_store, window_seconds=60, flush_interval=3600, max_sessions=2
+        )
+        for n in range(5):
+            tracker.record("info_collector", "gpt-4o-mini", 100, 50, 10, session_id=f"s{n}")
+        assert tracker.tracked_sessions() == 5
+
+        tracker.flush()
+        assert tracker.tracked_sessions() == 2
+        assert tracker.totals("session:s0")["calls"] == 1
+
+        idle = UsageTracker(local_store, window_seconds=0, flush_interval=3600, idle_seconds=0)
+        idle.record("info_collector", "gpt-4o-mini", 100, 50, 10, session_id="s9")
+        idle.flush()
+        assert idle.tracked_sessions() == 0
+        assert idle.totals("session:s9")["prompt_tokens"] == 100
+
+    async def test_tracker_flushes_in_background(self, local_store):
+        """record 는 저장소에 쓰지 않고 백그라운드 작업이 기록하는지 테스트."""
+        import asyncio
+
+        from src.tools.llm_usage import USAGE_NAMESPACE, UsageTracker
+
+        tracker = UsageTracker(local_store, window_seconds=60, flush_interval=0.01)
+        tracker.record("info_collector", "gpt-4o-mini", 100, 50, 10)
+        await asyncio.sleep(0.02)
+        assert local_store.get(USAGE_NAMESPACE, "global") is None
+
+        flusher = asyncio.create_task(tracker.run_flusher())
+        await asyncio.sleep(0.1)
+        flusher.cancel()
+        assert local_store.get(USAGE_NAMESPACE, "global")["calls"] == 1
+
+    async def test_session_quota_falls_back_to_rules(
+        self, llm_stub, sample_travel_state, monkeypatch
+    ):
+        """세션 비용 한도 초과 시 LLM 호출 없이 규칙 기반으로 전환되는지 테스트."""
+        from src.agents.phase1.itinerary_planner import plan_itinerary_with_llm
+        from src.config import settings
+        from src.tools.llm_usage import get_usage_tracker
+
+        monkeypatch.setattr(settings, "itinerary_llm_mode", "single")
+        monkeypatch.setattr(settings, "llm_cache_enabled", False)
+        monkeypatch.setattr(settings, "llm_fallback_to_rules", False)
+        monkeypatch.setattr(settings, "llm_session_cost_limit_usd", 1e-6)
+
+        result = await plan_itinerary_with_llm(sample_travel_state)
+        assert "AI" in result["messages"][0]["content"]
+        assert llm_stub.state.request_count == 1
+
+        session_id = sample_travel_state["session_id"]
+        usage = get_usage_tracker().totals(f"session:{session_id}")
+        assert usage["calls"] == 1
+        assert usage["prompt_tokens"] > 0
+
+        # 한도 초과: 폴백이 꺼져 있어도 규칙 기반 일정 반환
+        quota_hits = metrics.get("llm.quota_exceeded")
+        result = await plan_itinerary_with_llm(sample_travel_state)
+        assert "AI" not in result["messages"][0]["content"]
+        assert result["itinerary"]
+        assert llm_stub.state.request_count == 1
+        assert metrics.get("llm.quota_exceeded") == quota_hits + 1
+
+        # 다른 세션은 영향 없음
+        other = {**sample_travel_state, "session_id": "other-session"}
+        result = await plan_itinerary_with_llm(other)
+        assert "AI" in result["messages"][0]["content"]
+
+
+class TestHistoryCompaction:
+    """대화 히스토리 압축 테스트."""
+
+    def _long_state(self, sample_travel_state, turns: int) -> dict:
+        state = dict(sample_travel_state)
+        state["messages"] = []
+        state["message_cursor"] = {}
+        state["archived_messages"] = 0
+        state["history_summary"] = ""
+        for i in range(turns):
+            state["messages"].append({"role": "user", "content": f"질문 {i}"})
+            state["messages"].append({"role": "assistant", "content": f"답변 {i}"})
+        return state
+
+    async def test_rule_digest_and_cold_storage(self, sample_travel_state, monkeypatch):
+        """LLM 없이 규칙 기반 요약으로 압축하고 원문을 보관하는지 테스트."""
+        from src.agents.phase1.history_compactor import (
+            compact_history,
+            load_archived_messages,
+        )
+        from src.config import settings
+        from src.models.state import last_message
+
+        monkeypatch.setattr(settings, "openai_api_key", "")
+        monkeypatch.setattr(settings, "openai_base_url", "")
+        monkeypatch.setattr(settings, "history_max_messages", 8)
+        monkeypatch.setattr(settings, "history_keep_messages", 4)
+
+        state = self._long_state(sample_travel_state, 3)
+        assert await compact_history(state) is False
+
+        state = self._long_state(sample_travel_state, 6)
+        assert await compact_history(state) is True
+        assert len(state["messages"]) == 4
+        assert state["archived_messages"] == 8
+        assert "오사카" in state["history_summary"]
+        assert "질문 3" in state["history_summary"]
+        assert last_message(state, "user")["content"] == "질문 5"
+
+        # 두 번째 압축은 이어서 보관
+        for i in range(6, 9):
+            state["messages"].append({"role": "user", "content": f"질문 {i}"})
+            state["messages"].append({"role": "assistant", "content": f"답변 {i}"})
+        assert await compact_history(state) is True
+        archived = load_archived_messages(state["session_id"])
+        assert len(archived) == state["archived_messages"] == 14
+        assert [m["content"] for m in archived[:2]] == ["질문 0", "답변 0"]
+        assert archived[-1]["content"] == "답변 6"
+        assert state["messages"][0]["content"] == "질문 7"
+
+    def test_archive_is_not_evicted_by_store_limit(self, monkeypatch):
+        """저장소 최대 항목 수를 넘게 보관해도 원문이 제거되지 않는지 테스트."""
+        from src.agents.phase1.history_compactor import (
+            archive_messages,
+            load_archived_messages,
+        )
+        from src.config import settings
+        from src.utils.store import get_local_store
+
+        monkeypatch.setattr(settings, "local_store_max_entries", 5)
+        get_local_store().close()
+        get_local_store.cache_clear()
+        store = get_local_store()
+
+        for n in range(12):
+            archive_messages("s1", n, [{"role": "user", "content": f"질문 {n}"}])
+            store.set("llm", f"k{n}", n)
+
+        archived = load_archived_messages("s1")
+        assert [m["content"] for m in archived] == [f"질문 {n}" for n in range(12)]
+        assert store.count("llm") == 5
+
+    async def test_llm_summary_via_stub(self, llm_stub, sample_travel_state, monkeypatch):
+        """LLM 을 사용할 수 있으면 LLM 요약을 사용하는지 테스트."""
+        from src.agents.phase1.history_compactor import compact_history
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "history_max_messages", 8)
+        monkeypatch.setattr(settings, "history_keep_messages", 4)
+
+        state = self._long_state(sample_travel_state, 6)
+        assert await compact_history(state) is True
+        assert state["history_summary"].startswith("오사카 3박 4일")
+        assert llm_stub.state.request_count == 1
+
+    def test_conversation_context_is_bounded(self, sample_travel_state, monkeypatch):
+        """프롬프트 대화 맥락의 크기가 히스토리 길이와 무관한지 테스트."""
+        from src.agents.phase1.history_compactor import build_conversation_context
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "history_prompt_messages", 4)
+
+        short = self._long_state(sample_travel_state, 5)
+        long = self._long_state(sample_travel_state, 500)
+        long["messages"].append({"role": "user", "content": "마지막 질문"})
+        long["messages"][-2]["content"] = "긴 답변 " * 1000
+
+        context = build_conversation_context(long)
+        assert "마지막 질문" not in context
+        assert context.count("\n") == 3
+        assert len(context) < len(build_conversation_context(short)) + 300
@@ -1,7 +1,5 @@
 """Tests for API endpoints."""
 
-import pytest
-
 
 class TestHealthCheck:
     """Health Check API 테스트."""
@@ -16,9 +14,111 @@ def test_health_check(self, client):
         assert "version" in data
 
 
+class TestMetricsAPI:
+    """Metrics API 테스트."""
+
+    def test_metrics(self, client):
+        """지표 엔드포인트 테스트."""
+        response = client.get("/api/metrics")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert "counters" in data
+        assert "observations" in data
+
+    def test_usage(self, client):
+        """LLM 사용량 엔드포인트 테스트."""
+        from src.tools.llm_usage import get_usage_tracker
+
+        get_usage_tracker().record("info_collector", "gpt-4o", 100, 50, 10, session_id="usage-s1")
+
+        data = client.get("/api/usage").json()
+        assert data["scopes"]["global"]["calls"] == 1
+        assert data["scopes"]["agent:info_collector"]["prompt_tokens"] == 100
+        assert "session:usage-s1" not in data["scopes"]
+
+        data = client.get("/api/usage", params={"session_id": "usage-s1"}).json()
+        assert data["completion_tokens"] == 50
+        assert data["window_cost_usd"] > 0
+
+
 class TestChatAPI:
     """Chat API 테스트."""
 
+    @staticmethod
+    def parse_sse(text: str) -> list[tuple[str, dict]]:
+        import json
+
+        events = []
+        for block in text.strip().split("\n\n"):
+            lines = dict(line.split(": ", 1) for line in block.splitlines())
+            events.append((lines["event"], json.loads(lines["data"])))
+        return events
+
+    def test_chat_stream_message(self, client):
+        """스트리밍 채팅 기본 이벤트 테스트."""
+        response = client.post("/api/chat/stream", json={"message": "오사카 가고 싶어요"})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+        events = self.parse_sse(response.text)
+        assert [name for name, _ in events] == ["message", "done"]
+        assert events[0][1]["state"]["destination"] == "오사카"
+
+    def test_chat_stream_itinerary(self, client, llm_stub):
+        """계획 완료 시 LLM 일정 스트리밍 테스트."""
+        response = client.post(
+            "/api/chat/stream",
+            json={"message": "오사카 2박 100만원 2명 맛집 여행"},
+        )
+        events = self.parse_sse(response.text)
+        names = [name for name, _ in events]
+
+        assert names[0] == "message" and events[0][1]["is_complete"]
+        assert names.index("activity") < names.index("day") < names.index("itinerary")
+        assert names[-1] == "done"
+
+        itinerary = dict(events)["itinerary"]
+        assert list(itinerary) == ["day1", "day2", "day3"]
+
+        session_id = events[0][1]["session_id"]
+        plan = client.get(f"/api/plan/{session_id}/itinerary").json()
+        assert plan["itinerary"]["day1"]["theme"] == "도착 & 시내 탐방"
+
+    def test_chat_llm_unavailable(self, client, monkeypatch):
+        """LLM 사용 불가 시 503 응답 테스트."""
+        from src.api import chat
+        from src.tools.llm_client import LLMUnavailableError
+
+        class UnavailableGraph:
+            def invoke(self, state):
+                raise LLMUnavailableError("llm 요청 거절: queue_full")
+
+        monkeypatch.setattr(chat, "get_phase1_graph", lambda: UnavailableGraph())
+        response = client.post("/api/chat", json={"message": "안녕하세요"})
+
+        assert response.status_code == 503
+        assert response.json()["error"] == "LLM_UNAVAILABLE"
+        assert response.headers["Retry-After"] == "1"
+
+    async def test_chat_turn_runs_graph_off_event_loop(self, monkeypatch):
+        """워크플로우는 이벤트 루프 스레드가 아닌 워커 스레드에서 실행 테스트."""
+        import threading
+
+        from src.api import chat
+
+        threads = []
+
+        class RecordingGraph:
+            def invoke(self, state):
+                threads.append(threading.get_ident())
+                return state
+
+        monkeypatch.setattr(chat, "get_phase1_graph", lambda: RecordingGraph())
+        await chat.run_chat_turn(chat.ChatRequest(message="안녕하세요"))
+
+        assert threads and threads[0] != threading.get_ident()
+
     def test_chat_new_session(self, client):
         """새 세션으로 채팅 테스트."""
         response = client.post(
@@ -41,7 +141,6 @@ def test_chat_with_destination(self, client):
             json={"message": "오사카"},
         )
         assert response1.status_code == 200
-        session_id = response1.json()["session_id"]
 
         # 상태 확인
         state = response1.json()["state"]
@@ -86,6 +185,34 @@ def test_chat_continues_session(self, client):
         assert state["destination"] == "오사카"
         assert state["duration"] == 3
 
+        # 히스토리는 턴마다 누적
+        history = client.get(f"/api/chat/{session_id}/history").json()["messages"]
+        assert [m["role"] for m in history] == ["user", "assistant", "user", "assistant"]
+        assert history[-1]["content"] == response2.json()["reply"]
+
+    def test_chat_history_compaction(self, client, monkeypatch):
+        """긴 대화가 압축되어도 전체 히스토리를 조회할 수 있는지 테스트."""
+        from src.config import settings
+
+        monkeypatch.setattr(settings, "history_max_messages", 6)
+        monkeypatch.setattr(settings, "history_keep_messages", 2)
+
+        session_id = None
+        for message in ["오사카", "3박4일", "음", "글쎄요"]:
+            payload = {"message": message, "session_id": session_id}
+            session_id = client.post("/api/chat", json=payload).json()["session_id"]
+
+        data = client.get(f"/api/chat/{session_id}/history").json()
+        assert len(data["messages"]) <= 6
+        assert data["archived_messages"] > 0
+        assert "오사카" in data["summary"]
+
+        full = client.get(
+            f"/api/chat/{session_id}/history", params={"include_archived": True}
+        ).json()["messages"]
+        assert len(full) == 8
+        assert full[0]["content"] == "오사카"
+
     def test_chat_progress(self, client):
         """진행 상태 테스트."""
         response = client.post(
@@ -126,12 +253,160 @@ def test_get_hotels_not_found(self, client):
         response = client.get("/api/plan/nonexistent-session/hotels")
         assert response.status_code == 404
 
+    def test_get_hotel_calendar(self, client):
+        """최저가 체크인 날짜 조회 테스트."""
+        response = client.post("/api/chat", json={"message": "도쿄 3박4일"})
+        session_id = response.json()["session_id"]
+
+        response = client.get(
+            f"/api/plan/{session_id}/hotels/calendar",
+            params={"start": "2026-05-01", "window": 14, "top": 3},
+        )
+        assert response.status_code == 200
+
+        calendar = response.json()["cheapest_dates"]
+        assert set(calendar) == {"budget", "standard", "premium"}
+        totals = [d["total_price"] for d in calendar["standard"]]
+        assert len(totals) == 3
+        assert totals == sorted(totals)
+
+    def test_get_hotel_calendar_not_found(self, client):
+        """존재하지 않는 세션 캘린더 조회 테스트."""
+        response = client.get("/api/plan/nonexistent-session/hotels/calendar")
+        assert response.status_code == 404
+
     def test_get_itinerary_not_found(self, client):
         """존재하지 않는 일정 조회 테스트."""
         response = client.get("/api/plan/nonexistent-session/itinerary")
         assert response.status_code == 404
 
 
+    @staticmethod
+    def create_plan(client) -> tuple[str, dict]:
+        response = client.post(
+            "/api/chat",
+            json={"message": "오사카 3박4일 100만원 2명이서 관광이랑 맛집 여행 가고 싶어"},
+        )
+        session_id = response.json()["session_id"]
+        itinerary = client.get(f"/api/plan/{session_id}/itinerary").json()["itinerary"]
+        return session_id, itinerary
+
+    def test_regenerate_day(self, client):
+        """하루 일정만 다시 생성하고 다른 날짜는 유지하는지 테스트."""
+        session_id, before = self.create_plan(client)
+        spots = [a["location"] for a in before["day2"]["activities"] if a["type"] == "sightseeing" and a["location"]]
+
+        response = client.post(
+            f"/api/plan/{session_id}/itinerary/2/regenerate",
+            json={"exclude": spots[:1], "theme": "여유로운 하루"},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["source"] == "rules"
+        assert data["plan"]["theme"] == "여유로운 하루"
+        assert data["plan"]["date"] == before["day2"]["date"]
+
+        new_locations = {a["location"] for a in data["plan"]["activities"] if a["type"] == "sightseeing"}
+        assert spots[0] not in new_locations
+
+        after = client.get(f"/api/plan/{session_id}/itinerary").json()["itinerary"]
+        assert after["day2"] == data["plan"]
+        assert {k: v for k, v in after.items() if k != "day2"} == {
+            k: v for k, v in before.items() if k != "day2"
+        }
+        other_locations = {
+            a["location"] for key in ("day1", "day3") for a in after[key]["activities"] if a["type"] == "sightseeing"
+        }
+        assert not (new_locations - {None}) & other_locations
+
+    def test_regenerate_day_with_llm(self, client, llm_stub):
+        """LLM 사용 가능 시 해당 날짜 하나만 LLM 으로 생성하는지 테스트."""
+        from src.tools.llm_usage import get_usage_tracker
+
+        session_id, before = self.create_plan(client)
+        calls = get_usage_tracker().totals("global")["calls"]
+
+        data = client.post(f"/api/plan/{session_id}/itinerary/3/regenerate", json={}).json()
+        assert data["source"] == "llm"
+        assert data["plan"]["theme"] == before["day3"]["theme"]
+        assert get_usage_tracker().totals("global")["calls"] == calls + 1
+        assert get_usage_tracker().totals(f"session:{session_id}")["calls"] >= 1
+
+    def test_regenerate_day_excludes_exact_names(self, client, llm_stub):
+        """제외 장소는 이름이 정확히 같을 때만 제외하는지 테스트."""
+        session_id, _ = self.create_plan(client)
+        url = f"/api/plan/{session_id}/itinerary/2/regenerate"
+
+        # "시" 는 LLM 일정의 "시내" 와 부분만 일치하므로 LLM 일정 사용
+        assert client.post(url, json={"exclude": ["시"]}).json()["source"] == "llm"
+        data = client.post(url, json={"exclude": ["시내"]}).json()
+        assert data["source"] == "rules"
+        assert "시내" not in {a["location"] for a in data["plan"]["activities"]}
+
+    def test_regenerate_day_rejects_empty_exclude(self, client):
+        """빈 제외 장소 이름은 거절하는지 테스트."""
+        session_id, _ = self.create_plan(client)
+        url = f"/api/plan/{session_id}/itinerary/2/regenerate"
+
+        assert client.post(url, json={"exclude": [""]}).status_code == 422
+        assert client.post(url, json={"exclude": ["오사카성", "  "]}).status_code == 422
+
+    def test_regenerate_day_not_found(self, client):
+        """존재하지 않는 세션/날짜 재생성 테스트."""
+        response = client.post("/api/plan/nonexistent-session/itinerary/1/regenerate", json={})
+        assert response.status_code == 404
+
+        session_id, _ = self.create_plan(client)
+        response = client.post(f"/api/plan/{session_id}/itinerary/9/regenerate", json={})
+        assert response.status_code == 404
+
+
+class TestDestinationsAPI:
+    """Destinations API 테스트."""
+
+    def test_affordable_destinations(self, client):
+        """예산 내 목적지 조회 테스트."""
+        response = client.get(
+            "/api/destinations/affordable",
+            params={"budget": 1000000, "duration": 3, "people": 2},
+        )
+        assert response.status_code == 200
+
+        data = response.json()
+        destinations = [d["destination"] for d in data["destinations"]]
+        assert "제주" in destinations
+        assert "파리" not in destinations
+
+        slacks = [d["slack"] for d in data["destinations"]]
+        assert slacks == sorted(slacks, reverse=True)
+        assert all(slack >= 0 for slack in slacks)
+
+    def test_affordable_destinations_by_check_in(self, client):
+        """체크인 날짜에 따라 숙박비가 달라지는지 테스트."""
+        def total(check_in):
+            response = client.get(
+                "/api/destinations/affordable",
+                params={"budget": 3000000, "duration": 1, "people": 2, "check_in": check_in},
+            )
+            assert response.status_code == 200
+            return {d["destination"]: d["estimated_total"] for d in response.json()["destinations"]}
+
+        assert total("2026-03-13")["도쿄"] > total("2026-03-09")["도쿄"]
+
+        response = client.get(
+            "/api/destinations/affordable", params={"budget": 1000000, "check_in": "2026-02-30"}
+        )
+        assert response.status_code == 400
+
+    def test_affordable_destinations_invalid_params(self, client):
+        """잘못된 파라미터 테스트."""
+        response = client.get(
+            "/api/destinations/affordable",
+            params={"budget": 1000000, "duration": 30, "people": 2},
+        )
+        assert response.status_code == 422
+
+
 class TestSessionsAPI:
     """Sessions API 테스트."""
 
@@ -0,0 +1,329 @@
+"""Tests for utility modules."""
+
+import json
+import random
+import time
+
+import numpy as np
+
+from src.utils.cache import TTLCache
+from src.utils.fuzzy_match import TrigramIndex, normalize_name
+from src.utils.geo import KDTree, get_geo_index, haversine_km, to_unit_vector
+from src.utils.json_stream import IncrementalJSONParser
+from src.utils.keyword_automaton import KeywordAutomaton
+from src.utils.price_calendar import rate_multipliers, window_totals
+from src.utils.store import LocalStore
+from src.utils.validation import matches_typed_dict
+
+
+class TestGeoIndex:
+    """Geo Index 테스트."""
+
+    def test_haversine_km(self):
+        """대원 거리 계산 테스트."""
+        # 서울 - 부산 약 325km
+        distance = haversine_km(37.5665, 126.9780, 35.1796, 129.0756)
+        assert 300 < distance < 350
+
+    def test_kdtree_matches_brute_force(self):
+        """KD-tree 결과가 전수 탐색과 일치하는지 테스트."""
+        rng = random.Random(42)
+        points = [
+            (to_unit_vector(rng.uniform(-80, 80), rng.uniform(-180, 180)), i)
+            for i in range(300)
+        ]
+        tree = KDTree(points)
+
+        for _ in range(20):
+            query = to_unit_vector(rng.uniform(-80, 80), rng.uniform(-180, 180))
+            expected = sorted(
+                points, key=lambda item: sum((a - b) ** 2 for a, b in zip(item[0], query, strict=True))
+            )[:5]
+            result = tree.query(query, k=5)
+            assert [payload for _, payload in result] == [p for _, p in expected]
+
+    def test_nearest_airports_excludes_non_commercial(self):
+        """군 공항 제외 테스트."""
+        index = get_geo_index()
+        # 가데나 공군기지 좌표
+        airports = index.nearest_airports(26.3556, 127.7675, k=3)
+        codes = [airport["iata"] for _, airport in airports]
+        assert "DNA" not in codes
+        assert codes[0] == "OKA"
+
+    def test_nearby_cities_served_filter(self):
+        """지원 도시 필터 테스트."""
+        index = get_geo_index()
+        nearby = index.nearby_cities("고베", k=2, served=["오사카", "도쿄"])
+        assert [city["name"] for _, city in nearby] == ["오사카", "도쿄"]
+
+    def test_nearby_cities_queries_only_needed_neighbours(self, monkeypatch):
+        """필요한 만큼만 KD-tree 를 탐색하는지 테스트."""
+        index = get_geo_index()
+        query = index._city_tree.query
+        fetched = []
+
+        def counting_query(point, k=1, max_distance=None):
+            fetched.append(k)
+            return query(point, k, max_distance)
+
+        monkeypatch.setattr(index._city_tree, "query", counting_query)
+        nearby = index.nearby_cities("고베", k=1, served=["오사카"])
+        assert [city["name"] for _, city in nearby] == ["오사카"]
+        assert max(fetched) < index._city_tree.size
+        assert index.nearby_cities("부산", k=1, max_km=150, served=["제주"]) == []
+
+
+class TestTTLCache:
+    """TTL Cache 테스트."""
+
+    def test_lru_eviction(self):
+        """용량 초과 시 LRU 제거 테스트."""
+        evicted = []
+        cache = TTLCache(maxsize=2, on_evict=lambda k, v: evicted.append(k))
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert evicted == ["b"]
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_ttl_expiry(self):
+        """만료 테스트."""
+        cache = TTLCache(maxsize=10, ttl=0.01)
+        cache.set("a", 1)
+        time.sleep(0.02)
+        assert cache.get("a") is None
+        assert cache.stats()["misses"] == 1
+
+
+class TestPriceCalendar:
+    """Price Calendar 테스트."""
+
+    def test_weekend_multiplier(self):
+        """주말 요금 배수 테스트."""
+        # 2026-06-08 (월) 부터 7박, 기본 국가 프로필
+        multipliers = rate_multipliers("알수없는도시", "2026-06-08", 7)
+        assert list(multipliers) == [1.0, 1.0, 1.0, 1.0, 1.2, 1.2, 1.0]
+
+    def test_window_totals_matches_direct_sum(self):
+        """누적합 계산이 직접 합산과 일치하는지 테스트."""
+        base_prices = np.array([50000, 80000])
+        totals = window_totals(base_prices, "도쿄", "2026-04-25", 10, 3)
+        assert totals.shape == (2, 10)
+
+        for day in range(10):
+            start = np.datetime64("2026-04-25") + day
+            expected = base_prices * rate_multipliers("도쿄", start, 3).sum()
+            assert np.allclose(totals[:, day], expected)
+
+
+class TestFuzzyMatch:
+    """Fuzzy Match 테스트."""
+
+    def test_normalize_name(self):
+        """한글 자모/라틴 표기 정규화 테스트."""
+        assert normalize_name("오사까") == normalize_name("오사카")
+        assert normalize_name("New-York") == normalize_name("new york")
+        assert normalize_name("Osakaa") == normalize_name("osaka")
+
+    def test_trigram_search(self):
+        """trigram 유사도 검색 테스트."""
+        index = TrigramIndex()
+        for name, value in [("bangkok", "방콕"), ("tokyo", "도쿄"), ("kyoto", "교토")]:
+            index.add(name, value)
+
+        matches = index.search("bangkock", min_score=0.5)
+        assert matches[0].value == "방콕"
+        assert matches[0].score < 1.0
+        assert index.search("kyoto")[0].score == 1.0
+        assert index.search("zzzz", min_score=0.5) == []
+
+
+class TestKeywordAutomaton:
+    """Keyword Automaton 테스트."""
+
+    def test_overlapping_matches(self):
+        """겹치는 키워드 모두 찾기 테스트."""
+        automaton = KeywordAutomaton()
+        for word in ["he", "she", "his", "hers"]:
+            automaton.add(word, "word", word)
+        automaton.build()
+
+        found = {(m.start, m.keyword) for m in automaton.iter_matches("ushers")}
+        assert found == {(1, "she"), (2, "he"), (2, "hers")}
+
+    def test_leftmost_longest(self):
+        """가장 왼쪽-가장 긴 매칭 선택 테스트."""
+        automaton = KeywordAutomaton()
+        automaton.add("백만", "budget", 1000000)
+        automaton.add("이백만", "budget", 2000000)
+        automaton.add("new", "word", "new")
+        automaton.add("new york", "city", "뉴욕")
+
+        matches = automaton.find_all("이백만원으로 new york")
+        assert [(m.start, m.end, m.value) for m in matches] == [
+            (0, 3, 2000000),
+            (7, 15, "뉴욕"),
+        ]
+
+    def test_many_keywords_match_brute_force(self):
+        """대량 키워드에서 전수 탐색과 결과 일치 테스트."""
+        rng = random.Random(7)
+        alphabet = "가나다라마바사"
+        keywords = {
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(2, 5)))
+            for _ in range(3000)
+        }
+        automaton = KeywordAutomaton()
+        for keyword in keywords:
+            automaton.add(keyword, "city", keyword)
+
+        text = "".join(rng.choice(alphabet) for _ in range(200))
+        expected = {
+            (i, keyword)
+            for keyword in keywords
+            for i in range(len(text))
+            if text.startswith(keyword, i)
+        }
+        found = {(m.start, m.keyword) for m in automaton.iter_matches(text)}
+        assert found == expected
+
+
+class TestLocalStore:
+    """Local Store 테스트."""
+
+    def test_set_get_and_expiry(self):
+        """저장/조회/만료 테스트."""
+        store = LocalStore()
+        store.set("ns", "a", {"value": [1, 2]})
+        store.set("ns", "b", "expired", ttl=-1)
+
+        assert store.get("ns", "a") == {"value": [1, 2]}
+        assert store.get("other", "a") is None
+        assert store.get("ns", "b") is None
+        assert store.delete("ns", "a")
+        assert store.get("ns", "a") is None
+
+    def test_size_cap_evicts_least_recently_used(self):
+        """최대 항목 수 초과 시 LRU 제거 테스트."""
+        store = LocalStore(max_entries=2)
+        store.set("ns", "a", 1)
+        time.sleep(0.01)
+        store.set("ns", "b", 2)
+        time.sleep(0.01)
+        store.get("ns", "a")
+        time.sleep(0.01)
+        store.set("ns", "c", 3)
+
+        assert store.count("ns") == 2
+        assert store.get("ns", "b") is None
+        assert store.get("ns", "a") == 1
+
+    def test_reads_do_not_write_until_next_set(self):
+        """조회 시각은 조회마다 쓰지 않고 다음 저장 때 기록 테스트."""
+        store = LocalStore()
+        store.set("ns", "a", 1)
+        changes = store._conn.total_changes
+
+        for _ in range(10):
+            store.get("ns", "a")
+        assert store._conn.total_changes == changes
+
+        store.set("ns", "b", 2)
+        assert store._conn.total_changes == changes + 2  # 조회 시각 1건 + 새 항목
+
+    def test_scan_prefix(self):
+        """접두사 조회 테스트."""
+        store = LocalStore()
+        store.set("ns", "p1:x", 1)
+        store.set("ns", "p1:y", 2)
+        store.set("ns", "p10:z", 3)
+        assert sorted(v for _, v in store.scan("ns", "p1:")) == [1, 2]
+
+
+class TestIncrementalJSONParser:
+    """Incremental JSON Parser 테스트."""
+
+    DOC = {
+        "day1": {
+            "theme": "도착 {괄호} \"따옴표\"",
+            "activities": [
+                {"time": "10:00", "activity": "A, B]", "type": "food"},
+                {"time": "12:00", "activity": "C", "type": "rest"},
+            ],
+        },
+        "day2": {"theme": "출발", "activities": []},
+    }
+
+    def test_events_with_random_chunks(self):
+        """임의 크기 조각 입력 시 완성 순서대로 이벤트 반환 테스트."""
+        text = "```json\n" + json.dumps(self.DOC, ensure_ascii=False, indent=2) + "\n```"
+        rng = random.Random(3)
+
+        for _ in range(20):
+            parser = IncrementalJSONParser()
+            events = []
+            pos = 0
+            while pos < len(text):
+                size = rng.randint(1, 8)
+                events.extend(parser.feed(text[pos : pos + size]))
+                pos += size
+
+            assert [e.path for e in events] == [
+                ("day1", "activities", 0),
+                ("day1", "activities", 1),
+                ("day1", "activities"),
+                ("day1",),
+                ("day2", "activities"),
+                ("day2",),
+                (),
+            ]
+            assert events[0].value["activity"] == "A, B]"
+            assert events[-1].value == self.DOC
+            assert parser.done
+
+    def test_decodes_each_character_once(self, monkeypatch):
+        """바깥 컨테이너를 다시 디코딩하지 않아 입력 길이에 선형 테스트."""
+        from src.utils import json_stream
+
+        decoded = []
+        loads = json.loads
+        monkeypatch.setattr(json_stream.json, "loads", lambda s: decoded.append(len(s)) or loads(s))
+
+        text = json.dumps({f"day{i}": self.DOC["day1"] for i in range(1, 30)}, ensure_ascii=False)
+        parser = IncrementalJSONParser()
+        for pos in range(0, len(text), 5):
+            parser.feed(text[pos : pos + 5])
+
+        assert parser.done
+        assert sum(decoded) < len(text)
+
+    def test_truncated_input_keeps_completed_values(self):
+        """잘린 입력에서도 완성된 값은 반환 테스트."""
+        text = json.dumps(self.DOC, ensure_ascii=False)
+        cut = text.index('"day2"')
+
+        events = IncrementalJSONParser().feed(text[:cut])
+        assert [e.path for e in events][-1] == ("day1",)
+        assert not any(e.path == () for e in events)
+
+
+class TestTypedDictValidation:
+    """TypedDict 검증 테스트."""
+
+    def test_matches_typed_dict(self):
+        """Activity/DayPlan 스키마 검증 테스트."""
+        from src.models.state import Activity, DayPlan
+
+        activity = {"time": "10:00", "activity": "오사카성", "type": "sightseeing"}
+        assert matches_typed_dict(activity, Activity)
+        assert matches_typed_dict({**activity, "location": None}, Activity)
+        assert not matches_typed_dict({**activity, "type": "party"}, Activity)
+        assert not matches_typed_dict({"time": "10:00", "type": "food"}, Activity)
+
+        day = {"date": "2026-01-01", "theme": "도착", "activities": [activity]}
+        assert matches_typed_dict(day, DayPlan)
+        assert not matches_typed_dict({**day, "activities": [{}]}, DayPlan)
@@ -49,6 +49,8 @@ export type TravelStep =
 export type OptionType = 'budget' | 'standard' | 'premium';
 
 export interface FlightTime {
+  departure_airport?: string;
+  arrival_airport?: string;
   departure_time: string;
   arrival_time: string;
   flight_time: string;
@@ -71,6 +73,8 @@ export interface HotelOption {
   rating: number;
   amenities: string[];
   distance_from_center: string;
+  check_in?: string;
+  nightly_prices?: number[];
 }
 
 export type ActivityType =
@@ -47,6 +47,8 @@ export type MessageRole = 'user' | 'assistant' | 'system';
 // ===========================
 
 export interface FlightTime {
+  departure_airport?: string; // 출발 공항 IATA 코드
+  arrival_airport?: string; // 도착 공항 IATA 코드
   departure_time: string; // "HH:MM"
   arrival_time: string; // "HH:MM"
   flight_time: string; // "Xh XXm"
@@ -73,6 +75,8 @@ export interface HotelOption {
   rating: number; // 0.0 ~ 5.0
   amenities: string[];
   distance_from_center: string; // "X.Xkm"
+  check_in?: string; // 체크인 날짜 "YYYY-MM-DD"
+  nightly_prices?: number[]; // 숙박일별 요금 (원)
 }
 
 // ===========================